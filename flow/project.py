@@ -12,6 +12,7 @@ import logging
 import argparse
 import time
 import datetime
+import csv
 import json
 import inspect
 import functools
@@ -19,10 +20,18 @@ import contextlib
 import random
 import subprocess
 import traceback
+import queue
+import asyncio
+import codecs
+import signal
+import io
+import math
 from deprecation import deprecated
 from collections import defaultdict
+from collections import deque
 from collections import OrderedDict
 from collections import Counter
+from fractions import Fraction
 from itertools import islice
 from itertools import count
 from itertools import groupby
@@ -41,6 +50,7 @@ import signac
 from signac.contrib.hashing import calc_id
 from signac.contrib.filterparse import parse_filter_arg
 from signac.contrib.project import JobsCursor
+from signac.contrib.project import JobSearchIndex
 
 from enum import IntEnum
 
@@ -48,6 +58,7 @@ from .environment import get_environment
 from .scheduling.base import ClusterJob
 from .scheduling.base import JobStatus
 from .scheduling.status import update_status
+from .scheduling.status import _OperationStatusStore
 from .errors import SubmitError
 from .errors import ConfigKeyError
 from .errors import NoSchedulerError
@@ -62,6 +73,12 @@ from .util import template_filters as tf
 from .util.misc import add_cwd_to_environment_pythonpath
 from .util.misc import switch_to_directory
 from .util.misc import TrackGetItemDict
+from .util.cache import _PersistentConditionCache
+from .util.cache import _CompletionLedger
+from .util.cache import _StatusSnapshot
+from .util.cache import _condition_key
+from .util.cache import _function_key
+from .util.timing import Timings
 from .util.translate import abbreviate
 from .util.translate import shorten
 from .labels import label
@@ -126,33 +143,88 @@ class _condition(object):
     # are found to be equal by the graph detection algorithm.
     current_arbitrary_tag = 0
 
-    def __init__(self, condition, tag=None):
+    def __init__(self, condition, tag=None, cache=True):
         """Add tag to differentiate built-in conditions during graph detection."""
 
+        if not cache:
+            # The results of the condition must not be cached persistently.
+            condition._flow_cache = False
         if tag is None:
             try:
-                tag = condition.__code__.co_code
+                # Batch conditions are identified by the batch function.
+                tag = getattr(condition, '_flow_batch', condition).__code__.co_code
             except AttributeError:
                 logger.warning("Condition {} could not autogenerate tag.".format(condition))
         condition._flow_tag = tag
         self.condition = condition
 
+    @classmethod
+    def batch(cls, func, tag=None, cache=True):
+        """Evaluate the condition for many jobs at once.
+
+        The function must accept a sequence of jobs and return a sequence of
+        the same length (e.g., a list or a NumPy array) with one boolean value
+        per job. For example:
+
+        .. code-block:: python
+
+            @Project.operation
+            @Project.post.batch(lambda jobs: [job.isfile('out.txt') for job in jobs])
+            def compute(job):
+                pass
+
+        During a status, run, or submit evaluation pass, the function is called
+        once with all jobs of the pass that reach the condition, i.e., jobs for
+        which the evaluation is not short-circuited before, otherwise once for
+        each job.
+        """
+        def _flow_batch_condition(job):
+            return _evaluate_batch(func, [job])[0]
+
+        _flow_batch_condition._flow_batch = func
+        return cls(_flow_batch_condition, tag, cache)
+
     @classmethod
     def isfile(cls, filename):
         "True if the specified file exists for this job."
-        return cls(lambda job: job.isfile(filename), 'isfile_' + filename)
+        # Files within sub-directories do not change the job's fingerprint.
+        return cls.batch(lambda jobs: [_job_isfile(job, filename) for job in jobs],
+                         'isfile_' + filename, cache=not _has_path_separator(filename))
 
     @classmethod
     def true(cls, key):
         """True if the specified key is present in the job document and
         evaluates to True."""
-        return cls(lambda job: job.document.get(key, False), 'true_' + key)
+        return cls.batch(_document_query({key: {'$exists': True, '$nin': _FALSY_VALUES}}),
+                         'true_' + key)
 
     @classmethod
     def false(cls, key):
         """True if the specified key is present in the job document and
         evaluates to False."""
-        return cls(lambda job: not job.document.get(key, False), 'false_' + key)
+        return cls.batch(_document_query({'$or': [{key: {'$exists': False}},
+                                                  {key: {'$in': _FALSY_VALUES}}]}),
+                         'false_' + key)
+
+    @classmethod
+    def doc_query(cls, query):
+        """True if the job document matches the query.
+
+        The query uses the same syntax as the ``doc_filter`` argument of
+        :meth:`~signac.Project.find_jobs`, for example:
+
+        .. code-block:: python
+
+            @Project.operation
+            @Project.pre.doc_query({'temperature': {'$gt': 1.0}})
+            def simulate_hot(job):
+                pass
+
+        All jobs of an evaluation pass that reach the condition are matched
+        against the query at once, see :meth:`batch`.
+        """
+        return cls.batch(_document_query(query),
+                         'doc_query_' + json.dumps(query, sort_keys=True))
 
     @classmethod
     @deprecated(
@@ -223,12 +295,14 @@ class JobOperation(object):
     :type job:
         :py:class:`signac.Job`.
     :param cmd:
-        The command that executes this operation.
+        The command that executes this operation, or a callable without arguments
+        that returns the command, which is then evaluated on first access.
     :type cmd:
-        str
+        str or callable
     :param directives:
         A dictionary of additional parameters that provide instructions on how
         to execute this operation, e.g., specifically required resources.
+        The directives are evaluated for the job on first access.
     :type directives:
         :class:`dict`
     """
@@ -237,7 +311,45 @@ class JobOperation(object):
     def __init__(self, name, job, cmd, directives=None, np=None):
         self.name = name
         self.job = job
-        self.cmd = cmd
+        self._cmd = cmd
+        self._directives = directives
+        self._evaluated_directives = None
+
+    @property
+    def cmd(self):
+        "The command that executes this operation."
+        if callable(self._cmd):
+            with self._measure('command'):
+                self._cmd = self._cmd()
+        return self._cmd
+
+    @cmd.setter
+    def cmd(self, value):
+        self._cmd = value
+
+    @property
+    def directives(self):
+        "The directives of this operation evaluated for the job."
+        if self._evaluated_directives is None:
+            with self._measure('directives'):
+                self._evaluated_directives = self._evaluate_directives(
+                    self.job, self._directives)
+        return self._evaluated_directives
+
+    @directives.setter
+    def directives(self, value):
+        # Assigned directives are used as they are, like the evaluated directives.
+        self._evaluated_directives = value
+
+    def _measure(self, category):
+        "Measure the evaluation time, if the job's project is collecting timings."
+        timings = _get_timings(self.job)
+        if timings is None:
+            return contextlib.suppress()    # null context
+        return timings.measure(category, self.name)
+
+    @staticmethod
+    def _evaluate_directives(job, directives):
         if directives is None:
             directives = dict()  # default argument
         else:
@@ -280,9 +392,10 @@ class JobOperation(object):
         # We use a special dictionary that allows us to track all keys that have been
         # evaluated by the template engine and compare them to those explicitly set
         # by the user. See also comment above.
-        self.directives = TrackGetItemDict(
+        evaluated_directives = TrackGetItemDict(
             {key: evaluate(value) for key, value in directives.items()})
-        self.directives._keys_set_by_user = keys_set_by_user
+        evaluated_directives._keys_set_by_user = keys_set_by_user
+        return evaluated_directives
 
     def __str__(self):
         return "{}({})".format(self.name, self.job)
@@ -297,29 +410,7 @@ class JobOperation(object):
 
     def get_id(self, index=0):
         "Return a name, which identifies this job-operation."
-        project = self.job._project
-
-        # The full name is designed to be truly unique for each job-operation.
-        full_name = '{}%{}%{}%{}'.format(
-            project.root_directory(), self.job.get_id(), self.name, index)
-
-        # The job_op_id is a hash computed from the unique full name.
-        job_op_id = calc_id(full_name)
-
-        # The actual job id is then constructed from a readable part and the job_op_id,
-        # ensuring that the job-op is still somewhat identifiable, but guaranteed to
-        # be unique. The readable name is based on the project id, job id, operation name,
-        # and the index number. All names and the id itself are restricted in length
-        # to guarantee that the id does not get too long.
-        max_len = self.MAX_LEN_ID - len(job_op_id)
-        if max_len < len(job_op_id):
-            raise ValueError("Value for MAX_LEN_ID is too small ({}).".format(self.MAX_LEN_ID))
-
-        readable_name = '{}/{}/{}/{:04d}/'.format(
-            str(project)[:12], str(self.job)[:8], self.name[:12], index)[:max_len]
-
-        # By appending the unique job_op_id, we ensure that each id is truly unique.
-        return readable_name + job_op_id
+        return _get_job_operation_id(self.job, self.name, index, self.MAX_LEN_ID)
 
     def __hash__(self):
         return int(sha1(self.get_id().encode('utf-8')).hexdigest(), 16)
@@ -329,17 +420,368 @@ class JobOperation(object):
 
     def set_status(self, value):
         "Store the operation's status."
-        self.job._project.document.setdefault('_status', dict())
-        self.job._project.document._status[self.get_id()] = int(value)
+        self.job._project._get_operation_status_store().update({self.get_id(): value})
 
     def get_status(self):
         "Retrieve the operation's last known status."
         try:
-            return JobStatus(self.job._project.document['_status'][self.get_id()])
+            return self.job._project._get_operation_status_store().get(self.get_id())
         except KeyError:
             return JobStatus.unknown
 
 
+def _get_job_operation_id(job, name, index=0, max_len_id=JobOperation.MAX_LEN_ID):
+    """Return a name, which identifies the named operation for job.
+
+    The id is computed without constructing the operation's command and
+    directives, see :meth:`JobOperation.get_id`.
+    """
+    project = job._project
+
+    # The full name is designed to be truly unique for each job-operation.
+    full_name = '{}%{}%{}%{}'.format(project.root_directory(), job.get_id(), name, index)
+
+    # The job_op_id is a hash computed from the unique full name.
+    job_op_id = calc_id(full_name)
+
+    # The actual job id is then constructed from a readable part and the job_op_id,
+    # ensuring that the job-op is still somewhat identifiable, but guaranteed to
+    # be unique. The readable name is based on the project id, job id, operation name,
+    # and the index number. All names and the id itself are restricted in length
+    # to guarantee that the id does not get too long.
+    max_len = max_len_id - len(job_op_id)
+    if max_len < len(job_op_id):
+        raise ValueError("Value for MAX_LEN_ID is too small ({}).".format(max_len_id))
+
+    readable_name = '{}/{}/{}/{:04d}/'.format(
+        str(project)[:12], str(job)[:8], name[:12], index)[:max_len]
+
+    # By appending the unique job_op_id, we ensure that each id is truly unique.
+    return readable_name + job_op_id
+
+
+class _ConditionCache(object):
+    """Cache the results of condition evaluations for one evaluation pass.
+
+    Results are keyed by the identity of the condition function and the job id,
+    such that a condition shared by multiple operations, e.g., through the
+    ``pre.after()`` metacondition, is evaluated at most once per job and pass.
+
+    Results that are not yet known are optionally looked up in a persistent
+    cache, see :class:`~.util.cache._PersistentConditionCache`.
+
+    Batch conditions (see :meth:`~._condition.batch`) are evaluated at once
+    for all jobs that reach them, when the jobs are evaluated with :meth:`map`.
+    Otherwise, they are evaluated for each job individually.
+    """
+
+    def __init__(self, persistent_cache=None):
+        self._results = dict()
+        self._persistent_cache = persistent_cache
+        self._lock = threading.Lock()
+        self._memo = dict()
+        self._deferred = None
+        self._failed_batches = set()
+
+    def memoize(self, key, func):
+        "Return the value for key, which is computed as ``func()`` once per pass."
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = func()
+            return value
+
+    def lookup(self, condition, job):
+        """Return the cached result of ``condition(job)``.
+
+        :raises KeyError:
+            If the result is neither known within this pass nor cached persistently.
+        """
+        key = (id(condition), job._id)
+        try:
+            return self._results[key]
+        except KeyError:
+            if self._persistent_cache is None:
+                raise
+        result = self._results[key] = self._persistent_cache.lookup(condition, job)
+        return result
+
+    def evaluate(self, condition, job):
+        "Return the (possibly cached) result of ``condition(job)``."
+        key = (id(condition), job._id)
+        try:
+            return self._results[key]
+        except KeyError:
+            pass
+        if self._deferred is not None and hasattr(condition, '_flow_batch') \
+                and id(condition) not in self._failed_batches:
+            try:
+                return self.lookup(condition, job)
+            except KeyError:
+                with self._lock:
+                    self._deferred.setdefault(id(condition), (condition, OrderedDict()))[1][
+                        job._id] = job
+                raise _DeferredEvaluation(condition)
+        if self._persistent_cache is None:
+            result = condition(job)
+        else:
+            result = self._persistent_cache.evaluate(condition, job)
+        self._results[key] = result
+        return result
+
+    def known_false(self, condition, job):
+        """Return True if ``condition(job)`` is known to be False within this pass.
+
+        Metaconditions are known to be False if any of their components is.
+        """
+        key = (id(condition), job._id)
+        if key in self._results:
+            return not self._results[key]
+        return any(self.known_false(c, job) for c in getattr(condition, '_composed_of', ()))
+
+    def map(self, func, jobs, _map=map):
+        """Return ``[func(job) for job in jobs]``.
+
+        The evaluation of a job is deferred when it reaches a batch condition,
+        whose result is not yet known. Each batch condition is then evaluated
+        at once for all jobs that reached it and the evaluation of these jobs
+        is resumed. Results of other conditions are cached in the meantime,
+        such that func must only be free of side effects up to the point where
+        it evaluates conditions. Batch conditions that fail are evaluated for
+        each job individually, such that errors are raised for each job.
+
+        :param _map:
+            The map function used to evaluate func for the jobs, e.g., the
+            ``imap`` method of a thread pool.
+        """
+        jobs = list(jobs)
+        results = [None] * len(jobs)
+
+        def _attempt(index):
+            try:
+                return index, func(jobs[index]), False
+            except _DeferredEvaluation:
+                return index, None, True
+
+        pending = range(len(jobs))
+        while pending:
+            self._deferred = OrderedDict()
+            try:
+                attempts = list(_map(_attempt, pending))
+            finally:
+                deferred, self._deferred = self._deferred, None
+            pending = []
+            for index, result, is_deferred in attempts:
+                if is_deferred:
+                    pending.append(index)
+                else:
+                    results[index] = result
+            for condition, deferred_jobs in deferred.values():
+                try:
+                    self._evaluate_batch(condition, list(deferred_jobs.values()))
+                except Exception as error:
+                    logger.debug("Batch evaluation of condition failed: {}".format(error))
+                    self._failed_batches.add(id(condition))
+        return results
+
+    def _evaluate_batch(self, condition, jobs):
+        "Evaluate the batch condition for all jobs at once."
+        start = time.perf_counter()
+        results = _evaluate_batch(condition._flow_batch, jobs)
+        timings = _get_timings(jobs[0]) if jobs else None
+        if timings is not None:
+            duration = time.perf_counter() - start
+            if hasattr(condition, '_flow_tag'):
+                timings.record('condition', _condition_name(condition), duration)
+            elif hasattr(condition, '_flow_label_name'):
+                timings.record('label', condition._flow_label_name, duration)
+        for job, result in zip(jobs, results):
+            self._results[(id(condition), job._id)] = result
+            if self._persistent_cache is not None:
+                self._persistent_cache.store(condition, job, result)
+
+
+class _DeferredEvaluation(BaseException):
+    """Raised to defer the evaluation of a job until the batch condition was evaluated.
+
+    This exception derives from BaseException, such that it is not masked by
+    the handling of errors raised by user-defined conditions and labels.
+    """
+
+
+def _evaluate_batch(func, jobs):
+    """Evaluate the batch condition or label function for jobs.
+
+    Returns a list of booleans, where strings returned by label functions
+    are preserved.
+    """
+    if not jobs:
+        return []
+    results = [result if isinstance(result, str) else bool(result) for result in func(jobs)]
+    if len(results) != len(jobs):
+        raise ValueError(
+            "The batch condition returned {} result(s) for {} job(s).".format(
+                len(results), len(jobs)))
+    return results
+
+
+def _get_condition_cache(job):
+    "Return the condition cache of the job's project, or None if not within a pass."
+    return getattr(getattr(job, '_project', None), '_condition_cache', None)
+
+
+def _evaluate_condition(condition, job):
+    """Evaluate the condition function for job.
+
+    The result is cached if the job's project is currently within a condition
+    evaluation pass, see :meth:`~.FlowProject._condition_evaluation_pass`.
+    """
+    cache = _get_condition_cache(job)
+    if cache is None:
+        return condition(job)
+    return cache.evaluate(condition, job)
+
+
+def _get_timings(job):
+    "Return the timings collected by the job's project, or None if not collecting."
+    return getattr(getattr(job, '_project', None), '_timings', None)
+
+
+def _condition_name(condition):
+    """Return a human-readable name of the condition function.
+
+    The names of functions include their source location, such that lambda
+    expressions and functions with the same name are distinguished.
+    """
+    tag = getattr(condition, '_flow_tag', None)
+    if isinstance(tag, str):
+        return tag
+    components = getattr(condition, '_composed_of', None)
+    if components is not None:
+        return 'all({})'.format(', '.join(map(_condition_name, components)))
+    name = getattr(condition, '__qualname__', getattr(condition, '__name__', repr(condition)))
+    code = getattr(condition, '__code__', None)
+    if code is not None:
+        name = '{} ({}:{})'.format(name, code.co_filename, code.co_firstlineno)
+    return name
+
+
+def _condition_keys(conditions):
+    """Return the keys that identify the conditions across interpreter sessions.
+
+    Metaconditions are identified by their components. Returns None if any
+    of the conditions cannot be identified reliably, see :func:`_condition_key`.
+    """
+    keys = []
+    for condition in conditions:
+        components = getattr(condition, '_composed_of', None)
+        if components is None:
+            key = _condition_key(condition)
+        else:
+            key = _condition_keys(components)
+        if key is None:
+            return None
+        keys.append(key)
+    return keys
+
+
+def _has_path_separator(filename):
+    "Return True if the filename refers to a file within a sub-directory."
+    return os.sep in filename or bool(os.altsep and os.altsep in filename)
+
+
+def _job_document(job):
+    """Return the job document.
+
+    Within an evaluation pass, the job document is read only once to
+    evaluate all document conditions.
+    """
+    cache = _get_condition_cache(job)
+    if cache is None:
+        return job.document
+    return cache.memoize(('document', job._id), lambda: job.document())
+
+
+# The document values, for which the built-in true and false conditions are
+# False and True, respectively, see _condition.true() and _condition.false().
+_FALSY_VALUES = (False, None, '', ())
+
+
+def _document_query(query):
+    """Return a batch function that matches the documents of jobs against the query.
+
+    All jobs are matched at once with a search index over their documents.
+    """
+    # The query is captured as string, such that it is part of the condition key.
+    query = json.dumps(query, sort_keys=True)
+
+    def _match(jobs):
+        index = [dict(_job_document(job), _id=job._id) for job in jobs]
+        job_ids = set(JobSearchIndex(index).find_job_ids(doc_filter=json.loads(query)))
+        return [job._id in job_ids for job in jobs]
+
+    return _match
+
+
+def _list_workspace_files(job):
+    "Return the names of all files within the job's workspace directory."
+    try:
+        with os.scandir(job.workspace()) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def _job_isfile(job, filename):
+    """Determine whether the file exists within the job's workspace.
+
+    Within an evaluation pass, the workspace directory is listed only once
+    to evaluate all file conditions.
+    """
+    cache = _get_condition_cache(job)
+    if cache is None or _has_path_separator(filename):
+        return job.isfile(filename)
+    files = cache.memoize(('workspace_files', job._id), lambda: _list_workspace_files(job))
+    return filename in files
+
+
+class _FlowLabel(object):
+    """A label function of a project.
+
+    The results of label functions are cached like those of conditions within
+    an evaluation pass, such that label functions that are also used as
+    conditions are evaluated only once per job.
+
+    :param func:
+        A callable with one positional argument (the job).
+    :type func:
+        callable
+    :param name:
+        The label name.
+    :type name:
+        str
+    """
+
+    def __init__(self, func, name):
+        self._func = func
+        self.name = name
+
+    def __call__(self, job):
+        cache = _get_condition_cache(job)
+        if cache is not None:
+            # Cached results are not timed.
+            try:
+                return cache.lookup(self._func, job)
+            except KeyError:
+                pass
+        start = time.perf_counter()
+        value = _evaluate_condition(self._func, job)
+        timings = _get_timings(job)
+        if timings is not None:
+            timings.record('label', self.name, time.perf_counter() - start)
+        return value
+
+
 class FlowCondition(object):
     """A FlowCondition represents a condition as a function of a signac job.
 
@@ -356,15 +798,55 @@ class FlowCondition(object):
     def __init__(self, callback):
         self._callback = callback
 
+        # Evaluation statistics used to determine the adaptive condition order.
+        self._num_evaluations = 0
+        self._num_false = 0
+        self._total_time = 0.0
+
     def __call__(self, job):
         if self._callback is None:
             return True
+        cache = _get_condition_cache(job)
+        if cache is not None:
+            # Cached results do not contribute to the evaluation statistics.
+            try:
+                return cache.lookup(self._callback, job)
+            except KeyError:
+                pass
+        start = time.perf_counter()
         try:
-            return self._callback(job)
+            result = _evaluate_condition(self._callback, job)
         except Exception as e:
             raise UserConditionError(
                 'An exception was raised while evaluating the condition {name} '
                 'for job {job}.'.format(name=self._callback.__name__, job=job)) from e
+        duration = time.perf_counter() - start
+        timings = _get_timings(job)
+        if timings is not None:
+            timings.record('condition', _condition_name(self._callback), duration)
+        self._total_time += duration
+        self._num_evaluations += 1
+        if not result:
+            self._num_false += 1
+        return result
+
+    def _known_false(self, job):
+        "Return True if this condition is known to be False without evaluating it."
+        cache = _get_condition_cache(job)
+        return cache is not None and self._callback is not None \
+            and cache.known_false(self._callback, job)
+
+    def _cost_rank(self):
+        """Return the expected evaluation time per False outcome.
+
+        All conditions are combined with short-circuiting evaluations, which
+        terminate at the first False outcome. Conditions with a lower rank
+        should therefore be evaluated first.
+        """
+        if not self._num_evaluations:
+            return 0.0
+        p_false = (self._num_false + 1) / (self._num_evaluations + 2)
+        return self._total_time / self._num_evaluations / p_false
 
     def __hash__(self):
         return hash(self._callback)
@@ -429,6 +911,10 @@ class FlowOperation(object):
         :class:`dict`
     """
 
+    # If True, conditions are evaluated in the order of their measured cost and
+    # selectivity instead of the order of declaration.
+    _adaptive_condition_order = False
+
     def __init__(self, cmd, pre=None, post=None, directives=None):
         if pre is None:
             pre = []
@@ -460,12 +946,17 @@ class FlowOperation(object):
             raise ValueError(
                 "The ignore_conditions argument of FlowProject.run() "
                 "must be a member of class IgnoreConditions")
+        # Pre-conditions may already be known to be False, e.g., from the evaluation
+        # of the post-conditions of upstream operations within the same pass.
+        if not (ignore_conditions & IgnoreConditions.PRE) \
+                and any(cond._known_false(job) for cond in self._prereqs):
+            return False
         # len(self._prereqs) check for speed optimization
         pre = (not len(self._prereqs)) or (ignore_conditions & IgnoreConditions.PRE) \
-            or all(cond(job) for cond in self._prereqs)
+            or self._all_met(self._prereqs, job)
         if pre and len(self._postconds):
             post = (ignore_conditions & IgnoreConditions.POST) \
-                or any(not cond(job) for cond in self._postconds)
+                or not self._all_met(self._postconds, job)
         else:
             post = True
         return pre and post
@@ -473,10 +964,44 @@ class FlowOperation(object):
     def complete(self, job):
         "True when all post-conditions are met."
         if len(self._postconds):
-            return all(cond(job) for cond in self._postconds)
+            return self._all_met(self._postconds, job)
         else:
             return False
 
+    def _ordered(self, conditions):
+        """Return the conditions in the order in which they are to be evaluated.
+
+        Conditions are evaluated in the order of declaration, unless the adaptive
+        condition order is enabled. In that case, cheap and selective conditions
+        are evaluated first, which only preserves the outcome of the evaluation
+        if the conditions are independent of each other, see :meth:`_all_met`.
+        """
+        if self._adaptive_condition_order and len(conditions) > 1:
+            return sorted(conditions, key=FlowCondition._cost_rank)
+        return conditions
+
+    def _all_met(self, conditions, job):
+        """Return True if all conditions are met for job.
+
+        Conditions may depend on conditions declared before them, e.g., a
+        condition that reads a file may only be declared after a condition that
+        checks whether the file exists. If the evaluation in the adaptive order
+        raises an error, the conditions are therefore evaluated again in the
+        order of declaration. If that evaluation succeeds, the adaptive order is
+        disabled for this operation.
+        """
+        ordered = self._ordered(conditions)
+        try:
+            return all(cond(job) for cond in ordered)
+        except UserConditionError:
+            if ordered is conditions:
+                raise
+        result = all(cond(job) for cond in conditions)
+        logger.debug("Disabled the adaptive condition order for operation {}, because "
+                     "its conditions depend on each other.".format(self))
+        self._adaptive_condition_order = False
+        return result
+
     def __call__(self, job=None):
         if callable(self._cmd):
             return self._cmd(job).format(job=job)
@@ -484,6 +1009,29 @@ class FlowOperation(object):
             return self._cmd.format(job=job)
 
 
+def _topological_order(names, adjacency):
+    """Return the names in topological order of the graph given by the adjacency matrix.
+
+    Among the names that have no unvisited predecessors, the first one in the
+    original order is visited first. Names that are part of a cycle are appended
+    in their original order.
+    """
+    predecessors = [{i for i in range(len(names)) if i != j and adjacency[i][j]}
+                    for j in range(len(names))]
+    order = []
+    remaining = list(range(len(names)))
+    while remaining:
+        for j in remaining:
+            if not predecessors[j].intersection(remaining):
+                break
+        else:
+            order.extend(remaining)
+            break
+        order.append(j)
+        remaining.remove(j)
+    return [names[j] for j in order]
+
+
 def _create_all_metacondition(condition_dict, *other_funcs):
     """Standard function for generating aggregate metaconditions that require
     *all* provided conditions to be met. The resulting metacondition is
@@ -491,7 +1039,7 @@ def _create_all_metacondition(condition_dict, *other_funcs):
     condition_list = [c for f in other_funcs for c in condition_dict[f]]
 
     def _flow_metacondition(job):
-        return all(c(job) for c in condition_list)
+        return all(_evaluate_condition(c, job) for c in condition_list)
 
     _flow_metacondition._composed_of = condition_list
     return _flow_metacondition
@@ -547,12 +1095,16 @@ class _FlowProjectClass(type):
             are used by :meth:`~.detect_operation_graph` when comparing
             conditions for equality. The tag defaults to the bytecode of the
             function.
+
+            If the persistent caching of condition results is enabled, results
+            are not cached for conditions declared with ``cache=False``, e.g.,
+            conditions that depend on data outside of the job's workspace.
             """
 
             _parent_class = parent_class
 
-            def __init__(self, condition, tag=None):
-                super(pre, self).__init__(condition, tag)
+            def __init__(self, condition, tag=None, cache=True):
+                super(pre, self).__init__(condition, tag, cache)
 
             def __call__(self, func):
                 self._parent_class._OPERATION_PRE_CONDITIONS[func].insert(0, self.condition)
@@ -594,11 +1146,15 @@ class _FlowProjectClass(type):
             are used by :meth:`~.detect_operation_graph` when comparing
             conditions for equality. The tag defaults to the bytecode of the
             function.
+
+            If the persistent caching of condition results is enabled, results
+            are not cached for conditions declared with ``cache=False``, e.g.,
+            conditions that depend on data outside of the job's workspace.
             """
             _parent_class = parent_class
 
-            def __init__(self, condition, tag=None):
-                super(post, self).__init__(condition, tag)
+            def __init__(self, condition, tag=None, cache=True):
+                super(post, self).__init__(condition, tag, cache)
 
             def __call__(self, func):
                 self._parent_class._OPERATION_POST_CONDITIONS[func].insert(0, self.condition)
@@ -664,6 +1220,64 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         except KeyError:
             self._use_buffered_mode = False
 
+        # Enable the persistent caching of condition results
+        try:
+            self._use_condition_cache = self.config['flow'].as_bool('use_condition_cache')
+        except KeyError:
+            self._use_condition_cache = False
+
+        # Enable the evaluation of conditions in the order of their cost and selectivity
+        try:
+            self._use_adaptive_condition_order = self.config['flow'].as_bool(
+                'use_adaptive_condition_order')
+        except KeyError:
+            self._use_adaptive_condition_order = False
+        for operation in self._operations.values():
+            operation._adaptive_condition_order = self._use_adaptive_condition_order
+
+        # Condition results are only cached within an evaluation pass.
+        self._condition_cache = None
+        self._persistent_condition_cache = None
+
+        # Evaluation times are only collected on demand, see collect_timings().
+        self._timings = None
+
+        # Select the parallelization of the status and eligibility evaluation
+        try:
+            self._status_parallelization = self.config['flow'].get(
+                'status_parallelization', 'thread')
+        except KeyError:
+            self._status_parallelization = 'thread'
+        if self._status_parallelization not in ('thread', 'process', 'none'):
+            raise ValueError(
+                "Invalid value for the 'flow.status_parallelization' configuration option: "
+                "'{}', expected one of 'thread', 'process', or 'none'.".format(
+                    self._status_parallelization))
+
+        # The order of operation evaluation is determined from the operation graph.
+        self._evaluation_order = None
+
+        # Enable the completion ledger to skip jobs for which all operations are complete
+        try:
+            self._use_completion_ledger = self.config['flow'].as_bool('use_completion_ledger')
+        except KeyError:
+            self._use_completion_ledger = False
+        self._completion_ledger = None
+        self._revalidate_completion_ledger = False
+
+        # The store of the scheduler status is opened on first access.
+        self._operation_status_store = None
+
+        # The status snapshot is only kept open while the status is watched.
+        self._status_snapshot = None
+
+        # The process pools that are reused for the execution of operations.
+        self._operation_pools = None
+
+        # The minimal time in seconds between scheduler queries, see watch_status().
+        self._scheduler_poll_interval = None
+        self._last_scheduler_query = None
+
     def _setup_template_environment(self):
         """Setup the jinja2 template environment.
 
@@ -746,7 +1360,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         sys.exit(2)
 
     @classmethod
-    def label(cls, label_name_or_func=None):
+    def label(cls, label_name_or_func=None, batch=False):
         """Designate a function to be a label function of this class.
 
         For example, we can define a label function like this:
@@ -774,17 +1388,40 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         Finally, you can specify a different default label name by providing it as the first
         argument to the ``label()`` decorator.
 
+        Label functions that evaluate many jobs at once more efficiently may be
+        designated as batch label functions. The function must then accept a
+        sequence of jobs and return a sequence of the same length with one
+        label value per job, see also :meth:`~.pre.batch`:
+
+        .. code-block:: python
+
+            @FlowProject.label(batch=True)
+            def foo_label(jobs):
+                return [job.document.get('foo', False) for job in jobs]
+
         :param label_name_or_func:
             A label name or callable.
         :type label_name_or_func:
             str or callable
+        :param batch:
+            Evaluate the label function for all jobs of an evaluation pass at once.
+        :type batch:
+            bool
         """
         if callable(label_name_or_func):
             cls._LABEL_FUNCTIONS[label_name_or_func] = None
             return label_name_or_func
 
         def label_func(func):
-            cls._LABEL_FUNCTIONS[func] = label_name_or_func
+            if batch:
+                @functools.wraps(func)
+                def _flow_batch_label(job):
+                    return _evaluate_batch(func, [job])[0]
+
+                _flow_batch_label._flow_batch = func
+                cls._LABEL_FUNCTIONS[_flow_batch_label] = label_name_or_func
+            else:
+                cls._LABEL_FUNCTIONS[func] = label_name_or_func
             return func
 
         return label_func
@@ -903,7 +1540,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 class_label_functions[name] = function
 
         for name in sorted(class_label_functions):
-            self._label_functions[class_label_functions[name]] = None
+            # Class label functions are bound to this instance or the class.
+            self._label_functions[getattr(self, name)] = None
 
     def _register_labels(self):
         "Register all label functions registered with this class and its parent classes."
@@ -912,6 +1550,31 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         for cls in type(self).__mro__:
             self._label_functions.update(getattr(cls, '_LABEL_FUNCTIONS', dict()))
 
+        self._labels = [self._bind_label(func, name)
+                        for func, name in self._label_functions.items()]
+
+    def _bind_label(self, func, name=None):
+        """Return the label function with resolved name and call signature.
+
+        Label functions, which require two positional arguments, are called
+        with this project and the job, all others with the job only.
+        """
+        if name is None:
+            name = getattr(func, '_label_name', getattr(func, '__name__', type(func).__name__))
+        try:
+            parameters = inspect.signature(func).parameters.values()
+        except (TypeError, ValueError):     # The signature cannot be determined.
+            pass
+        else:
+            positional = [p for p in parameters if p.default is p.empty and
+                          p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+            if len(positional) > 1:
+                func = functools.partial(func, self)
+        if hasattr(func, '_flow_batch'):
+            # Batch evaluations are timed by the condition cache.
+            func._flow_label_name = name
+        return _FlowLabel(func, name)
+
     ALIASES = dict(
         unknown='U',
         registered='R',
@@ -942,6 +1605,100 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         "Return the canonical name to store bundle information."
         return os.path.join(self.root_directory(), '.bundles', bundle_id)
 
+    def _fn_condition_cache(self):
+        "Return the canonical name of the persistent condition cache."
+        return os.path.join(self.root_directory(), '.flow', 'condition_cache.sqlite')
+
+    def _fn_completion_ledger(self):
+        "Return the canonical name of the completion ledger."
+        return os.path.join(self.root_directory(), '.flow', 'completion_ledger.sqlite')
+
+    def _completion_ledger_key(self):
+        """Return a key that identifies the operations and post-conditions of this workflow.
+
+        Returns None, which disables the completion ledger, if any of the
+        post-conditions cannot be identified reliably, see :func:`_condition_keys`.
+        """
+        workflow = []
+        for name, op in sorted(self.operations.items()):
+            keys = _condition_keys(cond._callback for cond in op._postconds)
+            if keys is None:
+                logger.info("The completion ledger is disabled, because the post-conditions "
+                            "of operation '{}' cannot be identified reliably.".format(name))
+                return None
+            workflow.append((name, keys))
+        return sha1(repr(workflow).encode('utf-8')).hexdigest()
+
+    def _fn_operation_status_store(self):
+        "Return the canonical name of the store for the scheduler status of job-operations."
+        return os.path.join(self.root_directory(), '.flow', 'operation_status.sqlite')
+
+    def _get_operation_status_store(self):
+        """Return the store for the last known scheduler status of job-operations.
+
+        The status was previously stored within the project document, any
+        status found there is moved into the store when it is first opened.
+        """
+        if self._operation_status_store is None:
+            store = _OperationStatusStore(self._fn_operation_status_store())
+            try:
+                legacy_status = self.document['_status']._as_dict()
+            except KeyError:
+                pass
+            else:
+                store.update(legacy_status)
+                self.document.pop('_status', None)
+                logger.info("Moved the status of {} job-operation(s) from the project "
+                            "document to the status store.".format(len(legacy_status)))
+            self._operation_status_store = store
+        return self._operation_status_store
+
+    def _fn_status_snapshot(self):
+        "Return the canonical name of the status snapshot used for incremental updates."
+        return os.path.join(self.root_directory(), '.flow', 'status_snapshot.sqlite')
+
+    def _status_snapshot_key(self):
+        """Return a key that identifies the operations, conditions, and labels of this workflow.
+
+        Returns None, which disables the status snapshot, if any of the
+        conditions or label functions cannot be identified reliably.
+        """
+        workflow = []
+        for name, op in sorted(self.operations.items()):
+            prereqs = _condition_keys(cond._callback for cond in op._prereqs)
+            postconds = _condition_keys(cond._callback for cond in op._postconds)
+            if prereqs is None or postconds is None:
+                logger.info("The status snapshot is disabled, because the conditions "
+                            "of operation '{}' cannot be identified reliably.".format(name))
+                return None
+            workflow.append((name, prereqs, postconds))
+        labels = []
+        for label_func in self._labels:
+            func = label_func._func
+            # Label functions that require the project are bound to it.
+            key = _function_key(func.func if isinstance(func, functools.partial) else func)
+            if key is None:
+                logger.info("The status snapshot is disabled, because the label function "
+                            "'{}' cannot be identified reliably.".format(label_func.name))
+                return None
+            labels.append((label_func.name, key))
+        return sha1(repr((workflow, sorted(labels))).encode('utf-8')).hexdigest()
+
+    def _is_recorded_complete(self, job):
+        "Return True if the job is recorded as complete in the completion ledger."
+        ledger = self._completion_ledger
+        return ledger is not None and not self._revalidate_completion_ledger \
+            and ledger.is_complete(job)
+
+    def _update_completion_ledger(self, job, complete):
+        "Record whether all operations are complete for job in the completion ledger."
+        ledger = self._completion_ledger
+        if ledger is not None:
+            if complete:
+                ledger.record(job)
+            else:
+                ledger.discard(job)
+
     def _store_bundled(self, operations):
         """Store operation-ids as part of a bundle and return bundle id.
 
@@ -1010,30 +1767,46 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 expanded = JobOperation.expand_id(name)
                 yield expanded['job_id'], expanded['operation-name'], sjob
 
-    def _get_operations_status(self, job, cached_status):
+    def _get_operations_status(self, job, cached_status, eligible_only=False):
         "Return a dict with information about job-operations for this job."
-        for job_op in self._job_operations(job, ignore_conditions=IgnoreConditions.ALL):
-            flow_op = self.operations[job_op.name]
-            completed = flow_op.complete(job)
-            eligible = False if completed else flow_op.eligible(job)
-            scheduler_status = cached_status.get(job_op.get_id(), JobStatus.unknown)
-            yield job_op.name, {
+        # Upstream operations are evaluated first, see _operation_evaluation_order().
+        if self._is_recorded_complete(job):
+            evaluated = {name: (True, False) for name in self.operations}
+        elif eligible_only:
+            evaluated = {name: (None, self.operations[name].eligible(job))
+                         for name in self._operation_evaluation_order()}
+        else:
+            evaluated = dict()
+            for name in self._operation_evaluation_order():
+                flow_op = self.operations[name]
+                completed = flow_op.complete(job)
+                evaluated[name] = completed, False if completed else flow_op.eligible(job)
+            self._update_completion_ledger(
+                job, all(completed for completed, _ in evaluated.values()))
+        for name in self.operations:
+            completed, eligible = evaluated[name]
+            scheduler_status = cached_status.get(_get_job_operation_id(job, name),
+                                                 JobStatus.unknown)
+            yield name, {
                 'scheduler_status': scheduler_status,
                 'eligible': eligible,
                 'completed': completed,
             }
 
-    def get_job_status(self, job, ignore_errors=False, cached_status=None):
-        "Return a dict with detailed information about the status of a job."
+    def get_job_status(self, job, ignore_errors=False, cached_status=None, eligible_only=False):
+        """Return a dict with detailed information about the status of a job.
+
+        If eligible_only is True, only the eligibility of operations is
+        determined, their completion is None and their scheduler status is
+        unknown, unless provided with cached_status.
+        """
         result = dict()
         result['job_id'] = str(job)
         try:
             if cached_status is None:
-                try:
-                    cached_status = self.document['_status']._as_dict()
-                except KeyError:
-                    cached_status = dict()
-            result['operations'] = OrderedDict(self._get_operations_status(job, cached_status))
+                cached_status = dict() if eligible_only else self._get_cached_status([job])
+            result['operations'] = OrderedDict(
+                self._get_operations_status(job, cached_status, eligible_only))
             result['_operations_error'] = None
         except Exception as error:
             msg = "Error while getting operations status for job '{}': '{}'.".format(job, error)
@@ -1055,38 +1828,300 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 raise
         return result
 
-    def _fetch_scheduler_status(self, jobs=None, file=None, ignore_errors=False):
-        "Update the status docs."
+    def _query_scheduler(self, file=None, ignore_errors=False):
+        """Return a dict that maps the names of all scheduler jobs to their status.
+
+        Returns None if no scheduler is available, the scheduler query
+        failed and errors are ignored, or the scheduler was queried within
+        the scheduler poll interval.
+        """
         if file is None:
             file = sys.stderr
-        if jobs is None:
-            jobs = list(self)
         try:
             scheduler = self._environment.get_scheduler()
-
-            self.document.setdefault('_status', dict())
-            scheduler_info = {sjob.name(): sjob.status() for sjob in self.scheduler_jobs(scheduler)}
-            status = dict()
+            if self._scheduler_poll_interval is not None \
+                    and self._last_scheduler_query is not None:
+                poll_interval = max(self._scheduler_poll_interval, scheduler._dos_timeout)
+                if time.time() - self._last_scheduler_query < poll_interval:
+                    logger.debug("Use the last known scheduler status.")
+                    return None
+            self._last_scheduler_query = time.time()
             print("Query scheduler...", file=file)
-            for job in tqdm(jobs,
-                            desc="Fetching operation status",
-                            total=len(jobs), file=file):
-                for op in self._job_operations(job, ignore_conditions=IgnoreConditions.ALL):
-                    status[op.get_id()] = int(scheduler_info.get(op.get_id(), JobStatus.unknown))
-            self.document._status.update(status)
+            return {sjob.name(): sjob.status() for sjob in self.scheduler_jobs(scheduler)}
         except NoSchedulerError:
             logger.debug("No scheduler available.")
         except RuntimeError as error:
             logger.warning("Error occurred while querying scheduler: '{}'.".format(error))
             if not ignore_errors:
                 raise
-        else:
+
+    def _fetch_scheduler_status(self, jobs=None, file=None, ignore_errors=False):
+        "Update the status docs."
+        if file is None:
+            file = sys.stderr
+        if jobs is None:
+            jobs = list(self)
+        scheduler_info = self._query_scheduler(file, ignore_errors)
+        if scheduler_info is not None:
+            self._update_cached_status(
+                tqdm(jobs, desc="Fetching operation status", total=len(jobs), file=file),
+                scheduler_info)
             logger.info("Updated job status cache.")
 
-    def _fetch_status(self, jobs, err, ignore_errors, no_parallelize):
-        # Update the project's status cache
-        self._fetch_scheduler_status(jobs, err, ignore_errors)
+    def _update_cached_status(self, jobs, scheduler_info):
+        """Update the status store with the status from the scheduler query.
+
+        The store is updated in chunks of jobs, such that memory usage does not
+        grow with the number of jobs.
+        """
+        jobs = iter(jobs)
+        for chunk in iter(lambda: list(islice(jobs, self._STATUS_STREAM_CHUNK_SIZE)), []):
+            self._get_cached_status(chunk, scheduler_info)
+
+    def _get_cached_status(self, jobs, scheduler_info=None):
+        """Return a dict that maps the ids of the job-operations of jobs to their scheduler status.
+
+        The status store is updated with the status from the scheduler query,
+        if provided, otherwise the last known status is looked up in the store.
+        Only the status of the job-operations of the given jobs is read.
+        """
+        store = self._get_operation_status_store()
+        status = dict()
+        for job in jobs:
+            for name in self.operations:
+                op_id = _get_job_operation_id(job, name)
+                if scheduler_info is None:
+                    try:
+                        status[op_id] = store.get(op_id)
+                    except KeyError:
+                        pass
+                else:
+                    status[op_id] = int(scheduler_info.get(op_id, JobStatus.unknown))
+        if scheduler_info is not None:
+            store.update(status)
+        return status
+
+    def _update_scheduler_status(self, jobs, statuses, scheduler_info):
+        """Update the scheduler status of job-operations within the status of jobs.
+
+        The status store is updated with the status from the scheduler query,
+        or the last known status is used, if the scheduler was not queried.
+        """
+        if scheduler_info is None:
+            cached_status = self._get_operation_status_store().as_dict()
+        updated = dict()
+        for job, status in zip(jobs, statuses):
+            operations = status['operations']
+            for name in self.operations:
+                op_id = _get_job_operation_id(job, name)
+                if scheduler_info is None:
+                    scheduler_status = cached_status.get(op_id, JobStatus.unknown)
+                else:
+                    scheduler_status = updated[op_id] = int(
+                        scheduler_info.get(op_id, JobStatus.unknown))
+                if name in operations:
+                    operations[name]['scheduler_status'] = scheduler_status
+        if updated:
+            self._get_operation_status_store().update(updated)
+            logger.info("Updated job status cache.")
+
+    @staticmethod
+    def _dumps_job_status(status):
+        "Return a compact representation of a job status dict."
+        operations = tuple(
+            (name, int(op['scheduler_status']), op['eligible'], op['completed'])
+            for name, op in status['operations'].items())
+        return (status['job_id'], operations, status['_operations_error'],
+                status['labels'], status['_labels_error'])
+
+    @staticmethod
+    def _loads_job_status(blob):
+        "Return the job status dict from its compact representation."
+        job_id, operations, operations_error, labels, labels_error = blob
+        return {
+            'job_id': job_id,
+            'operations': OrderedDict(
+                (name, {
+                    'scheduler_status': JobStatus(scheduler_status),
+                    'eligible': eligible,
+                    'completed': completed,
+                }) for name, scheduler_status, eligible, completed in operations),
+            '_operations_error': operations_error,
+            'labels': labels,
+            '_labels_error': labels_error,
+        }
+
+    def _get_compact_job_status(self, job, ignore_errors, cached_status, eligible_only):
+        "Return the compact representation of the job status, see _dumps_job_status()."
+        return self._dumps_job_status(
+            self.get_job_status(job, ignore_errors, cached_status, eligible_only))
+
+    def _get_compact_streamed_job_status(self, job, ignore_errors, eligible_only, parameters):
+        """Return the compact representation of the job status, see _dumps_job_status(),
+        and the values of the given state point parameters of the job, if any."""
+        status = self.get_job_status(job, ignore_errors, eligible_only=eligible_only)
+        if parameters:
+            sp = job.statepoint()
+            return self._dumps_job_status(status), [_get_parameter(k, sp) for k in parameters]
+        return self._dumps_job_status(status), None
+
+    def _map_in_processes(self, method, jobs, args, desc=None, file=None):
+        """Evaluate ``method(job, *args)`` for all jobs with a process pool.
+
+        The project instance is serialized once and deserialized once per
+        worker process. Jobs are distributed among the workers in chunks and
+        each chunk is evaluated within one condition evaluation pass.
+
+        :raises _PickleError:
+            If the project cannot be serialized, see :meth:`_serialize_project`.
+        """
+        return list(self._imap_in_processes(method, jobs, args, desc, file))
+
+    def _imap_in_processes(self, method, jobs, args, desc=None, file=None):
+        """Like :meth:`_map_in_processes`, but yield the results as they arrive.
+
+        The project is serialized immediately, that means a _PickleError
+        is raised before the iterator is returned.
+        """
+        loads, s_project = self._serialize_project()
+        return self._imap_in_process_pool(loads, s_project, method, jobs, args, desc, file)
+
+    def _serialize_project(self, use_cloudpickle=False):
+        """Serialize the project with the pickle module or, if that fails, with
+        the cloudpickle module, if available.
+
+        :param use_cloudpickle:
+            Serialize the project with the cloudpickle module right away.
+        :type use_cloudpickle:
+            bool
+        :returns:
+            The function to deserialize the project and the serialized project.
+        :raises _PickleError:
+            If the project cannot be serialized.
+        """
+        import pickle
+        try:
+            if use_cloudpickle:
+                import cloudpickle
+            else:
+                return pickle.loads, pickle.dumps(self)
+        except Exception as error:  # Masking all errors since they must be pickling related.
+            try:
+                import cloudpickle
+            except ImportError:  # The cloudpickle package is not available.
+                raise self._PickleError(error)
+        try:
+            return cloudpickle.loads, cloudpickle.dumps(self)
+        except Exception as error:
+            raise self._PickleError(error)
+
+    def _imap_in_process_pool(self, loads, s_project, method, jobs, args, desc, file):
+        processes = cpu_count()
+        chunksize = max(1, min(100, len(jobs) // (4 * processes)))
+        job_ids = (job._id for job in jobs)
+        chunks = iter(lambda: list(islice(job_ids, chunksize)), [])
+
+        # The arguments, e.g., the cached scheduler status, are passed to each
+        # worker once together with the project instead of with each chunk.
+        task = functools.partial(_evaluate_serialized_jobs, method)
+        with contextlib.closing(Pool(processes=processes, initializer=_init_serialized_project,
+                                     initargs=(loads, s_project, args))) as pool:
+            for chunk in tqdm(pool.imap(task, chunks), desc=desc,
+                              total=-(-len(jobs) // chunksize), file=file, disable=desc is None):
+                for result in chunk:
+                    yield result
+
+    def _fetch_status(self, jobs, err, ignore_errors, no_parallelize, incremental=False,
+                      eligible_only=False):
+        """Return the status of all jobs.
+
+        If eligible_only is True, only the eligibility of operations and the
+        labels are evaluated and the scheduler is not queried, unless the
+        status is updated incrementally, which requires the full status.
+        """
+        if eligible_only and not incremental:
+            return self._evaluate_status(
+                jobs, err, ignore_errors, no_parallelize, dict(), eligible_only=True)
+
+        jobs = list(jobs)
+
+        def _evaluate():
+            if incremental:
+                return self._fetch_status_incrementally(jobs, err, ignore_errors, no_parallelize)
+            return self._evaluate_status(jobs, err, ignore_errors, no_parallelize, dict())
+
+        if self._status_parallelization == 'process' and not no_parallelize:
+            # Worker processes should not be forked while the scheduler is queried.
+            scheduler_info = self._query_scheduler(err, ignore_errors)
+            statuses = _evaluate()
+        else:
+            # The scheduler is queried in the background, while the status is evaluated.
+            with contextlib.closing(ThreadPool(1)) as pool:
+                scheduler_query = pool.apply_async(self._query_scheduler, (err, ignore_errors))
+                statuses = _evaluate()
+                scheduler_info = scheduler_query.get()
+        self._update_scheduler_status(jobs, statuses, scheduler_info)
+        return statuses
+
+    def _fetch_status_incrementally(self, jobs, err, ignore_errors, no_parallelize):
+        """Evaluate the status of all jobs that were modified since the last update.
+
+        The status of all other jobs is restored from the status snapshot,
+        except for their scheduler status. Jobs are considered modified
+        when their fingerprint changed, see :func:`~.util.cache._job_fingerprint`.
+        """
+        jobs = list(jobs)
+        with self._open_status_snapshot() as snapshot:
+            statuses = dict()
+            for job in jobs:
+                try:
+                    statuses[job._id] = self._loads_job_status(snapshot.get(job))
+                except KeyError:
+                    continue
+
+            modified = [job for job in jobs if job._id not in statuses]
+            logger.info("Evaluate the status of {} modified job(s), restore the status of "
+                        "{} job(s).".format(len(modified), len(statuses)))
+            if modified:
+                for job, status in zip(modified, self._evaluate_status(
+                        modified, err, ignore_errors, no_parallelize, dict())):
+                    statuses[job._id] = status
+                    if status['_operations_error'] is None and status['_labels_error'] is None:
+                        snapshot.set(job, self._dumps_job_status(status))
+                    else:
+                        snapshot.discard(job._id)
+
+            # Remove the snapshot of jobs that no longer exist.
+            if len(jobs) == len(self):
+                for job_id in snapshot.job_ids().difference(statuses):
+                    snapshot.discard(job_id)
+            snapshot.flush()
+        return [statuses[job._id] for job in jobs]
 
+    @contextlib.contextmanager
+    def _open_status_snapshot(self):
+        """Open the status snapshot for the duration of this context.
+
+        The snapshot is read only once, when it is first opened, such that
+        repeated incremental status updates within this context, e.g., by
+        :meth:`watch_status`, do not read the complete snapshot again.
+        """
+        if self._status_snapshot is not None:
+            yield self._status_snapshot   # Already opened.
+            return
+        self._status_snapshot = _StatusSnapshot(
+            self._fn_status_snapshot(), self._status_snapshot_key())
+        try:
+            yield self._status_snapshot
+        finally:
+            try:
+                self._status_snapshot.close()
+            finally:
+                self._status_snapshot = None
+
+    def _evaluate_status(self, jobs, err, ignore_errors, no_parallelize, cached_status,
+                         eligible_only=False):
+        "Evaluate the status of all jobs."
         # Get status dict for all selected jobs
         def _print_progress(x):
             print("Updating status: ", end='', file=err)
@@ -1098,23 +2133,37 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                     err.flush()
                 yield _
 
-        try:
-            cached_status = self.document['_status']._as_dict()
-        except KeyError:
-            cached_status = dict()
         _get_job_status = functools.partial(self.get_job_status,
                                             ignore_errors=ignore_errors,
-                                            cached_status=cached_status)
+                                            cached_status=cached_status,
+                                            eligible_only=eligible_only)
 
-        with self._potentially_buffered():
+        # Timings are only collected within this process, see collect_timings().
+        if self._status_parallelization == 'process' and not no_parallelize \
+                and self._timings is None:
+            try:
+                with self._potentially_buffered():
+                    return [self._loads_job_status(status) for status in self._map_in_processes(
+                        '_get_compact_job_status', jobs,
+                        (ignore_errors, cached_status, eligible_only),
+                        desc="Collecting job status info", file=err)]
+            except self._PickleError as error:
+                logger.warning("Unable to parallelize the status determination with processes "
+                               "due to a pickling error, using threads instead: {}".format(error))
+
+        with self._potentially_buffered(), self._condition_evaluation_pass():
             try:
                 with contextlib.closing(ThreadPool()) as pool:
-                    _map = map if no_parallelize else pool.imap
+                    _map = map if no_parallelize or self._status_parallelization == 'none' \
+                        else pool.imap
+
+                    def _map_with_progress(func, iterable):
+                        return tqdm(iterable=_map(func, iterable), total=len(iterable),
+                                    desc="Collecting job status info", file=err)
+
                     # First attempt at parallelized status determination.
                     # This may fail on systems that don't allow threads.
-                    return list(tqdm(
-                        iterable=_map(_get_job_status, jobs),
-                        desc="Collecting job status info", total=len(jobs), file=err))
+                    return self._condition_cache.map(_get_job_status, jobs, _map_with_progress)
             except RuntimeError as error:
                 if "can't start new thread" not in error.args:
                     raise   # unrelated error
@@ -1133,6 +2182,106 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 print('Collecting job status info: {}/{}'.format(i+1, num_jobs), file=err)
                 return statuses
 
+    # The number of jobs that are evaluated within one pass by _fetch_status_stream()
+    # and whose scheduler status is updated at once.
+    _STATUS_STREAM_CHUNK_SIZE = 1000
+
+    def _fetch_status_stream(self, jobs, err, ignore_errors, no_parallelize, incremental=False,
+                             eligible_only=False, parameters=None):
+        """Yield the status of all jobs in order, as soon as it is evaluated.
+
+        In contrast to :meth:`_fetch_status`, jobs are evaluated in chunks of
+        limited size, each within its own condition evaluation pass, and only
+        the scheduler status of the job-operations of each chunk is held in
+        memory, such that memory usage does not grow with the number of jobs.
+
+        If parameters are provided, the values of these state point parameters
+        of each evaluated job are stored under the 'parameters' key of its status.
+        """
+        if incremental:
+            for status in self._fetch_status(jobs, err, ignore_errors, no_parallelize,
+                                             incremental):
+                if parameters:
+                    sp = self.open_job(id=status['job_id']).statepoint()
+                    status['parameters'] = OrderedDict(
+                        (k, _get_parameter(k, sp)) for k in parameters)
+                yield status
+            return
+
+        scheduler_info = None if eligible_only else self._query_scheduler(err, ignore_errors)
+
+        # Timings are only collected within this process, see collect_timings().
+        if self._status_parallelization == 'process' and not no_parallelize \
+                and self._timings is None:
+            if scheduler_info is not None:
+                # The workers look up the scheduler status of each job in the status store.
+                self._update_cached_status(jobs, scheduler_info)
+            try:
+                statuses = self._imap_in_processes(
+                    '_get_compact_streamed_job_status', jobs,
+                    (ignore_errors, eligible_only, parameters))
+            except self._PickleError as error:
+                logger.warning("Unable to parallelize the status determination with processes "
+                               "due to a pickling error, using threads instead: {}".format(error))
+            else:
+                with self._potentially_buffered():
+                    for status, values in statuses:
+                        status = self._loads_job_status(status)
+                        if values is not None:
+                            status['parameters'] = OrderedDict(zip(parameters, values))
+                        yield status
+                return
+
+        def _get_job_status(cached_status, job):
+            status = self.get_job_status(job, ignore_errors, cached_status, eligible_only)
+            if parameters:
+                sp = job.statepoint()
+                status['parameters'] = OrderedDict((k, _get_parameter(k, sp)) for k in parameters)
+            return status
+
+        # Iterating over a project yields a new iterator on each call to iter().
+        jobs = (job for job in jobs)
+        with self._potentially_buffered(), self._open_persistent_caches(), \
+                contextlib.closing(ThreadPool()) as pool:
+            _map = map if no_parallelize or self._status_parallelization == 'none' \
+                else pool.imap
+            for chunk in iter(lambda: list(islice(jobs, self._STATUS_STREAM_CHUNK_SIZE)), []):
+                cached_status = dict() if eligible_only else \
+                    self._get_cached_status(chunk, scheduler_info)
+                with self._condition_evaluation_pass():
+                    yield from self._condition_cache.map(
+                        functools.partial(_get_job_status, cached_status), chunk, _map)
+
+    @contextlib.contextmanager
+    def collect_timings(self):
+        """Collect the evaluation times of conditions, labels, and operation commands
+        and directives within this context.
+
+        For example, to determine the slowest conditions of the status update:
+
+        .. code-block:: python
+
+            with project.collect_timings() as timings:
+                project.print_status()
+            print(timings.format_table())
+
+        Timings are only collected within the current process, the status is
+        therefore not evaluated with a process pool within this context.
+
+        :yields:
+            The collected timings.
+        :yield type:
+            :class:`~.util.timing.Timings`
+        """
+        if self._timings is not None:
+            yield self._timings     # Already collecting timings.
+            return
+        self._timings = Timings()
+        try:
+            yield self._timings
+        finally:
+            self._timings = None
+
     PRINT_STATUS_ALL_VARYING_PARAMETERS = True
     """This constant can be used to signal that the print_status() method is supposed
     to automatically show all varying parameters."""
@@ -1144,7 +2293,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                      unroll=True, compact=False, pretty=False,
                      file=None, err=None, ignore_errors=False,
                      no_parallelize=False, template=None, profile=False,
-                     eligible_jobs_max_lines=None):
+                     eligible_jobs_max_lines=None, timings=None, incremental=False,
+                     stream=False, dump_format=None):
         """Print the status of the project.
 
         :param jobs:
@@ -1224,7 +2374,44 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             User provided Jinja2 template file.
         :type template:
             str
+        :param timings:
+            Show the evaluation times of conditions and labels either formatted
+            as table ('table') or in JSON format ('json'),
+            see also: :meth:`~.collect_timings`.
+        :type timings:
+            str
+        :param incremental:
+            Only evaluate the status of jobs that were modified since the last
+            incremental status update and restore the status of all other jobs.
+            Jobs are considered modified when their workspace directory, state
+            point, or document is modified; modifying files in sub-directories
+            of the workspace or in-place is not detected.
+        :type incremental:
+            bool
+        :param stream:
+            Print the detailed status of each job as soon as it is evaluated,
+            followed by the overview. Column widths are not adjusted to the
+            content and memory usage does not grow with the number of jobs.
+            Cannot be combined with `dump_json`, `expand`, `profile`, or `timings`.
+        :type stream:
+            bool
+        :param dump_format:
+            Output one record per job as soon as it is evaluated instead of
+            printing the formatted output, either in JSON lines format ('jsonl')
+            or as comma-separated values with one row per job and three columns
+            per operation ('csv'), see also: :meth:`~.dump_status`.
+            Cannot be combined with `dump_json`, `profile`, or `stream`.
+        :type dump_format:
+            str
         """
+        if timings not in (None, 'table', 'json'):
+            raise ValueError("The timings argument must be one of None, 'table', or 'json'.")
+        if stream and (dump_json or (detailed and expand) or profile or timings):
+            raise ValueError("The stream argument cannot be combined with the "
+                             "dump_json, expand, profile, or timings arguments.")
+        if dump_format is not None and (dump_json or profile or stream):
+            raise ValueError("The dump_format argument cannot be combined with the "
+                             "dump_json, profile, or stream arguments.")
         if file is None:
             file = sys.stdout
         if err is None:
@@ -1232,6 +2419,26 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         if jobs is None:
             jobs = self     # all jobs
 
+        if dump_format is not None:
+            dump_status = functools.partial(
+                self.dump_status, file, jobs=jobs, dump_format=dump_format,
+                only_incomplete=only_incomplete, err=err, ignore_errors=ignore_errors,
+                no_parallelize=no_parallelize, incremental=incremental)
+            if not timings:
+                dump_status()
+                return
+            with self.collect_timings() as collected_timings:
+                dump_status()
+            if timings == 'json':
+                print(collected_timings.to_json(indent=4), file=err)
+            else:
+                print('# Timings:\n\n' + collected_timings.format_table(), file=err)
+            return
+
+        # The overview only shows the labels and the number of eligible operations,
+        # which do not depend on the scheduler status. User templates may show anything.
+        eligible_only = not (detailed or dump_json) and template is None
+
         # use Jinja2 template for status output
         if template is None:
             if detailed and expand:
@@ -1360,6 +2567,13 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         template = template_environment.get_template(template)
         context = self._get_standard_template_context()
 
+        def _fetch_status():
+            args = (jobs, err, ignore_errors, no_parallelize, incremental, eligible_only)
+            if timings:
+                with self.collect_timings() as collected_timings:
+                    return self._fetch_status(*args), collected_timings
+            return self._fetch_status(*args), None
+
         # get job status information
         if profile:
             try:
@@ -1379,7 +2593,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             ]
 
             with prof(single=False):
-                tmp = self._fetch_status(jobs, err, ignore_errors, no_parallelize)
+                tmp, collected_timings = _fetch_status()
 
             prof._mergeFileTiming()
 
@@ -1442,20 +2656,37 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                     "Warning: Profiler ran only for a short time, "
                     "results may be highly inaccurate.")
 
+        elif stream:
+            # Optionally expand parameters argument to all varying parameters.
+            if parameters is self.PRINT_STATUS_ALL_VARYING_PARAMETERS:
+                parameters = _varying_parameters(job.statepoint() for job in jobs)
+            statuses = self._fetch_status_stream(
+                jobs, err, ignore_errors, no_parallelize, incremental, eligible_only,
+                parameters=parameters)
+            self._print_status_stream(
+                statuses, template, context, file, overview=overview,
+                overview_max_lines=overview_max_lines, detailed=detailed,
+                parameters=parameters, param_max_width=param_max_width, all_ops=all_ops,
+                only_incomplete=only_incomplete, unroll=unroll, compact=compact, pretty=pretty,
+                eligible_jobs_max_lines=eligible_jobs_max_lines)
+            return
+
         else:
-            tmp = self._fetch_status(jobs, err, ignore_errors, no_parallelize)
+            tmp, collected_timings = _fetch_status()
             profiling_results = None
 
+        if collected_timings is None:
+            timing_results = None
+        elif timings == 'json':
+            timing_results = collected_timings.to_json(indent=4)
+        else:
+            timing_results = '# Timings:\n\n' + collected_timings.format_table()
+
         operations_errors = {s['_operations_error'] for s in tmp}
         labels_errors = {s['_labels_error'] for s in tmp}
         errors = list(filter(None, operations_errors.union(labels_errors)))
 
-        if errors:
-            logger.warning(
-                "Some job status updates did not succeed due to errors. "
-                "Number of unique errors: {}. Use --debug to list all errors.".format(len(errors)))
-            for i, error in enumerate(errors):
-                logger.debug("Status update error #{}: '{}'".format(i + 1, error))
+        self._log_status_errors(errors)
 
         if only_incomplete:
             # Remove all jobs from the status info, that have not a single
@@ -1472,14 +2703,16 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         # formatted in JSON to screen.
         if dump_json:
             print(json.dumps(statuses, indent=4), file=file)
+            if timing_results:
+                print(timing_results, file=err)
             return
 
         if overview:
             # get overview info:
             column_width_bar = 50
             column_width_label = 5
-            for key, value in self._label_functions.items():
-                column_width_label = max(column_width_label, len(key.__name__))
+            for label_func in self._labels:
+                column_width_label = max(column_width_label, len(label_func.name))
             progress = defaultdict(int)
             for status in statuses.values():
                 for label in status['labels']:
@@ -1488,11 +2721,13 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 sorted(progress.items(), key=lambda x: (x[1], x[0]), reverse=True),
                 overview_max_lines))
 
-        # Optionally expand parameters argument to all varying parameters.
-        if parameters is self.PRINT_STATUS_ALL_VARYING_PARAMETERS:
-            parameters = list(
-                sorted({key for job in jobs for key in job.sp.keys() if
-                        len(set([to_hashable(job.sp().get(key)) for job in jobs])) > 1}))
+        if parameters:
+            # Read the state point of each job only once.
+            statepoints = {job._id: job.statepoint() for job in jobs}
+
+            # Optionally expand parameters argument to all varying parameters.
+            if parameters is self.PRINT_STATUS_ALL_VARYING_PARAMETERS:
+                parameters = _varying_parameters(statepoints.values())
 
         if parameters:
             # get parameters info
@@ -1501,20 +2736,11 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 column_width_parameters[i] = len(para)
 
             def _add_parameters(status):
-                sp = self.open_job(id=status['job_id']).statepoint()
-
-                def get(k, m):
-                    if m is None:
-                        return
-                    t = k.split('.')
-                    if len(t) > 1:
-                        return get('.'.join(t[1:]), m.get(t[0]))
-                    else:
-                        return m.get(k)
+                sp = statepoints[status['job_id']]
 
                 status['parameters'] = OrderedDict()
                 for i, k in enumerate(parameters):
-                    v = shorten(str(self._alias(get(k, sp))))
+                    v = shorten(str(self._alias(_get_parameter(k, sp))))
                     column_width_parameters[i] = max(column_width_parameters[i], len(v))
                     status['parameters'][k] = v
 
@@ -1538,24 +2764,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 num_operations = len(self._operations)
                 column_width_operations_count = len(str(max(num_operations-1, 0))) + 3
 
-            if pretty:
-                OPERATION_STATUS_SYMBOLS = OrderedDict([
-                    ('ineligible', '\u25cb'),   # open circle
-                    ('eligible', '\u25cf'),     # black circle
-                    ('active', '\u25b9'),       # open triangle
-                    ('running', '\u25b8'),      # black triangle
-                    ('completed', '\u2714'),    # check mark
-                ])
-                "Pretty (unicode) symbols denoting the execution status of operations."
-            else:
-                OPERATION_STATUS_SYMBOLS = OrderedDict([
-                    ('ineligible', '-'),
-                    ('eligible', '+'),
-                    ('active', '*'),
-                    ('running', '>'),
-                    ('completed', 'X')
-                ])
-                "Symbols denoting the execution status of operations."
+            OPERATION_STATUS_SYMBOLS = _operation_status_symbols(pretty)
             operation_status_legend = ' '.join('[{}]:{}'.format(v, k)
                                                for k, v in OPERATION_STATUS_SYMBOLS.items())
 
@@ -1593,28 +2802,458 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 'eligible': True,
                 'scheduler_status': JobStatus.dummy}
 
-        for job in context['jobs']:
-            has_eligible_ops = any([v['eligible'] for v in job['operations'].values()])
-            if not has_eligible_ops and not context['all_ops']:
-                _add_dummy_operation(job)
+        for job in context['jobs']:
+            has_eligible_ops = any([v['eligible'] for v in job['operations'].values()])
+            if not has_eligible_ops and not context['all_ops']:
+                _add_dummy_operation(job)
+
+        op_counter = Counter()
+        for job in context['jobs']:
+            for k, v in job['operations'].items():
+                if v['eligible']:
+                    op_counter[k] += 1
+        context['op_counter'] = op_counter.most_common(eligible_jobs_max_lines)
+        n = len(op_counter) - len(context['op_counter'])
+        if n > 0:
+            context['op_counter'].append(('[{} more operations omitted]'.format(n), ''))
+
+        print(template.render(**context), file=file)
+
+        # Show profiling results (if enabled)
+        if profiling_results:
+            print('\n' + '\n'.join(profiling_results), file=file)
+
+        # Show timing results (if enabled)
+        if timing_results:
+            print('\n' + timing_results, file=file)
+
+    def _print_status_stream(self, statuses, template, context, file, overview,
+                             overview_max_lines, detailed, parameters, param_max_width, all_ops,
+                             only_incomplete, unroll, compact, pretty, eligible_jobs_max_lines):
+        """Render the detailed status while iterating over statuses, then the overview.
+
+        The statuses must contain the values of the state point parameters,
+        see :meth:`_fetch_status_stream`.
+
+        See also: :meth:`~.print_status`.
+        """
+        num_jobs = 0
+        progress = defaultdict(int)
+        op_counter = Counter()
+        errors = set()
+
+        # Column widths are determined in advance, since rows are rendered immediately.
+        label_names = [label_func.name for label_func in self._labels]
+        column_width_label = max([5] + [len(name) for name in label_names])
+        column_width_operation = max([5] + [len(name) for name in self._operations])
+        column_width_parameters = [max(len(para), param_max_width or 0)
+                                   for para in parameters or ()]
+
+        def _process(statuses):
+            nonlocal num_jobs
+            for status in statuses:
+                errors.update(filter(None, (status['_operations_error'], status['_labels_error'])))
+                has_eligible_ops = any(op['eligible'] for op in status['operations'].values())
+                if only_incomplete and not has_eligible_ops:
+                    continue
+                num_jobs += 1
+                for label in status['labels']:
+                    progress[label] += 1
+                if parameters:
+                    status['parameters'] = OrderedDict(
+                        (k, shorten(str(self._alias(v)), param_max_width))
+                        for k, v in status['parameters'].items())
+                if not has_eligible_ops and not all_ops:
+                    status['operations'][''] = {
+                        'completed': False,
+                        'eligible': True,
+                        'scheduler_status': JobStatus.dummy}
+                for k, v in status['operations'].items():
+                    if v['eligible']:
+                        op_counter[k] += 1
+                yield status
+
+        context = dict(context)
+        context['all_ops'] = all_ops
+        context['parameters'] = parameters
+        context['compact'] = compact
+        context['unroll'] = unroll
+        context['column_width_operation'] = column_width_operation
+        if detailed:
+            context['overview'] = False
+            context['detailed'] = True
+            context['jobs'] = _process(statuses)
+            context['column_width_id'] = 32
+            context['column_width_total_label'] = max(6, len(', '.join(label_names)))
+            context['alias_bool'] = {True: 'T', False: 'U'}
+            context['scheduler_status_code'] = _FMT_SCHEDULER_STATUS
+            context['status_legend'] = ' '.join(
+                '[{}]:{}'.format(v, k) for k, v in self.ALIASES.items())
+            if parameters:
+                context['column_width_parameters'] = column_width_parameters
+            if compact:
+                context['extra_num_operations'] = max(len(self._operations)-1, 0)
+                context['column_width_operations_count'] = \
+                    len(str(max(len(self._operations)-1, 0))) + 3
+            if not unroll:
+                context['operation_status_symbols'] = _operation_status_symbols(pretty)
+                context['operation_status_legend'] = ' '.join(
+                    '[{}]:{}'.format(v, k)
+                    for k, v in context['operation_status_symbols'].items())
+            for chunk in template.generate(**context):
+                file.write(chunk)
+                file.flush()
+            print(file=file)
+        else:
+            for _ in _process(statuses):
+                pass
+
+        self._log_status_errors(errors)
+
+        if overview:
+            context['overview'] = True
+            context['detailed'] = False
+            context['jobs'] = range(num_jobs)   # Only the number of jobs is shown.
+            context['progress_sorted'] = list(islice(
+                sorted(progress.items(), key=lambda x: (x[1], x[0]), reverse=True),
+                overview_max_lines))
+            context['column_width_bar'] = 50
+            context['column_width_label'] = column_width_label
+            context['op_counter'] = op_counter.most_common(eligible_jobs_max_lines)
+            n = len(op_counter) - len(context['op_counter'])
+            if n > 0:
+                context['op_counter'].append(('[{} more operations omitted]'.format(n), ''))
+            print(template.render(**context), file=file)
+
+    @staticmethod
+    def _log_status_errors(errors):
+        "Log a warning about errors that occurred during the status update."
+        if errors:
+            logger.warning(
+                "Some job status updates did not succeed due to errors. "
+                "Number of unique errors: {}. Use --debug to list all errors.".format(len(errors)))
+            for i, error in enumerate(errors):
+                logger.debug("Status update error #{}: '{}'".format(i + 1, error))
+
+    def dump_status(self, file=None, jobs=None, dump_format='jsonl', only_incomplete=False,
+                    err=None, ignore_errors=False, no_parallelize=False, incremental=False):
+        """Write the status of jobs to a file, one record per job as soon as it is evaluated.
+
+        In contrast to the JSON output of :meth:`~.print_status`, the records
+        are neither collected nor indented, such that memory usage does not
+        grow with the number of jobs.
+
+        In JSON lines format ('jsonl'), each line contains the status record of
+        one job. In comma-separated values format ('csv'), the first row
+        contains the column names: ``job_id``, ``labels`` (separated by
+        semicolons), and ``<operation>.eligible``, ``<operation>.completed``,
+        and ``<operation>.scheduler_status`` for each operation, where the
+        scheduler status is the integer code of
+        :class:`~.scheduling.base.JobStatus`.
 
-        op_counter = Counter()
-        for job in context['jobs']:
-            for k, v in job['operations'].items():
-                if v['eligible']:
-                    op_counter[k] += 1
-        context['op_counter'] = op_counter.most_common(eligible_jobs_max_lines)
-        n = len(op_counter) - len(context['op_counter'])
-        if n > 0:
-            context['op_counter'].append(('[{} more operations omitted]'.format(n), ''))
+        :param file:
+            The file to write to, defaults to sys.stdout.
+        :type file:
+            file-like object
+        :param jobs:
+            Only dump the status of these jobs, defaults to all jobs.
+        :type jobs:
+            Sequence of instances :class:`.Job`
+        :param dump_format:
+            The output format, either 'jsonl' or 'csv'.
+        :type dump_format:
+            str
+        :param only_incomplete:
+            Only dump the status of jobs that have eligible operations.
+        :type only_incomplete:
+            bool
+        :param err:
+            Redirect all error output to this file, defaults to sys.stderr.
+        :type err:
+            file-like object
+        :param ignore_errors:
+            Dump the status even if querying the scheduler fails.
+        :type ignore_errors:
+            bool
+        :param no_parallelize:
+            Do not parallelize the status update.
+        :type no_parallelize:
+            bool
+        :param incremental:
+            Only evaluate the status of jobs that were modified since the last
+            incremental status update, see :meth:`~.print_status`.
+        :type incremental:
+            bool
+        """
+        if dump_format not in ('jsonl', 'csv'):
+            raise ValueError("The dump_format argument must be one of 'jsonl' or 'csv'.")
+        if file is None:
+            file = sys.stdout
+        if err is None:
+            err = sys.stderr
+        if jobs is None:
+            jobs = self     # all jobs
 
-        print(template.render(**context), file=file)
+        if dump_format == 'csv':
+            writer = csv.writer(file, lineterminator='\n')
+            writer.writerow(['job_id', 'labels'] + [
+                '{}.{}'.format(name, column) for name in self._operations
+                for column in ('eligible', 'completed', 'scheduler_status')])
+
+        errors = set()
+        for status in self._fetch_status_stream(
+                jobs, err, ignore_errors, no_parallelize, incremental):
+            errors.update(filter(None, (status['_operations_error'], status['_labels_error'])))
+            if only_incomplete and not any(
+                    op['eligible'] for op in status['operations'].values()):
+                continue
+            if dump_format == 'jsonl':
+                print(json.dumps(status), file=file)
+            else:
+                row = [status['job_id'], ';'.join(status['labels'])]
+                for name in self._operations:
+                    try:
+                        op = status['operations'][name]
+                    except KeyError:    # The status could not be determined.
+                        row.extend(('', '', ''))
+                    else:
+                        row.extend((int(op['eligible']), int(op['completed']),
+                                    int(op['scheduler_status'])))
+                writer.writerow(row)
+        self._log_status_errors(errors)
+
+    def sample_status(self, sample_size, jobs=None, stratify=None, confidence=0.95, seed=None,
+                      err=None, ignore_errors=False, no_parallelize=False):
+        """Estimate the proportions of labels and eligible operations from a sample of jobs.
+
+        Only the labels and the eligibility of the operations of a random
+        sample of jobs are evaluated. The proportions are reported with Wilson
+        score intervals at the given confidence level, which account for the
+        finite number of jobs.
+
+        If a state point key is provided with the `stratify` argument, the
+        sample is drawn from each group of jobs with the same value of the
+        (nested) key in proportion to the size of the group, which requires
+        to read the state points of all jobs. The proportions and intervals
+        are then estimated per group and weighted by the group's share of
+        all jobs. Groups that are too small to be represented in the sample
+        widen the intervals by their share, since nothing is known about
+        them. Stratifying by a key with more distinct values than the sample
+        size is not supported.
+
+        The returned dict contains the number of jobs, the size of the
+        sample, the confidence level, and for each label (`labels`) and each
+        operation (`eligible`) the number of sampled jobs (`count`), the
+        estimated proportion (`proportion`), and the lower and upper bounds
+        of the interval (`interval`).
+
+        :param sample_size:
+            The number of sampled jobs.
+        :type sample_size:
+            int
+        :param jobs:
+            Only sample these jobs, defaults to all jobs.
+        :type jobs:
+            Sequence of instances :class:`.Job`
+        :param stratify:
+            The (nested) state point key with dots as separators used to
+            stratify the sample.
+        :type stratify:
+            str
+        :param confidence:
+            The confidence level of the intervals.
+        :type confidence:
+            float
+        :param seed:
+            The seed used to draw the sample.
+        :type seed:
+            int
+        :param err:
+            Redirect all error output to this file, defaults to sys.stderr.
+        :type err:
+            file-like object
+        :param ignore_errors:
+            Estimate the proportions even if the evaluation of labels or
+            operations fails.
+        :type ignore_errors:
+            bool
+        :param no_parallelize:
+            Do not parallelize the status update.
+        :type no_parallelize:
+            bool
+        :returns:
+            The estimated proportions.
+        :rtype:
+            dict
+        """
+        if sample_size < 1:
+            raise ValueError("The sample size must be positive.")
+        if not 0 < confidence < 1:
+            raise ValueError("The confidence level must be between 0 and 1.")
+        if err is None:
+            err = sys.stderr
+        if jobs is None:
+            jobs = self     # all jobs
+        jobs = list(jobs)
+        num_jobs = len(jobs)
+
+        rng = random.Random(seed)
+        if stratify is None:
+            strata = [jobs]
+            sample = rng.sample(jobs, min(sample_size, num_jobs))
+            stratum_of = dict.fromkeys((job._id for job in sample), 0)
+        else:
+            groups = defaultdict(list)
+            for job in jobs:
+                groups[repr(_get_parameter(stratify, job.statepoint()))].append(job)
+            if len(groups) > sample_size:
+                raise ValueError(
+                    "Unable to stratify a sample of {} job(s) by '{}' with {} distinct "
+                    "values.".format(sample_size, stratify, len(groups)))
+            strata = [groups[key] for key in sorted(groups)]
+            sizes = _proportional_allocation(
+                [len(stratum) for stratum in strata], min(sample_size, num_jobs))
+            sample = []
+            stratum_of = dict()
+            for i, (stratum, size) in enumerate(zip(strata, sizes)):
+                drawn = rng.sample(stratum, size)
+                sample.extend(drawn)
+                stratum_of.update(dict.fromkeys((job._id for job in drawn), i))
+
+        statuses = self._fetch_status(
+            sample, err, ignore_errors, no_parallelize, eligible_only=True)
+        errors = set()
+        labels = defaultdict(lambda: [0] * len(strata))
+        eligible = defaultdict(lambda: [0] * len(strata))
+        sizes = [0] * len(strata)
+        for status in statuses:
+            errors.update(filter(None, (status['_operations_error'], status['_labels_error'])))
+            i = stratum_of[status['job_id']]
+            sizes[i] += 1
+            for label in status['labels']:
+                labels[label][i] += 1
+            for name, op in status['operations'].items():
+                if op['eligible']:
+                    eligible[name][i] += 1
+        self._log_status_errors(errors)
+
+        z = _z_score(confidence)
+        populations = [len(stratum) for stratum in strata]
+
+        def _estimate(counts):
+            proportion, interval = _stratified_estimate(counts, sizes, populations, z)
+            return {
+                'count': sum(counts),
+                'proportion': proportion,
+                'interval': interval,
+            }
 
-        # Show profiling results (if enabled)
-        if profiling_results:
-            print('\n' + '\n'.join(profiling_results), file=file)
+        return {
+            'num_jobs': num_jobs,
+            'sample_size': len(sample),
+            'confidence': confidence,
+            'labels': {label: _estimate(labels[label]) for label in sorted(labels)},
+            'eligible': {name: _estimate(eligible[name]) for name in self._operations},
+        }
+
+    @staticmethod
+    def _print_status_sample(estimate, file=None):
+        "Print the proportions estimated with sample_status() as a table."
+        if file is None:
+            file = sys.stdout
+        print("Sampled {} of {} job(s), {:g}% confidence intervals:".format(
+            estimate['sample_size'], estimate['num_jobs'], 100 * estimate['confidence']),
+            file=file)
+        for title, rows in (('label', estimate['labels']),
+                            ('eligible operation', estimate['eligible'])):
+            if not rows:
+                continue
+            width = max(len(title), max(len(name) for name in rows))
+            print(file=file)
+            print('{:<{w}}  {:>10}  {:>17}'.format(title, 'proportion', 'interval', w=width),
+                  file=file)
+            print('{}  {}  {}'.format('-' * width, '-' * 10, '-' * 17), file=file)
+            for name, row in rows.items():
+                print('{:<{w}}  {:>9.1f}%  [{:>5.1f}%, {:>5.1f}%]'.format(
+                    name, 100 * row['proportion'], *(100 * x for x in row['interval']),
+                    w=width), file=file)
+
+    def watch_status(self, interval=10, scheduler_interval=60, iterations=None,
+                     file=None, err=None, **kwargs):
+        """Periodically refresh the project status until interrupted.
+
+        The project, the template environment, and the status snapshot are
+        kept between refreshes, such that only the status of jobs that were
+        modified since the last refresh is evaluated, see the `incremental`
+        argument of :meth:`~.print_status`. The scheduler is queried at most
+        once within the scheduler interval, otherwise the last known
+        scheduler status is shown.
+
+        If the output file is a terminal, the status is redrawn in place.
+
+        :param interval:
+            The time in seconds between refreshes.
+        :type interval:
+            float
+        :param scheduler_interval:
+            The minimal time in seconds between scheduler queries.
+        :type scheduler_interval:
+            float
+        :param iterations:
+            The number of refreshes, defaults to refreshing until interrupted.
+        :type iterations:
+            int
+        :param file:
+            Redirect all output to this file, defaults to sys.stdout.
+        :type file:
+            file-like object
+        :param err:
+            Redirect all error output to this file, by default the progress
+            output is discarded.
+        :type err:
+            file-like object
+        :param kwargs:
+            All other arguments are forwarded to :meth:`~.print_status`.
+        """
+        for key in ('stream', 'dump_format', 'profile'):
+            if kwargs.get(key):
+                raise ValueError("The {} argument is not supported in watch mode.".format(key))
+        kwargs.pop('incremental', None)
+        if file is None:
+            file = sys.stdout
+        redraw = getattr(file, 'isatty', lambda: False)()
 
-    def run_operations(self, operations=None, pretend=False, np=None, timeout=None, progress=False):
+        poll_interval = self._scheduler_poll_interval
+        self._scheduler_poll_interval = scheduler_interval
+        try:
+            with contextlib.ExitStack() as stack:
+                if err is None:
+                    err = stack.enter_context(open(os.devnull, 'w'))
+                stack.enter_context(self._open_status_snapshot())
+                for i in count():
+                    start = time.time()
+                    # The status is rendered completely before it is drawn.
+                    buffer = io.StringIO()
+                    print("Last update: {} (every {}s)".format(
+                        datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'), interval),
+                        file=buffer)
+                    self.print_status(file=buffer, err=err, incremental=True, **kwargs)
+                    if redraw:
+                        file.write('\x1b[H\x1b[2J')
+                    elif i:
+                        file.write('\n')
+                    file.write(buffer.getvalue())
+                    file.flush()
+                    if iterations is not None and i + 1 >= iterations:
+                        break
+                    time.sleep(max(0, interval - (time.time() - start)))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._scheduler_poll_interval = poll_interval
+
+    def run_operations(self, operations=None, pretend=False, np=None, timeout=None, progress=False,
+                       memory=None):
         """Execute the next operations as specified by the project's workflow.
 
         See also: :meth:`~.run`
@@ -1640,6 +3279,12 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             Show a progress bar during execution.
         :type progess:
             bool
+        :param memory:
+            The memory available to operations executed in parallel, in the same units
+            as the ``memory`` directive of the operations. By default, the memory is
+            not limited.
+        :type memory:
+            float
         """
         if timeout is not None and timeout < 0:
             timeout = None
@@ -1658,31 +3303,108 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                     self._execute_operation(operation, timeout)
         else:
             logger.debug("Parallelized execution of {} operation(s).".format(len(operations)))
-            with contextlib.closing(Pool(processes=cpu_count() if np < 0 else np)) as pool:
-                logger.debug("Parallelized execution of {} operation(s).".format(len(operations)))
+            processes = cpu_count() if np < 0 else np
+            try:
+                with self._operation_pool(processes) as pool:
+                    self._run_operations_in_parallel(
+                        pool, _LocalResources(processes, memory), operations, progress, timeout)
+            except self._PickleError as error:
                 try:
-                    import pickle
-                    self._run_operations_in_parallel(pool, pickle, operations, progress, timeout)
-                    logger.debug("Used cPickle module for serialization.")
-                except Exception as error:
-                    if not isinstance(error, (pickle.PickleError, self._PickleError)) and\
-                            'pickle' not in str(error).lower():
-                        raise    # most likely not a pickle related error...
+                    import cloudpickle  # noqa: F401
+                except ImportError:  # The cloudpickle package is not available.
+                    logger.error("Unable to parallelize execution due to a pickling error. "
+                                 "\n\n - Try to install the 'cloudpickle' package, e.g., with "
+                                 "'pip install cloudpickle'!\n")
+                raise RuntimeError("Unable to parallelize execution due to a pickling "
+                                   "error: {}.".format(error))
 
-                    try:
-                        import cloudpickle
-                    except ImportError:  # The cloudpickle package is not available.
-                        logger.error("Unable to parallelize execution due to a pickling error. "
-                                     "\n\n - Try to install the 'cloudpickle' package, e.g., with "
-                                     "'pip install cloudpickle'!\n")
-                        raise error
-                    else:
-                        try:
-                            self._run_operations_in_parallel(
-                                pool, cloudpickle, operations, progress, timeout)
-                        except self._PickleError as error:
-                            raise RuntimeError("Unable to parallelize execution due to a pickling "
-                                               "error: {}.".format(error))
+    @contextlib.contextmanager
+    def _operation_pool(self, processes):
+        """Provide a process pool for the parallel execution of operations.
+
+        The project is serialized once and deserialized once per worker
+        process, see :meth:`_serialize_project`. Within the context of
+        :meth:`_reuse_operation_pools`, the pool is kept open and provided
+        again for the same number of processes.
+
+        :raises _PickleError:
+            If the project cannot be serialized.
+        """
+        pools = self._operation_pools
+        if pools is not None and processes in pools:
+            pool = pools[processes]
+        else:
+            pool = self._create_operation_pool(processes)
+            if pools is None:
+                with contextlib.closing(pool):
+                    yield pool
+                return
+            pools[processes] = pool
+        try:
+            yield pool
+        except BaseException:
+            # The pool may be broken, e.g., by an operation that exceeded the timeout.
+            del pools[processes]
+            pool.terminate()
+            raise
+
+    def _create_operation_pool(self, processes):
+        """Return a process pool, whose worker processes deserialized the project.
+
+        If the workers fail to deserialize the project that was serialized with
+        the pickle module, e.g., because a module cannot be imported within the
+        workers, the project is serialized with the cloudpickle module instead,
+        if available.
+
+        :raises _PickleError:
+            If the project cannot be serialized or deserialized.
+        """
+        for use_cloudpickle in (False, True):
+            loads, s_project = self._serialize_project(use_cloudpickle)
+            pool = Pool(processes=processes, initializer=_init_serialized_project,
+                        initargs=(loads, s_project))
+            try:
+                pool.apply(_check_serialized_project)
+            except self._PickleError as error:
+                pool.terminate()
+                try:
+                    import cloudpickle  # noqa: F401
+                except ImportError:  # The cloudpickle package is not available.
+                    raise error
+                if use_cloudpickle:
+                    raise
+                logger.debug("Unable to deserialize the project within the worker processes, "
+                             "use cloudpickle instead: {}".format(error))
+            else:
+                return pool
+
+    @contextlib.contextmanager
+    def _reuse_operation_pools(self):
+        "Keep the process pools provided by :meth:`_operation_pool` open within this context."
+        if self._operation_pools is not None:
+            yield
+            return
+        self._operation_pools = dict()
+        try:
+            yield
+        finally:
+            pools, self._operation_pools = self._operation_pools, None
+            for pool in pools.values():
+                pool.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The state of an evaluation pass is specific to the process.
+        state['_condition_cache'] = None
+        state['_persistent_condition_cache'] = None
+        state['_completion_ledger'] = None
+        state['_timings'] = None
+        state['_operation_status_store'] = None
+        state['_status_snapshot'] = None
+        state['_operation_pools'] = None
+        # The template environments are not serializable and created on demand.
+        state['_template_environment_'] = dict()
+        return state
 
     class _PickleError(Exception):
         "Indicates a pickling error while trying to parallelize the execution of operations."
@@ -1696,33 +3418,101 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         name, job_id, cmd, directives = blob
         return JobOperation(name, self.open_job(id=job_id), cmd, directives)
 
-    def _run_operations_in_parallel(self, pool, pickle, operations, progress, timeout):
+    def _run_operations_in_parallel(self, pool, resources, operations, progress, timeout):
         """Execute operations in parallel.
 
-        This function executes the given list of operations with the provided process pool.
-
-        Since pickling of the project instance is likely to fail, we manually pickle the
-        project instance and the operations before submitting them to the process pool to
-        enable us to try different pool and pickle module combinations.
+        This function executes the given list of operations with the provided process pool,
+        see :meth:`_operation_pool`, within the resources of the local machine, see
+        :meth:`_execute_in_pool`.
+        """
+        for _ in tqdm(self._execute_in_pool(pool, resources, deque(operations), dict(), timeout),
+                      total=len(operations), disable=not progress):
+            pass
+
+    def _execute_in_pool(self, pool, resources, pending, running, timeout):
+        """Execute the pending operations with the process pool and yield them once finished.
+
+        The operations are scheduled in order as soon as the processors and
+        memory they require are available, see :class:`_LocalResources`;
+        operations that do not fit are skipped until enough resources are
+        released. Each task only carries the compact representation of the
+        operation, the project instance is deserialized once per worker process.
+        Operations that must be executed in a separate process are launched and
+        supervised by a :class:`_SubprocessExecutor` instead, such that they do
+        not occupy a worker process. Operations that are appended to the pending
+        deque are scheduled as well.
+
+        :param running:
+            The dict that maps the scheduled operations to their allocated
+            resources, their deadline, and whether they are executed in a
+            separate process.
+        :type running:
+            dict
+        :raises multiprocessing.TimeoutError:
+            If an operation is not finished within the timeout.
         """
+        finished = queue.Queue()
+        executor = None
+        num_workers = 0     # The number of operations executed by worker processes.
+
+        def _schedule(operation, allocation, fork):
+            nonlocal executor, num_workers
+            cpus, omp_num_threads = resources.task_args(operation, allocation)
+            callback = lambda _: finished.put((operation, None))  # noqa: E731
+            error_callback = lambda error: finished.put((operation, error))  # noqa: E731
+            if fork:
+                logger.info("Execute operation '{}'...".format(operation))
+                if executor is None:
+                    executor = _SubprocessExecutor()
+                env = None
+                if omp_num_threads is not None:
+                    env = dict(os.environ, OMP_NUM_THREADS=str(omp_num_threads))
+                executor.submit(self._fork_cmd(operation), env, cpus, timeout,
+                                callback, error_callback)
+                running[operation] = allocation, None, fork
+            else:
+                pool.apply_async(
+                    _execute_serialized_operation,
+                    (self._dumps_op(operation), cpus),
+                    callback=callback, error_callback=error_callback)
+                num_workers += 1
+                deadline = None if timeout is None else time.time() + timeout
+                running[operation] = allocation, deadline, fork
 
         try:
-            s_project = pickle.dumps(self)
-            s_tasks = [(pickle.loads, s_project, self._dumps_op(op))
-                       for op in tqdm(operations, desc='Serialize tasks', file=sys.stderr)]
-        except Exception as error:  # Masking all errors since they must be pickling related.
-            raise self._PickleError(error)
-
-        results = [pool.apply_async(_execute_serialized_operation, task) for task in s_tasks]
-
-        for result in tqdm(results) if progress else results:
-            result.get(timeout=timeout)
-
-    def _execute_operation(self, operation, timeout=None):
-        logger.info("Execute operation '{}'...".format(operation))
-
-        # Check if we need to fork for operation execution...
-        if (
+            while pending or running:
+                for operation in list(pending):
+                    if not resources.available():
+                        break
+                    fork = self._requires_fork(operation, timeout)
+                    if not fork and num_workers >= resources.processors:
+                        continue    # All worker processes are busy.
+                    allocation = resources.acquire(operation)
+                    if allocation is not None:
+                        pending.remove(operation)
+                        _schedule(operation, allocation, fork)
+
+                deadlines = [deadline for _, deadline, _ in running.values()
+                             if deadline is not None]
+                try:
+                    operation, error = finished.get(
+                        timeout=max(0, min(deadlines) - time.time()) if deadlines else None)
+                except queue.Empty:
+                    raise multiprocessing.TimeoutError()
+                allocation, _, fork = running.pop(operation)
+                if not fork:
+                    num_workers -= 1
+                resources.release(allocation)
+                if error is not None:
+                    raise error
+                yield operation
+        finally:
+            if executor is not None:
+                executor.close()
+
+    def _requires_fork(self, operation, timeout=None):
+        "Return True if the operation must be executed in a separate process."
+        return (
             # The 'fork' directive was provided and evaluates to True:
             operation.directives.get('fork', False)
             # Separate process needed to cancel with timeout:
@@ -1734,13 +3524,21 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             # The operation requires MPI and/or OpenMP parallelization:
             or operation.directives.get('nranks', 1) > 1
             or operation.directives.get('omp_num_threads', 1) > 1
-        ):
+        )
+
+    def _fork_cmd(self, operation):
+        "Return the shell command that executes the operation in a separate process."
+        cmd = self._environment.get_prefix(operation) + ' ' + operation.cmd
+        logger.debug("Forking to execute operation '{}' with cmd '{}'.".format(operation, cmd))
+        return cmd
+
+    def _execute_operation(self, operation, timeout=None):
+        logger.info("Execute operation '{}'...".format(operation))
+
+        # Check if we need to fork for operation execution...
+        if self._requires_fork(operation, timeout):
             # ... need to fork:
-            prefix = self._environment.get_prefix(operation)
-            logger.debug(
-                "Forking to execute operation '{}' with "
-                "cmd '{}'.".format(operation, prefix + ' ' + operation.cmd))
-            subprocess.run(prefix + ' ' + operation.cmd, shell=True, timeout=timeout, check=True)
+            subprocess.run(self._fork_cmd(operation), shell=True, timeout=timeout, check=True)
         else:
             # ... executing operation in interpreter process as function:
             logger.debug(
@@ -1754,7 +3552,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                     'for job {operation.job}.'.format(operation=operation)) from e
 
     def run(self, jobs=None, names=None, pretend=False, np=None, timeout=None, num=None,
-            num_passes=1, progress=False, order=None, ignore_conditions=IgnoreConditions.NONE):
+            num_passes=1, progress=False, order=None, ignore_conditions=IgnoreConditions.NONE,
+            continuous=False, memory=None, rescan=False):
         """Execute all pending operations for the given selection.
 
         This function will run in an infinite loop until all pending operations
@@ -1830,6 +3629,28 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
 
         :type order:
             str, callable, or NoneType
+        :param continuous:
+            Execute operations in parallel as soon as they become eligible instead of
+            in passes. When an operation is finished, only the eligibility of the
+            operations of its job is evaluated, and the operations are ordered as
+            soon as they are collected. Only applies to parallel execution.
+        :type continuous:
+            bool
+        :param memory:
+            The memory available to operations executed in parallel, see
+            :meth:`~.run_operations`.
+        :type memory:
+            float
+        :param rescan:
+            Evaluate all jobs in each pass. By default, only the jobs for which
+            operations were executed or skipped in the previous pass are
+            evaluated again, all other jobs are assumed to be unchanged. The
+            operations of other jobs therefore only become eligible in later
+            passes with this argument, if their conditions depend on other
+            jobs or on data outside of their job, e.g., on the project
+            document.
+        :type rescan:
+            bool
         """
         # If no jobs argument is provided, we run operations for all jobs.
         if jobs is None:
@@ -1879,6 +3700,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                     log("Operation '{}' has no post-conditions!".format(operation.name),
                         logging.WARNING)
 
+                # The job is evaluated again in the next pass, like the jobs of executed operations.
+                select.skipped_jobs[operation.job] = None
                 return False    # Reached maximum number of passes for this operation.
 
             # Increase execution counters for this operation.
@@ -1890,27 +3713,27 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         # of each individual job-operation cannot exceed num_passes.
         select.num_executions = defaultdict(int)
 
+        # Keep track of the jobs with eligible operations that were skipped within a pass.
+        select.skipped_jobs = OrderedDict()
+
         # Keep track of the total execution count, it may not exceed the value given by
         # num, if not None.
         # Note: We are not using sum(select.num_execution.values()) for efficiency.
         select.total_execution_count = 0
 
-        for i_pass in count(1):
-            if reached_execution_limit.is_set():
-                logger.warning("Reached the maximum number of operations that can be executed, but "
-                               "there are still operations pending.")
-                break
+        def collect(jobs, scheduled=()):
+            "Return the selected pending operations of jobs, except for scheduled operations."
             try:
-                with self._potentially_buffered():
-                    operations = list(filter(select, self._get_pending_operations(
-                        jobs, names, ignore_conditions=ignore_conditions)))
+                with self._potentially_buffered(), self._condition_evaluation_pass():
+                    operations = list(filter(select, (
+                        op for op in self._get_pending_operations(
+                            jobs, names, ignore_conditions=ignore_conditions)
+                        if op not in scheduled)))
             finally:
                 if messages:
                     for msg, level in set(messages):
                         logger.log(level, msg)
                     del messages[:]     # clear
-            if not operations:
-                break   # No more pending operations or execution limits reached.
 
             # Optionally re-order operations for execution if order argument is provided:
             if callable(order):
@@ -1927,11 +3750,84 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 raise ValueError(
                     "Invalid value for the 'order' argument, valid arguments are "
                     "'none', 'by-job', 'cyclic', 'random', None, or a callable.")
+            return operations
+
+        if continuous and not pretend and np is not None and np != 1:
+            self._run_continuously(
+                jobs, collect, np, memory, timeout, progress, reached_execution_limit, rescan)
+            if reached_execution_limit.is_set():
+                logger.warning("Reached the maximum number of operations that can be executed, "
+                               "but there may still be operations pending.")
+            return
 
-            logger.info(
-                "Executing {} operation(s) (Pass # {:02d})...".format(len(operations), i_pass))
-            self.run_operations(operations, pretend=pretend,
-                                np=np, timeout=timeout, progress=progress)
+        # The process pools used to execute operations are reused across all passes.
+        with self._reuse_operation_pools():
+            selected = jobs
+            for i_pass in count(1):
+                if reached_execution_limit.is_set():
+                    logger.warning("Reached the maximum number of operations that can be "
+                                   "executed, but there are still operations pending.")
+                    break
+                select.skipped_jobs.clear()
+                operations = collect(selected)
+                if not operations:
+                    break   # No more pending operations or execution limits reached.
+
+                logger.info(
+                    "Executing {} operation(s) (Pass # {:02d})...".format(len(operations), i_pass))
+                self.run_operations(operations, pretend=pretend, np=np, timeout=timeout,
+                                    progress=progress, memory=memory)
+
+                # Only the jobs for which operations were executed or skipped are evaluated
+                # in the next pass, unless the state point of a job was changed.
+                touched = OrderedDict.fromkeys(op.job for op in operations)
+                if rescan or not all(job in self for job in touched):
+                    selected = jobs
+                else:
+                    touched.update(select.skipped_jobs)
+                    selected = list(touched)
+
+    def _run_continuously(self, jobs, collect, np, memory, timeout, progress,
+                          reached_execution_limit, rescan=False):
+        """Execute operations in parallel as soon as they become eligible.
+
+        In contrast to the execution in passes, the workers do not wait for the
+        slowest operation of a pass. When an operation is finished, the pending
+        operations of its job are collected and scheduled right away. All jobs
+        are evaluated again once no operations are scheduled, until no
+        operations are pending, if rescan is True or the state point of a job
+        was changed.
+
+        :param collect:
+            A function that returns the selected pending operations of the given
+            jobs, except for the given scheduled operations.
+        :type collect:
+            callable
+        """
+        processes = cpu_count() if np < 0 else np
+        resources = _LocalResources(processes, memory)
+        running = dict()
+        try:
+            # The persistent caches are opened once, only the finished jobs are refreshed.
+            with self._open_persistent_caches(), self._operation_pool(processes) as pool, \
+                    tqdm(desc='Executing operations', disable=not progress) as progress_bar:
+                pending = deque(collect(jobs))
+                while pending:
+                    evaluate_all = False
+                    for operation in self._execute_in_pool(
+                            pool, resources, pending, running, timeout):
+                        progress_bar.update()
+                        if operation.job in self:
+                            self._refresh_persistent_caches(operation.job)
+                            pending.extend(collect([operation.job], set(pending).union(running)))
+                        else:
+                            evaluate_all = True
+                    # Evaluate all jobs again, as with a new pass.
+                    if (evaluate_all or rescan) and not reached_execution_limit.is_set():
+                        pending.extend(collect(jobs))
+        except self._PickleError as error:
+            raise RuntimeError("Unable to parallelize execution due to a pickling "
+                               "error: {}.".format(error))
 
     def _generate_operations(self, cmd, jobs, requires=None):
         "Generate job-operations for a given 'direct' command."
@@ -1959,6 +3855,66 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         else:
             yield
 
+    @contextlib.contextmanager
+    def _condition_evaluation_pass(self):
+        """Cache condition results for the duration of one evaluation pass.
+
+        Each condition is evaluated at most once per job within this context.
+        The job state must therefore not be modified before the context is
+        exited, i.e., operations must not be executed within an evaluation pass.
+        """
+        if self._condition_cache is not None:
+            yield   # Already within an evaluation pass.
+            return
+        with self._open_persistent_caches():
+            self._condition_cache = _ConditionCache(self._persistent_condition_cache)
+            try:
+                yield
+            finally:
+                self._condition_cache = None
+
+    @contextlib.contextmanager
+    def _open_persistent_caches(self):
+        """Open the persistent condition cache and the completion ledger, if enabled.
+
+        All evaluation passes within this context share the opened databases,
+        which are read and written only once. Jobs that are modified within
+        this context must be refreshed with :meth:`_refresh_persistent_caches`
+        before the next evaluation pass.
+        """
+        if self._persistent_condition_cache is not None or self._completion_ledger is not None:
+            yield   # Already opened.
+            return
+        if self._use_condition_cache:
+            self._persistent_condition_cache = _PersistentConditionCache(
+                self._fn_condition_cache())
+        if self._use_completion_ledger:
+            self._completion_ledger = _CompletionLedger(
+                self._fn_completion_ledger(), self._completion_ledger_key())
+        try:
+            yield
+        finally:
+            try:
+                if self._persistent_condition_cache is not None:
+                    self._persistent_condition_cache.close()
+                    self._persistent_condition_cache = None
+            finally:
+                if self._completion_ledger is not None:
+                    self._completion_ledger.close()
+                    self._completion_ledger = None
+
+    def _flush_persistent_caches(self):
+        "Write the modified entries of the opened persistent caches to disk."
+        if self._persistent_condition_cache is not None:
+            self._persistent_condition_cache.flush()
+        if self._completion_ledger is not None:
+            self._completion_ledger.flush()
+
+    def _refresh_persistent_caches(self, job):
+        "Discard the persistently cached condition results of job, if it was modified."
+        if self._persistent_condition_cache is not None:
+            self._persistent_condition_cache.refresh(job)
+
     def script(self, operations, parallel=False, template='script.sh', show_template_help=False):
         """Generate a run script to execute given operations.
 
@@ -2168,13 +4124,12 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 "must be a member of class IgnoreConditions")
 
         # Gather all pending operations.
-        with self._potentially_buffered():
+        with self._potentially_buffered(), self._condition_evaluation_pass():
             operations = (op for op in
                           self._get_pending_operations(jobs, names,
                                                        ignore_conditions=ignore_conditions)
                           if self._eligible_for_submission(op))
-            if num is not None:
-                operations = list(islice(operations, num))
+            operations = list(islice(operations, num))
 
         # Bundle them up and submit.
         for bundle in _make_bundles(operations, bundle_size):
@@ -2183,8 +4138,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                 force=force, walltime=walltime, **kwargs)
 
             if status is not None:  # operations were submitted, store status
-                for op in bundle:
-                    op.set_status(status)
+                self._get_operation_status_store().update(
+                    {op.get_id(): status for op in bundle})
 
     @classmethod
     def _add_submit_args(cls, parser):
@@ -2332,6 +4287,16 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             help="Manually specify all labels that are required for the direct command "
                  "to be considered eligible for execution.")
 
+    @classmethod
+    def _add_completion_ledger_arg(cls, parser):
+        "Add the argument to revalidate the completion ledger to parser."
+        parser.add_argument(
+            '--revalidate',
+            action='store_true',
+            help="Evaluate the conditions of all jobs, including those that are recorded "
+                 "as complete in the completion ledger, and update the ledger. "
+                 "Only relevant if 'flow.use_completion_ledger' is enabled.")
+
     @deprecated(
         deprecated_in="0.8", removed_in="0.10",
         current_version=__version__,
@@ -2360,6 +4325,20 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             dest='dump_json',
             action='store_true',
             help="Do not format the status display, but dump all data formatted in JSON.")
+        view_group.add_argument(
+            '--jsonl',
+            dest='dump_format',
+            action='store_const',
+            const='jsonl',
+            help="Do not format the status display, but dump the status of each job "
+                 "as soon as it is evaluated, one JSON record per line.")
+        view_group.add_argument(
+            '--csv',
+            dest='dump_format',
+            action='store_const',
+            const='csv',
+            help="Do not format the status display, but dump the status of each job "
+                 "as soon as it is evaluated, one row of comma-separated values per job.")
         view_group.add_argument(
             '-d', '--detailed',
             action='store_true',
@@ -2432,25 +4411,12 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
 
         See also: :meth:`~.label`
         """
-        for label_func, label_name in self._label_functions.items():
-            if label_name is None:
-                label_name = getattr(label, '_label_name',
-                                     getattr(label, '__name__', type(label).__name__))
-            try:
-                label_value = label_func(job)
-            except TypeError:
-                try:
-                    label_value = label_func(self, job)
-                except Exception:
-                    label_func = getattr(self, label.__func__.__name__)
-                    label_value = label_func(job)
-
-            label_name = getattr(label_func, '_label_name', label_func.__name__)
-            assert label_name is not None
+        for label_func in self._labels:
+            label_value = label_func(job)
             if isinstance(label_value, str):
                 yield label_value
             elif bool(label_value) is True:
-                yield label_name
+                yield label_func.name
 
     def add_operation(self, name, cmd, pre=None, post=None, **kwargs):
         """
@@ -2519,7 +4485,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         """
         if name in self.operations:
             raise KeyError("An operation with this identifier is already added.")
-        self.operations[name] = FlowOperation(cmd=cmd, pre=pre, post=post, directives=kwargs)
+        op = self.operations[name] = FlowOperation(cmd=cmd, pre=pre, post=post, directives=kwargs)
+        op._adaptive_condition_order = self._use_adaptive_condition_order
 
     @deprecated(
         deprecated_in="0.8", removed_in="0.10",
@@ -2558,12 +4525,51 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             if op.complete(job):
                 yield name
 
+    def _operation_evaluation_order(self):
+        """Return the operation names in topological order of the operation graph.
+
+        Evaluating the conditions of upstream operations first ensures that their
+        results are cached when the pre-conditions of downstream operations are
+        evaluated, see :meth:`FlowOperation.eligible`. Ties are resolved by the
+        order of declaration, which is also used as fallback when the operation
+        graph cannot be detected.
+        """
+        names = tuple(self.operations)
+        if self._evaluation_order is None or self._evaluation_order[0] != names:
+            try:
+                adjacency = self.detect_operation_graph()
+            except RuntimeError:
+                order = list(names)
+            else:
+                order = _topological_order(names, adjacency)
+            self._evaluation_order = names, order
+        return self._evaluation_order[1]
+
+    def _eligible_operation_names(self, job, ignore_conditions=IgnoreConditions.NONE):
+        "Return the set of names of all operations that are eligible for job."
+        # No operation is eligible for jobs that are complete, unless post-conditions are ignored.
+        use_ledger = not (ignore_conditions & IgnoreConditions.POST)
+        if use_ledger and self._is_recorded_complete(job):
+            return set()
+        eligible = {name for name in self._operation_evaluation_order()
+                    if self.operations[name].eligible(job, ignore_conditions)}
+        if use_ledger and self._completion_ledger is not None:
+            self._update_completion_ledger(
+                job, not eligible and all(op.complete(job) for op in self.operations.values()))
+        return eligible
+
+    def _create_job_operations(self, job, names):
+        "Yield instances of JobOperation for job and the named operations in order of declaration."
+        for name, op in self.operations.items():
+            if name in names:
+                # The command and directives are only evaluated when needed.
+                yield JobOperation(name=name, job=job, cmd=functools.partial(op, job),
+                                   directives=op.directives)
+
     def _job_operations(self, job, ignore_conditions=IgnoreConditions.NONE):
         "Yield instances of JobOperation constructed for specific jobs."
-        for name, op in self.operations.items():
-            if not op.eligible(job, ignore_conditions):
-                continue
-            yield JobOperation(name=name, job=job, cmd=op(job), directives=op.directives)
+        return self._create_job_operations(
+            job, self._eligible_operation_names(job, ignore_conditions))
 
     def next_operations(self, *jobs, ignore_conditions=IgnoreConditions.NONE):
         """Determine the next eligible operations for jobs.
@@ -2580,6 +4586,28 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         :yield:
             All instances of :class:`~.JobOperation` jobs are eligible for.
         """
+        # Timings are only collected within this process, see collect_timings().
+        if self._status_parallelization == 'process' and len(jobs) > 1 \
+                and self._timings is None:
+            try:
+                eligible = self._map_in_processes(
+                    '_eligible_operation_names', jobs, (ignore_conditions, ))
+            except self._PickleError as error:
+                logger.warning("Unable to parallelize the evaluation of eligible operations "
+                               "due to a pickling error: {}".format(error))
+            else:
+                for job, names in zip(jobs, eligible):
+                    for op in self._create_job_operations(job, names):
+                        yield op
+                return
+        if self._condition_cache is not None and len(jobs) > 1:
+            eligible = self._condition_cache.map(
+                functools.partial(self._eligible_operation_names,
+                                  ignore_conditions=ignore_conditions), jobs)
+            for job, names in zip(jobs, eligible):
+                for op in self._create_job_operations(job, names):
+                    yield op
+            return
         for job in jobs:
             for op in self._job_operations(job, ignore_conditions):
                 yield op
@@ -2739,9 +4767,22 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                                'job_id', 'filter', 'doc_filter']}
         if args.pop('full'):
             args['detailed'] = args['all_ops'] = True
+        watch = args.pop('watch')
+        scheduler_interval = args.pop('scheduler_interval')
+        sample_args = {key: args.pop(key) for key in ('sample', 'stratify', 'seed')}
 
         start = time.time()
         try:
+            if sample_args['sample'] is not None:
+                self._print_status_sample(self.sample_status(
+                    sample_args['sample'], jobs=jobs, stratify=sample_args['stratify'],
+                    seed=sample_args['seed'], ignore_errors=args['ignore_errors'],
+                    no_parallelize=args['no_parallelize']))
+                return
+            if watch is not None:
+                self.watch_status(interval=watch, scheduler_interval=scheduler_interval,
+                                  jobs=jobs, **args)
+                return
             self.print_status(jobs=jobs, **args)
         except NoSchedulerError:
             self.print_status(jobs=jobs, **args)
@@ -2755,19 +4796,20 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                     "Error during status update: {}\nUse '--ignore-errors' to "
                     "complete the update anyways or '--show-traceback' to show "
                     "the full traceback.".format(str(error)))
-                error = error.__cause__  # Always show the user traceback cause.
+                # Always show the user traceback cause.
+                error = error.__cause__ or error
             traceback.print_exception(type(error), error, error.__traceback__)
         else:
             # Use small offset to account for overhead with few jobs
             delta_t = (time.time() - start - 0.5) / max(len(jobs), 1)
             config_key = 'status_performance_warn_threshold'
             warn_threshold = flow_config.get_config_value(config_key)
-            if not args['profile'] and delta_t > warn_threshold >= 0:
+            if not (args['profile'] or args['timings']) and delta_t > warn_threshold >= 0:
                 print(
                     "WARNING: "
                     "The status compilation took more than {}s per job. Consider "
-                    "using `--profile` to determine bottlenecks within your project "
-                    "workflow definition.\n"
+                    "using `--timings` or `--profile` to determine bottlenecks within your "
+                    "project workflow definition.\n"
                     "Execute `signac config set flow.{} VALUE` to specify the "
                     "warning threshold in seconds. Use -1 to completely suppress this "
                     "warning."
@@ -2775,9 +4817,10 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
 
     def _main_next(self, args):
         "Determine the jobs that are eligible for a specific operation."
-        for job in self:
-            if args.name in {op.name for op in self.next_operations(job)}:
-                print(job)
+        with self._condition_evaluation_pass():
+            for op in self.next_operations(*self):
+                if op.name == args.name:
+                    print(op.job)
 
     def _main_run(self, args):
         "Run all (or select) job operations."
@@ -2792,7 +4835,9 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                                 np=args.parallel, timeout=args.timeout, num=args.num,
                                 num_passes=args.num_passes, progress=args.progress,
                                 order=args.order,
-                                ignore_conditions=args.ignore_conditions)
+                                ignore_conditions=args.ignore_conditions,
+                                continuous=args.continuous, memory=args.memory,
+                                rescan=args.rescan)
 
         if args.switch_to_project_root:
             with add_cwd_to_environment_pythonpath():
@@ -2814,7 +4859,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         jobs = self._select_jobs_from_args(args)
 
         # Gather all pending operations or generate them based on a direct command...
-        with self._potentially_buffered():
+        with self._potentially_buffered(), self._condition_evaluation_pass():
             if args.cmd:
                 operations = self._generate_operations(args.cmd, jobs, args.requires)
             else:
@@ -2840,7 +4885,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             self._fetch_scheduler_status(jobs)
 
         # Gather all pending operations ...
-        with self._potentially_buffered():
+        with self._potentially_buffered(), self._condition_evaluation_pass():
             ops = (op for op in self._get_pending_operations(jobs, args.operation_name,
                    ignore_conditions=args.ignore_conditions)
                    if self._eligible_for_submission(op))
@@ -2850,8 +4895,8 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         for bundle in _make_bundles(ops, args.bundle_size):
             status = self.submit_operations(operations=bundle, **kwargs)
             if status is not None:
-                for op in bundle:
-                    op.set_status(status)
+                self._get_operation_status_store().update(
+                    {op.get_id(): status for op in bundle})
 
     def _main_exec(self, args):
         if len(args.jobid):
@@ -2957,6 +5002,54 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
                  "Optionally provide a filename pattern to select for what files "
                  "to show result for. Defaults to the main module. "
                  "(requires pprofile)")
+        parser_status.add_argument(
+            '--timings',
+            nargs='?',
+            const='table',
+            choices=['table', 'json'],
+            help="Show the number of evaluations as well as the total, mean, and percentile "
+                 "evaluation times of each condition and label function, either formatted "
+                 "as table (the default) or in JSON format.")
+        parser_status.add_argument(
+            '--incremental',
+            action='store_true',
+            help="Only evaluate the status of jobs that were modified since the last "
+                 "incremental status update, the status of all other jobs is restored "
+                 "from the previous update.")
+        parser_status.add_argument(
+            '--stream',
+            action='store_true',
+            help="Print the detailed status of each job as soon as it is evaluated and the "
+                 "overview at the end. Column widths are not adjusted to the content.")
+        parser_status.add_argument(
+            '--watch',
+            type=float,
+            nargs='?',
+            const=10,
+            metavar='SECONDS',
+            help="Refresh the status every SECONDS (default: 10) until interrupted. Only the "
+                 "status of modified jobs is evaluated on each refresh.")
+        parser_status.add_argument(
+            '--scheduler-interval',
+            type=float,
+            default=60,
+            metavar='SECONDS',
+            help="The minimal time between scheduler queries in watch mode (default: 60).")
+        parser_status.add_argument(
+            '--sample',
+            type=int,
+            metavar='N',
+            help="Estimate the proportions of labels and eligible operations with confidence "
+                 "intervals from a random sample of N jobs.")
+        parser_status.add_argument(
+            '--stratify',
+            metavar='KEY',
+            help="Stratify the sample by the value of the (nested) state point KEY.")
+        parser_status.add_argument(
+            '--seed',
+            type=int,
+            help="The seed used to draw the sample.")
+        self._add_completion_ledger_arg(parser_status)
         parser_status.set_defaults(func=self._main_status)
 
         parser_next = subparsers.add_parser(
@@ -2967,6 +5060,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             'name',
             type=str,
             help="The name of the operation.")
+        self._add_completion_ledger_arg(parser_next)
         parser_next.set_defaults(func=self._main_next)
 
         parser_run = subparsers.add_parser(
@@ -3008,6 +5102,22 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             const='-1',
             help="Specify the number of cores to parallelize to. Defaults to all available "
                  "processing units if argument is omitted.")
+        execution_group.add_argument(
+            '--memory',
+            type=float,
+            help="The memory available to operations executed in parallel, in the same units "
+                 "as the 'memory' directive of the operations (default: not limited).")
+        execution_group.add_argument(
+            '--continuous',
+            action='store_true',
+            help="Execute operations in parallel as soon as they become eligible, instead of "
+                 "waiting for all operations of an execution pass to finish.")
+        execution_group.add_argument(
+            '--rescan',
+            action='store_true',
+            help="Evaluate all jobs in each execution pass, instead of only the jobs for which "
+                 "operations were executed or skipped in the previous pass. Required if "
+                 "conditions depend on other jobs or on the project document.")
         execution_group.add_argument(
             '--order',
             type=str,
@@ -3021,6 +5131,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             default=IgnoreConditions.NONE,
             action=_IgnoreConditionsConversion,
             help="Specify conditions to ignore for eligibility check.")
+        self._add_completion_ledger_arg(parser_run)
         parser_run.set_defaults(func=self._main_run)
 
         parser_script = subparsers.add_parser(
@@ -3035,6 +5146,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             action=_IgnoreConditionsConversion,
             help="Specify conditions to ignore for eligibility check.")
         self._add_script_args(parser_script)
+        self._add_completion_ledger_arg(parser_script)
         parser_script.set_defaults(func=self._main_script)
 
         parser_submit = subparsers.add_parser(
@@ -3045,6 +5157,7 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
         env_group = parser_submit.add_argument_group(
             '{} options'.format(self._environment.__name__))
         self._environment.add_args(env_group)
+        self._add_completion_ledger_arg(parser_submit)
         parser_submit.set_defaults(func=self._main_submit)
         print('Using environment configuration:', self._environment.__name__, file=sys.stderr)
 
@@ -3085,6 +5198,11 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             args.verbose = max(2, args.verbose)
             args.show_traceback = True
 
+        # The completion ledger is revalidated within all evaluation passes.
+        if hasattr(args, 'revalidate'):
+            self._revalidate_completion_ledger = args.revalidate
+            del args.revalidate
+
         # Support print_status argument alias
         if args.func == self._main_status and args.full:
             args.detailed = args.all_ops = True
@@ -3150,15 +5268,452 @@ class FlowProject(signac.contrib.Project, metaclass=_FlowProjectClass):
             _show_traceback_and_exit(error)
 
 
-def _execute_serialized_operation(loads, project, operation):
-    """Invoke the _execute_operation() method on a serialized project instance."""
-    project = loads(project)
+def _execute_serialized_operation(operation, cpus=None):
+    """Invoke the _execute_operation() method on the project instance of the worker process.
+
+    The worker process is bound to the given processors.
+    """
+    project = _SERIALIZED_PROJECT
+    if isinstance(project, Exception):
+        raise project
+    if cpus is not None:
+        os.sched_setaffinity(0, cpus)
     project._execute_operation(project._loads_op(operation))
 
 
+class _SubprocessExecutor(object):
+    """Launch and supervise shell commands from an event loop in a background thread.
+
+    The standard output and error of the commands are forwarded in blocks of
+    complete lines to sys.stdout and sys.stderr as they are written, such that
+    the output of concurrent commands is not interleaved within lines.
+    """
+
+    # The maximum number of bytes that are read from the output of a command at once.
+    _CHUNK_SIZE = 65536
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        if sys.version_info < (3, 8):
+            # The child watcher must be attached from the main thread.
+            asyncio.get_child_watcher().attach_loop(self._loop)
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._lock = threading.Lock()
+        self._tasks = set()     # Only accessed from the event loop.
+
+    def submit(self, cmd, env, cpus, timeout, callback, error_callback):
+        """Execute the shell command and invoke the callback once it is finished.
+
+        The error callback is invoked with a :class:`subprocess.TimeoutExpired`
+        error, if the command is not finished within the timeout, or with a
+        :class:`subprocess.CalledProcessError`, if it fails.
+        """
+        def _done(task):
+            self._tasks.discard(task)
+            if task.cancelled():
+                return
+            error = task.exception()
+            if error is None:
+                callback(task.result())
+            else:
+                error_callback(error)
+
+        def _create_task():
+            task = self._loop.create_task(self._run(cmd, env, cpus, timeout))
+            task.add_done_callback(_done)
+            self._tasks.add(task)
+
+        self._loop.call_soon_threadsafe(_create_task)
+
+    async def _forward(self, stream, name):
+        """Forward the output of the stream to sys.stdout or sys.stderr as it is written.
+
+        The output is read in chunks of up to 64 KiB and forwarded up to the
+        last complete line, the remainder is forwarded with the next chunk, or
+        at once, if it exceeds the chunk size. The output is written unchanged,
+        if the file has a binary buffer, and decoded otherwise. The stream is
+        always read to the end, even if the output cannot be forwarded, such
+        that the command never blocks on a full pipe.
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        forward = True
+        pending = b''
+        while True:
+            chunk = await stream.read(self._CHUNK_SIZE)
+            if chunk:
+                pending += chunk
+                end = pending.rfind(b'\n') + 1
+                if not end and len(pending) < self._CHUNK_SIZE:
+                    continue    # Wait for the end of the line.
+                data, pending = (pending[:end], pending[end:]) if end else (pending, b'')
+            else:
+                data, pending = pending, b''
+            if forward and data:
+                try:
+                    with self._lock:
+                        file = getattr(sys, name)
+                        if hasattr(file, 'buffer'):
+                            file.flush()
+                            file.buffer.write(data)
+                            file.buffer.flush()
+                        else:
+                            file.write(decoder.decode(data, final=not chunk))
+                            file.flush()
+                except Exception as error:
+                    logger.warning("Unable to forward the output of a command: {}".format(error))
+                    forward = False
+            if not chunk:
+                break
+
+    async def _run(self, cmd, env, cpus, timeout):
+        # The command is started in a new session, such that all of its processes are killed
+        # if it is cancelled.
+        process = await asyncio.create_subprocess_shell(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env,
+            start_new_session=True)
+        if cpus is not None:
+            try:
+                os.sched_setaffinity(process.pid, cpus)
+            except OSError:     # The process may already be finished.
+                pass
+        output = asyncio.gather(self._forward(process.stdout, 'stdout'),
+                                self._forward(process.stderr, 'stderr'))
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        finally:
+            if process.returncode is None:
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except (AttributeError, ProcessLookupError):
+                    process.kill()
+                await process.wait()
+            await output
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+
+    async def _cancel(self):
+        "Cancel all commands and wait until they are terminated."
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self):
+        "Cancel all commands that are still running and stop the event loop."
+        asyncio.run_coroutine_threadsafe(self._cancel(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class _LocalResources(object):
+    """Track the processors and memory available to operations executed in parallel.
+
+    The processors required by an operation are given by the product of the
+    ``np`` and ``processor_fraction`` directives and the required memory by the
+    ``memory`` directive; requirements that exceed the available resources are
+    reduced to them, such that every operation can be executed. The first
+    operation is always admitted if no resources are allocated. The resources
+    are accounted for exactly with fractions, such that they are fully available
+    again once all allocations are released.
+
+    Operations that require a whole number of processors are bound to distinct
+    processors, if the operating system supports it and the processors are not
+    oversubscribed. The ``OMP_NUM_THREADS`` environment variable is only set
+    from the ``omp_num_threads`` directive for operations that are executed in a
+    separate process, since it has no effect on a running worker process once
+    an OpenMP runtime is loaded.
+
+    :param processes:
+        The number of processors.
+    :type processes:
+        int
+    :param memory:
+        The available memory, by default the memory is not limited.
+    :type memory:
+        float
+    """
+
+    def __init__(self, processes, memory=None):
+        self.processors = processes
+        self.memory = None if memory is None else Fraction(memory)
+        self._free_processors = Fraction(processes)
+        self._free_memory = self.memory
+        self._num_allocations = 0
+        self._cpus = None
+        if hasattr(os, 'sched_getaffinity'):
+            cpus = sorted(os.sched_getaffinity(0))
+            if len(cpus) >= processes:
+                self._cpus = cpus[:processes]
+        self._free_cpus = list(self._cpus or ())
+
+    def requirements(self, operation):
+        "Return the number of processors and the memory required by the operation."
+        directives = operation.directives
+        processors = Fraction(directives.get('np', 1)) * \
+            Fraction(directives.get('processor_fraction', 1))
+        memory = Fraction(directives.get('memory') or 0)
+        if self.memory is not None:
+            memory = min(memory, self.memory)
+        return min(processors, self.processors), memory
+
+    def available(self):
+        "Return True if any processors are available."
+        return self._free_processors > 0
+
+    def acquire(self, operation):
+        """Allocate the resources required by the operation.
+
+        :returns:
+            The allocated processors, memory and processor ids or None, if the
+            required resources are not available.
+        """
+        processors, memory = self.requirements(operation)
+        if self._num_allocations:
+            if processors > self._free_processors:
+                return None
+            if self.memory is not None and memory > self._free_memory:
+                return None
+        self._num_allocations += 1
+        self._free_processors -= processors
+        if self.memory is not None:
+            self._free_memory -= memory
+        cpus = None
+        if self._cpus is not None and processors.denominator == 1 and processors > 0:
+            cpus = self._free_cpus[:int(processors)]
+            del self._free_cpus[:int(processors)]
+        return processors, memory, cpus
+
+    def release(self, allocation):
+        "Release the resources allocated with acquire()."
+        processors, memory, cpus = allocation
+        self._num_allocations -= 1
+        self._free_processors += processors
+        if self.memory is not None:
+            self._free_memory += memory
+        if cpus:
+            self._free_cpus.extend(cpus)
+
+    def task_args(self, operation, allocation):
+        """Return the processors the operation is bound to and the number of OpenMP threads.
+
+        Operations that are not bound to distinct processors may use all
+        processors. The number of OpenMP threads is None, unless it is provided
+        with the ``omp_num_threads`` directive.
+        """
+        processors, _, cpus = allocation
+        if cpus is None:
+            cpus = self._cpus
+        return cpus, operation.directives.get('omp_num_threads') or None
+
+
+# The project instance of a worker process, see FlowProject._map_in_processes()
+# and FlowProject._operation_pool(), the arguments of the evaluated method, and
+# the persistent caches opened by _evaluate_serialized_jobs().
+_SERIALIZED_PROJECT = None
+_SERIALIZED_ARGS = ()
+_SERIALIZED_CACHES = None
+
+
+def _init_serialized_project(loads, project, args=()):
+    """Deserialize the project instance once per worker process."""
+    global _SERIALIZED_PROJECT, _SERIALIZED_ARGS, _SERIALIZED_CACHES
+    _SERIALIZED_ARGS = args
+    _SERIALIZED_CACHES = None
+    try:
+        _SERIALIZED_PROJECT = loads(project)
+    except Exception as error:
+        # An exception raised by a pool initializer would respawn the worker indefinitely.
+        _SERIALIZED_PROJECT = FlowProject._PickleError(error)
+
+
+def _check_serialized_project():
+    """Raise the error of the worker process, if it failed to deserialize the project."""
+    if isinstance(_SERIALIZED_PROJECT, Exception):
+        raise _SERIALIZED_PROJECT
+
+
+def _evaluate_serialized_jobs(method, job_ids):
+    """Invoke the method on the project instance of the worker process for the given jobs.
+
+    The persistent caches are opened once per worker process, when the first
+    chunk of jobs is evaluated, and flushed after each chunk.
+    """
+    global _SERIALIZED_CACHES
+    project, args = _SERIALIZED_PROJECT, _SERIALIZED_ARGS
+    if isinstance(project, Exception):
+        raise project
+    if _SERIALIZED_CACHES is None:
+        # The caches are never closed, since all entries are flushed after each chunk.
+        _SERIALIZED_CACHES = project._open_persistent_caches()
+        _SERIALIZED_CACHES.__enter__()
+    jobs = [project.open_job(id=job_id) for job_id in job_ids]
+    try:
+        with project._condition_evaluation_pass():
+            return project._condition_cache.map(
+                lambda job: getattr(project, method)(job, *args), jobs)
+    finally:
+        project._flush_persistent_caches()
+
+
 # Status-related helper functions
 
 
+def _get_parameter(key, statepoint):
+    "Return the value of the (nested) key with dots as separators in statepoint or None."
+    if not isinstance(statepoint, dict):
+        return
+    t = key.split('.')
+    if len(t) > 1:
+        return _get_parameter('.'.join(t[1:]), statepoint.get(t[0]))
+    else:
+        return statepoint.get(key)
+
+
+def _z_score(confidence):
+    "Return the two-sided standard normal quantile for the confidence level."
+    low, high = 0.0, 40.0
+    for _ in range(100):  # bisection
+        z = (low + high) / 2
+        if math.erf(z / math.sqrt(2)) < confidence:
+            low = z
+        else:
+            high = z
+    return (low + high) / 2
+
+
+def _wilson_interval(count, size, z, population=None):
+    """Return the Wilson score interval of the proportion count/size.
+
+    If the size of the population is provided, the finite population
+    correction is applied, such that the interval vanishes if the sample
+    contains the whole population.
+    """
+    if size == 0:
+        return (0.0, 1.0)
+    if population is not None and population > 1:
+        z *= math.sqrt(max(population - size, 0) / (population - 1))
+    p = count / size
+    denominator = 1 + z**2 / size
+    center = (p + z**2 / (2 * size)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / size + z**2 / (4 * size**2)) / denominator
+    return (max(0.0, center - margin), min(1.0, center + margin))
+
+
+def _proportional_allocation(populations, size):
+    """Return the number of jobs sampled from each stratum for a sample of the given size.
+
+    The size is allocated in proportion to the populations of the strata with
+    the largest remainder method, such that the sizes add up exactly and
+    strata that are too small are not sampled at all.
+    """
+    total = sum(populations)
+    quotas = [size * population / total for population in populations]
+    sizes = [int(quota) for quota in quotas]
+    by_remainder = sorted(range(len(quotas)), key=lambda i: sizes[i] - quotas[i])
+    for i in by_remainder[:size - sum(sizes)]:
+        sizes[i] += 1
+    return sizes
+
+
+def _stratified_estimate(counts, sizes, populations, z):
+    """Return the estimated proportion and its interval from a stratified sample.
+
+    The proportions of the sampled strata are weighted by their share of the
+    population and the interval is the Wilson score interval for the
+    effective size of the stratified sample. Strata that were not sampled at
+    all widen the interval by their share of the population.
+    """
+    sampled = [i for i, size in enumerate(sizes) if size]
+    if not sampled:
+        return 0.0, (0.0, 1.0)
+    if len(sampled) == 1:
+        i = sampled[0]
+        proportion = counts[i] / sizes[i]
+        low, high = _wilson_interval(counts[i], sizes[i], z, populations[i])
+    else:
+        total = sum(populations[i] for i in sampled)
+        weights = {i: populations[i] / total for i in sampled}
+        proportion = sum(weights[i] * counts[i] / sizes[i] for i in sampled)
+        variance = sum(
+            weights[i]**2 * (1 - sizes[i] / populations[i])
+            * (counts[i] / sizes[i]) * (1 - counts[i] / sizes[i]) / sizes[i]
+            for i in sampled)
+        if variance > 0:
+            effective_size = proportion * (1 - proportion) / variance
+            low, high = _wilson_interval(proportion * effective_size, effective_size, z)
+        else:
+            # Every sampled stratum is either homogeneous or sampled completely.
+            size = sum(sizes[i] for i in sampled)
+            if size == total:
+                low = high = proportion
+            else:
+                low, high = _wilson_interval(proportion * size, size, z, total)
+    unsampled = sum(populations) - sum(populations[i] for i in sampled)
+    if unsampled:
+        share = 1 - unsampled / sum(populations)
+        low, high = share * low, min(1.0, share * high + 1 - share)
+    return proportion, (low, high)
+
+
+def _flatten_statepoint(statepoint, prefix=''):
+    "Yield the (nested) keys with dots as separators and the values of all parameters."
+    for key, value in statepoint.items():
+        if isinstance(value, dict) and value:
+            yield from _flatten_statepoint(value, prefix + key + '.')
+        else:
+            yield prefix + key, value
+
+
+def _varying_parameters(statepoints):
+    """Return the sorted (nested) keys of all parameters that vary across statepoints.
+
+    The state points are scanned in a single pass. Nested keys use dots as
+    separators, see :func:`_get_parameter`, and missing parameters are
+    considered to be None.
+    """
+    values = defaultdict(set)
+    counts = Counter()
+    num_statepoints = 0
+    for statepoint in statepoints:
+        num_statepoints += 1
+        for key, value in _flatten_statepoint(statepoint):
+            counts[key] += 1
+            if len(values[key]) < 2:    # Two distinct values suffice.
+                values[key].add(to_hashable(value))
+    varying = []
+    for key, key_values in values.items():
+        if counts[key] < num_statepoints:
+            key_values.add(None)
+        if len(key_values) > 1:
+            varying.append(key)
+    return sorted(varying)
+
+
+def _operation_status_symbols(pretty):
+    "Return the symbols denoting the execution status of operations."
+    if pretty:
+        # Pretty (unicode) symbols
+        return OrderedDict([
+            ('ineligible', '\u25cb'),   # open circle
+            ('eligible', '\u25cf'),     # black circle
+            ('active', '\u25b9'),       # open triangle
+            ('running', '\u25b8'),      # black triangle
+            ('completed', '\u2714'),    # check mark
+        ])
+    else:
+        return OrderedDict([
+            ('ineligible', '-'),
+            ('eligible', '+'),
+            ('active', '*'),
+            ('running', '>'),
+            ('completed', 'X')
+        ])
+
+
 _FMT_SCHEDULER_STATUS = {
     JobStatus.unknown: 'U',
     JobStatus.registered: 'R',
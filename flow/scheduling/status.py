@@ -1,7 +1,10 @@
 # Copyright (c) 2018 The Regents of the University of Michigan
 # All rights reserved.
 # This software is licensed under the BSD 3-Clause License.
+import os
+import sqlite3
 import logging
+import threading
 
 from .base import JobStatus
 
@@ -41,3 +44,54 @@ def update_status(job, scheduler_jobs=None):
             status_doc[scheduler_job_id] = int(status)
     # Write back to job document
     job.document['status'] = status_doc
+
+
+class _OperationStatusStore(object):
+    """Store the last known scheduler status of job-operations.
+
+    The status is stored per job-operation id in a database file, such that
+    the status of single operations is looked up without reading the status
+    of all other operations, and the status of many operations is updated
+    atomically within one transaction.
+
+    :param fn:
+        The path to the database file.
+    :type fn:
+        str
+    """
+
+    def __init__(self, fn):
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        self._connection = sqlite3.connect(fn, timeout=60, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS operations (id TEXT PRIMARY KEY, status INTEGER)')
+        self._lock = threading.Lock()
+
+    def get(self, operation_id):
+        """Return the status of the job-operation.
+
+        :raises KeyError:
+            If no status is stored for the job-operation.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT status FROM operations WHERE id=?', (operation_id, )).fetchone()
+        if row is None:
+            raise KeyError(operation_id)
+        return JobStatus(row[0])
+
+    def update(self, statuses):
+        "Store the status of all job-operations in the mapping of ids to status."
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO operations VALUES (?, ?)',
+                ((operation_id, int(status)) for operation_id, status in statuses.items()))
+
+    def as_dict(self):
+        "Return a dict that maps the ids of all job-operations to their status."
+        with self._lock:
+            return dict(self._connection.execute('SELECT id, status FROM operations'))
+
+    def close(self):
+        "Close the database connection."
+        self._connection.close()
@@ -0,0 +1,450 @@
+# Copyright (c) 2020 The Regents of the University of Michigan
+# All rights reserved.
+# This software is licensed under the BSD 3-Clause License.
+"""Persistent caching of job-specific results.
+
+Cached results are invalidated with a fingerprint of the job's state on disk,
+which is composed of the modification times of the job's workspace directory,
+state point file, and document file, as well as the sizes of the latter two.
+
+.. note::
+
+    Modifying files in-place or within sub-directories of a job's workspace does
+    not change the fingerprint. Conditions that depend on such files, or on any
+    data outside of the job's workspace, should not be cached persistently,
+    which is disabled with the ``cache`` argument of the condition decorators.
+"""
+import os
+import json
+import types
+import sqlite3
+import logging
+import threading
+from hashlib import sha1
+
+from signac.contrib.job import Job
+
+
+logger = logging.getLogger(__name__)
+
+
+def _job_fingerprint(job):
+    """Return a fingerprint of the job's state on disk.
+
+    :param job:
+        The signac job handle.
+    :type job:
+        :class:`~signac.contrib.job.Job`
+    :return:
+        The fingerprint or None, if the job's workspace does not exist.
+    :rtype:
+        str
+    """
+    workspace = job.workspace()
+    try:
+        parts = [os.stat(workspace).st_mtime_ns]
+    except FileNotFoundError:
+        return None
+    for fn in (Job.FN_MANIFEST, Job.FN_DOCUMENT):
+        try:
+            stat = os.stat(os.path.join(workspace, fn))
+        except FileNotFoundError:
+            parts.extend((None, None))
+        else:
+            parts.extend((stat.st_mtime_ns, stat.st_size))
+    return ':'.join(map(str, parts))
+
+
+_STABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def _stable_repr(obj):
+    """Return a representation of obj, which is stable across interpreter sessions.
+
+    Raises a TypeError if no stable representation can be determined, e.g., for
+    mutable objects, whose representation would depend on their current content.
+    """
+    if isinstance(obj, _STABLE_TYPES):
+        return repr(obj)
+    elif isinstance(obj, (tuple, frozenset)):
+        return '{}({})'.format(type(obj).__name__, ', '.join(map(_stable_repr, obj)))
+    elif callable(obj) and hasattr(obj, '__qualname__'):
+        return '{}.{}'.format(getattr(obj, '__module__', None), obj.__qualname__)
+    raise TypeError(obj)
+
+
+def _code_repr(code):
+    """Return a representation of the code object, which is stable across interpreter sessions.
+
+    The representation includes the source location, the bytecode, and the
+    constants of the code object, such that functions that only differ in
+    their constants or are defined at different locations are distinguished.
+    """
+    consts = [_code_repr(const) if hasattr(const, 'co_code') else _stable_repr(const)
+              for const in code.co_consts]
+    return repr((code.co_filename, code.co_firstlineno, code.co_code, consts))
+
+
+def _code_names(code):
+    "Return the names referred to by the code object and all nested code objects."
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            names.update(_code_names(const))
+    return names
+
+
+def _value_repr(value, seen):
+    "Return a stable representation of a value that a function refers to."
+    if isinstance(value, types.ModuleType):
+        return 'module {}'.format(value.__name__)
+    elif isinstance(value, (types.FunctionType, types.MethodType)):
+        return _function_repr(value, seen)
+    return _stable_repr(value)
+
+
+def _function_repr(func, seen=None):
+    """Return a representation of the function, which is stable across interpreter sessions.
+
+    The representation includes the function's code (source location, bytecode
+    and constants), its default arguments, the values captured within its
+    closure, and the values of the global variables it refers to. Functions
+    referred to by any of these are represented recursively.
+
+    Raises a TypeError or ValueError (empty closure cell) if no stable
+    representation can be determined, e.g., for functions that refer to
+    mutable objects.
+    """
+    func = getattr(func, '__func__', func)  # bound methods
+    code = getattr(func, '__code__', None)
+    if seen is None:
+        seen = set()
+    if code is None or id(func) in seen:
+        return _stable_repr(func)
+    seen.add(id(func))
+    global_vars = getattr(func, '__globals__', dict())
+    kwdefaults = getattr(func, '__kwdefaults__', None) or dict()
+    return repr((
+        _stable_repr(func), _code_repr(code),
+        [_value_repr(cell.cell_contents, seen) for cell in func.__closure__ or ()],
+        [_value_repr(value, seen) for value in func.__defaults__ or ()],
+        [(key, _value_repr(value, seen)) for key, value in sorted(kwdefaults.items())],
+        [(name, _value_repr(global_vars[name], seen))
+         for name in sorted(_code_names(code)) if name in global_vars]))
+
+
+def _function_key(func):
+    """Return a key that identifies the function across interpreter sessions.
+
+    Returns None for functions that cannot be identified reliably, see
+    :func:`_function_repr`.
+    """
+    try:
+        desc = _function_repr(func)
+    except (ValueError, TypeError):  # empty cell or no stable representation
+        return None
+    return sha1(desc.encode('utf-8')).hexdigest()
+
+
+def _condition_key(condition):
+    """Return a key that identifies the condition across interpreter sessions.
+
+    The key is derived from the condition's tag and the representation of the
+    condition function, see :func:`_function_repr`, which covers the batch
+    function of batch conditions. Returns None for conditions that cannot be
+    identified reliably, e.g., conditions that refer to mutable objects, and
+    for conditions that must not be cached persistently, which are then never
+    cached persistently.
+    """
+    if getattr(condition, '__name__', None) == '_flow_metacondition':
+        return None     # Metaconditions are evaluated from their (cached) components.
+    if not getattr(condition, '_flow_cache', True):
+        return None
+    tag = getattr(condition, '_flow_tag', None)
+    if tag is None:
+        return None
+    try:
+        desc = repr((tag, _function_repr(condition)))
+    except (ValueError, TypeError):  # empty cell or no stable representation
+        return None
+    return sha1(desc.encode('utf-8')).hexdigest()
+
+
+class _PersistentConditionCache(object):
+    """Cache condition results on disk, keyed by job id and condition.
+
+    All results stored for one job are invalidated as soon as the job's
+    fingerprint changes, see :func:`_job_fingerprint`. Results are read
+    lazily and written back in bulk with :meth:`flush`.
+
+    :param fn:
+        The path to the cache database file.
+    :type fn:
+        str
+    """
+
+    def __init__(self, fn):
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        self._connection = sqlite3.connect(fn, timeout=60, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS conditions '
+            '(job_id TEXT PRIMARY KEY, fingerprint TEXT, results TEXT)')
+        self._lock = threading.Lock()
+        self._keys = dict()
+        self._entries = dict()
+        self._modified = set()
+
+    def _get_key(self, condition):
+        try:
+            return self._keys[id(condition)]
+        except KeyError:
+            key = self._keys[id(condition)] = _condition_key(condition)
+            return key
+
+    def _get_results(self, job):
+        "Return the dict of valid results for job, or None if the job cannot be cached."
+        try:
+            return self._entries[job._id]
+        except KeyError:
+            pass
+        fingerprint = _job_fingerprint(job)
+        if fingerprint is None:
+            results = None
+        else:
+            with self._lock:
+                row = self._connection.execute(
+                    'SELECT fingerprint, results FROM conditions WHERE job_id=?',
+                    (job._id, )).fetchone()
+            if row is not None and row[0] == fingerprint:
+                results = json.loads(row[1])
+            else:
+                results = dict()
+            results = _FingerprintedDict(fingerprint, results)
+        self._entries[job._id] = results
+        return results
+
+    def lookup(self, condition, job):
+        """Return the cached result of ``condition(job)``.
+
+        :raises KeyError:
+            If no valid result is cached.
+        """
+        key = self._get_key(condition)
+        results = None if key is None else self._get_results(job)
+        if results is None:
+            raise KeyError(condition)
+        return results[key]
+
+    def store(self, condition, job, result):
+        "Cache the result of ``condition(job)``, if possible."
+        key = self._get_key(condition)
+        results = None if key is None else self._get_results(job)
+        if results is not None:
+            # Label functions may return strings.
+            results[key] = result if isinstance(result, str) else bool(result)
+            self._modified.add(job._id)
+
+    def evaluate(self, condition, job):
+        "Return the (possibly cached) result of ``condition(job)``."
+        try:
+            return self.lookup(condition, job)
+        except KeyError:
+            result = condition(job)
+            self.store(condition, job, result)
+            return result
+
+    def refresh(self, job):
+        """Discard the results of job, if the job was modified since they were read.
+
+        The results of all other jobs are kept, such that the cache can remain
+        open while jobs are modified.
+        """
+        try:
+            results = self._entries[job._id]
+        except KeyError:
+            return
+        fingerprint = None if results is None else results.fingerprint
+        if fingerprint != _job_fingerprint(job):
+            del self._entries[job._id]
+            self._modified.discard(job._id)
+
+    def flush(self):
+        "Write all modified results to disk."
+        rows = [(job_id, self._entries[job_id].fingerprint, json.dumps(self._entries[job_id]))
+                for job_id in self._modified]
+        if rows:
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    'INSERT OR REPLACE INTO conditions VALUES (?, ?, ?)', rows)
+            logger.debug("Stored condition results for {} job(s).".format(len(rows)))
+        self._modified.clear()
+
+    def close(self):
+        "Flush all modified results and close the database connection."
+        try:
+            self.flush()
+        finally:
+            self._connection.close()
+
+
+class _FingerprintedDict(dict):
+    "A dict, which keeps track of the fingerprint its content is valid for."
+
+    def __init__(self, fingerprint, *args, **kwargs):
+        self.fingerprint = fingerprint
+        super(_FingerprintedDict, self).__init__(*args, **kwargs)
+
+
+class _JobTable(object):
+    """Store one value per job, which is valid as long as the job is unmodified.
+
+    A value is only valid as long as the job's fingerprint, see
+    :func:`_job_fingerprint`, and the workflow key are unchanged. All entries
+    are read when the table is opened and changes are written back in bulk
+    with :meth:`flush`. No values are stored or returned if the workflow key
+    is None, i.e., if the workflow cannot be identified reliably.
+
+    :param fn:
+        The path to the database file.
+    :type fn:
+        str
+    :param table:
+        The name of the database table.
+    :type table:
+        str
+    :param workflow_key:
+        A key that identifies the workflow, entries stored for any other
+        workflow are ignored.
+    :type workflow_key:
+        str or None
+    """
+
+    def __init__(self, fn, table, workflow_key):
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        self._connection = sqlite3.connect(fn, timeout=60, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS {} '
+            '(job_id TEXT PRIMARY KEY, fingerprint TEXT, value TEXT)'.format(table))
+        self._table = table
+        self._workflow_key = workflow_key
+        if workflow_key is None:
+            self._entries = dict()
+        else:
+            self._entries = {job_id: (fingerprint, value) for job_id, fingerprint, value in
+                             self._connection.execute('SELECT * FROM {}'.format(table))}
+        self._modified = set()
+
+    def _fingerprint(self, job):
+        if self._workflow_key is None:
+            return None
+        fingerprint = _job_fingerprint(job)
+        if fingerprint is not None:
+            return '{}:{}'.format(self._workflow_key, fingerprint)
+
+    def get(self, job):
+        """Return the value stored for job.
+
+        :raises KeyError:
+            If no value is stored or the job has been modified since.
+        """
+        fingerprint, value = self._entries[job._id]
+        if fingerprint != self._fingerprint(job):
+            raise KeyError(job._id)
+        return value
+
+    def set(self, job, value):
+        "Store the value for job, if the job's workspace exists."
+        fingerprint = self._fingerprint(job)
+        if fingerprint is not None and self._entries.get(job._id) != (fingerprint, value):
+            self._entries[job._id] = fingerprint, value
+            self._modified.add(job._id)
+
+    def discard(self, job_id):
+        "Remove the entry for the job id, if present."
+        if self._entries.pop(job_id, None) is not None:
+            self._modified.add(job_id)
+
+    def job_ids(self):
+        "Return the ids of all jobs with an entry."
+        return set(self._entries)
+
+    def flush(self):
+        "Write all modified entries to disk."
+        if self._modified:
+            inserted = [(job_id, ) + self._entries[job_id]
+                        for job_id in self._modified if job_id in self._entries]
+            deleted = [(job_id, ) for job_id in self._modified if job_id not in self._entries]
+            with self._connection:
+                self._connection.executemany(
+                    'INSERT OR REPLACE INTO {} VALUES (?, ?, ?)'.format(self._table), inserted)
+                self._connection.executemany(
+                    'DELETE FROM {} WHERE job_id=?'.format(self._table), deleted)
+            logger.debug("Updated {} entries of table '{}'.".format(
+                len(self._modified), self._table))
+        self._modified.clear()
+
+    def close(self):
+        "Flush all modified entries and close the database connection."
+        try:
+            self.flush()
+        finally:
+            self._connection.close()
+
+
+class _CompletionLedger(_JobTable):
+    """Keep track of jobs for which all operations are complete.
+
+    :param fn:
+        The path to the ledger database file.
+    :type fn:
+        str
+    :param workflow_key:
+        A key that identifies the workflow, see :class:`_JobTable`.
+    :type workflow_key:
+        str
+    """
+
+    def __init__(self, fn, workflow_key):
+        super(_CompletionLedger, self).__init__(fn, 'completed', workflow_key)
+
+    def is_complete(self, job):
+        "Return True if the job is recorded as complete and has not been modified since."
+        try:
+            self.get(job)
+        except KeyError:
+            return False
+        return True
+
+    def record(self, job):
+        "Record the job as complete."
+        self.set(job, None)
+
+    def discard(self, job):
+        "Remove the job from the ledger, if present."
+        super(_CompletionLedger, self).discard(job._id)
+
+
+class _StatusSnapshot(_JobTable):
+    """Persist the status records of jobs.
+
+    The records are stored in JSON format, see
+    :meth:`~flow.FlowProject._fetch_status`.
+
+    :param fn:
+        The path to the snapshot database file.
+    :type fn:
+        str
+    :param workflow_key:
+        A key that identifies the workflow, see :class:`_JobTable`.
+    :type workflow_key:
+        str
+    """
+
+    def __init__(self, fn, workflow_key):
+        super(_StatusSnapshot, self).__init__(fn, 'status', workflow_key)
+
+    def get(self, job):
+        return json.loads(super(_StatusSnapshot, self).get(job))
+
+    def set(self, job, record):
+        super(_StatusSnapshot, self).set(job, json.dumps(record))
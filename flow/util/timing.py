@@ -0,0 +1,99 @@
+# Copyright (c) 2020 The Regents of the University of Michigan
+# All rights reserved.
+# This software is licensed under the BSD 3-Clause License.
+"""Collect the evaluation times of user-defined workflow functions.
+
+The evaluation times of conditions, labels, and the commands and directives
+of operations are collected per function, see
+:meth:`~flow.FlowProject.collect_timings`.
+"""
+import json
+import time
+import threading
+import contextlib
+from collections import defaultdict
+
+
+class Timings(object):
+    """Aggregate the evaluation times of workflow functions.
+
+    Instances of this class are created with :meth:`~flow.FlowProject.collect_timings`.
+    Times are recorded per category (``'condition'``, ``'label'``, ``'command'``,
+    or ``'directives'``) and per function name.
+    """
+
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self):
+        self._durations = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def record(self, category, name, duration):
+        "Record the duration (in seconds) of one evaluation."
+        with self._lock:
+            self._durations[(category, name)].append(duration)
+
+    @contextlib.contextmanager
+    def measure(self, category, name):
+        "Record the duration of the evaluation within this context."
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, time.perf_counter() - start)
+
+    @staticmethod
+    def _percentile(durations, p):
+        "Return the p-th percentile of the sorted durations (nearest-rank method)."
+        rank = max(1, -(-p * len(durations) // 100))
+        return durations[rank - 1]
+
+    def report(self):
+        """Return the aggregated timings sorted by the total time in descending order.
+
+        :return:
+            A list of dicts with the keys ``'category'``, ``'name'``, ``'count'``,
+            ``'total'``, ``'mean'``, ``'max'``, and one key per percentile,
+            e.g., ``'p90'``. All times are in seconds.
+        :rtype:
+            list
+        """
+        with self._lock:
+            items = [(key, sorted(durations)) for key, durations in self._durations.items()]
+        result = []
+        for (category, name), durations in items:
+            total = sum(durations)
+            entry = {
+                'category': category,
+                'name': name,
+                'count': len(durations),
+                'total': total,
+                'mean': total / len(durations),
+                'max': durations[-1],
+            }
+            for p in self.PERCENTILES:
+                entry['p{}'.format(p)] = self._percentile(durations, p)
+            result.append(entry)
+        return sorted(result, key=lambda entry: entry['total'], reverse=True)
+
+    def to_json(self, **kwargs):
+        "Return the report in JSON format, see :meth:`report`."
+        return json.dumps(self.report(), **kwargs)
+
+    def format_table(self, max_lines=None):
+        "Return the report formatted as table, see :meth:`report`."
+        report = self.report()
+        columns = ['total', 'mean'] + ['p{}'.format(p) for p in self.PERCENTILES] + ['max']
+        width_name = max([len(entry['name']) for entry in report] + [len('Name')])
+        lines = [
+            '{:<10} {:<{}} {:>8} '.format('Category', 'Name', width_name, 'Count')
+            + ' '.join('{:>10}'.format(column.capitalize() + '/s') for column in columns)]
+        lines.append('-' * len(lines[0]))
+        for entry in report[:max_lines]:
+            lines.append(
+                '{:<10} {:<{}} {:>8} '.format(
+                    entry['category'], entry['name'], width_name, entry['count'])
+                + ' '.join('{:>10.4g}'.format(entry[column]) for column in columns))
+        if max_lines is not None and len(report) > max_lines:
+            lines.append('[{} more entries omitted]'.format(len(report) - max_lines))
+        return '\n'.join(lines)
@@ -2,19 +2,27 @@
 # All rights reserved.
 # This software is licensed under the BSD 3-Clause License.
 import unittest
+import unittest.mock
 import logging
 import uuid
 import os
 import sys
+import csv
+import json
 import inspect
 import subprocess
 import tempfile
+import threading
+import time
 from contextlib import contextmanager, redirect_stdout, redirect_stderr
 from distutils.version import StrictVersion
 from io import StringIO
+from queue import Queue
 from itertools import groupby
 from tempfile import TemporaryDirectory
 from functools import partial
+from collections import defaultdict
+from collections import Counter
 
 import signac
 import flow
@@ -22,7 +30,17 @@ from flow import FlowProject, cmd, with_job, directives
 from flow.scheduling.base import Scheduler
 from flow.scheduling.base import ClusterJob
 from flow.scheduling.base import JobStatus
+from flow.project import JobOperation
+from flow.project import _condition
+from flow.project import _condition_name
+from flow.project import _LocalResources
+from flow.project import _SubprocessExecutor
+from flow.project import _varying_parameters
+from flow.project import _wilson_interval
+from flow.project import _z_score
 from flow.environment import ComputeEnvironment
+from flow.errors import UserConditionError
+from flow.util.cache import _condition_key
 from flow.util.misc import add_path_to_environment_pythonpath
 from flow.util.misc import add_cwd_to_environment_pythonpath
 from flow.util.misc import switch_to_directory
@@ -43,6 +61,17 @@ def suspend_logging():
         logging.disable(logging.NOTSET)
 
 
+def _fail_to_deserialize(data):
+    raise ValueError("Unable to deserialize the project.")
+
+
+_THRESHOLD = 1
+
+
+def _above_threshold(job):
+    return job.sp.get('b', 0) > _THRESHOLD
+
+
 class MockScheduler(Scheduler):
     _jobs = {}  # needs to be singleton
     _scripts = {}
@@ -507,6 +536,538 @@ class ProjectClassTest(BaseProjectTest):
             self.assertTrue(job.doc.b)
             self.assertTrue(job.doc.c)
 
+    def test_condition_evaluation_cached_within_pass(self):
+        evaluations = defaultdict(int)
+
+        def op1_complete(job):
+            evaluations[job.get_id()] += 1
+            return 'a' in job.doc
+
+        class A(FlowProject):
+            pass
+
+        @A.operation
+        @A.post(op1_complete)
+        def op1(job):
+            job.doc.a = True
+
+        @A.operation
+        @A.pre.after(op1)
+        @A.post.true('b')
+        def op2(job):
+            job.doc.b = True
+
+        @A.operation
+        @A.pre.after(op1)
+        @A.post.true('c')
+        def op3(job):
+            job.doc.c = True
+
+        project = self.mock_project(project_class=A)
+        project._fetch_status(project, StringIO(), ignore_errors=False, no_parallelize=True)
+        self.assertEqual(set(evaluations.values()), {1})
+
+        evaluations.clear()
+        project.run(names=['op1'])
+        for job in project:
+            self.assertTrue(job.doc.a)
+        # Each pass evaluates the condition once; the second pass finds no pending operations.
+        self.assertEqual(set(evaluations.values()), {2})
+
+        # Only actual evaluations contribute to the evaluation statistics.
+        op1_ = project.operations['op1']
+        condition = op1_._postconds[0]
+        num_evaluations = condition._num_evaluations
+        with project._condition_evaluation_pass():
+            for job in project:
+                self.assertTrue(op1_.complete(job))
+                self.assertTrue(op1_.complete(job))
+        self.assertEqual(condition._num_evaluations - num_evaluations, len(project))
+
+    def test_condition_names(self):
+        conditions = [
+            lambda job: True,
+            lambda job: True]
+        names = [_condition_name(condition) for condition in conditions]
+        self.assertNotEqual(names[0], names[1])
+        for name in names:
+            self.assertIn('<lambda> ({}:'.format(__file__), name)
+
+    def test_persistent_condition_cache(self):
+
+        def op1_complete(job):
+            # Not captured in the closure, which would prevent persistent caching.
+            op1_complete.evaluations[job.get_id()] += 1
+            return 'a' in job.doc
+
+        evaluations = op1_complete.evaluations = defaultdict(int)
+
+        class A(FlowProject):
+            pass
+
+        @A.operation
+        @A.post(op1_complete)
+        def op1(job):
+            job.doc.a = True
+
+        @A.operation
+        @A.pre.after(op1)
+        @A.post.isfile('b.txt')
+        def op2(job):
+            with open(job.fn('b.txt'), 'w'):
+                pass
+
+        project = self.mock_project(project_class=A)
+        project._use_condition_cache = True
+        fetch_status = partial(project._fetch_status, project, StringIO(),
+                               ignore_errors=False, no_parallelize=True)
+        statuses = fetch_status()
+        self.assertEqual(len(evaluations), len(project))
+        self.assertEqual(fetch_status(), statuses)
+        self.assertEqual(len(evaluations), len(project))
+        self.assertEqual(set(evaluations.values()), {1})
+
+        # Only the modified job is re-evaluated.
+        job = next(iter(project))
+        job.doc.a = True
+        fetch_status()
+        self.assertEqual(evaluations[job.get_id()], 2)
+        self.assertEqual(sum(evaluations.values()), len(project) + 1)
+
+        project.run()
+        for job in project:
+            self.assertTrue(job.isfile('b.txt'))
+            self.assertFalse(project.operations['op2'].eligible(job))
+
+    def test_persistent_condition_cache_key(self):
+        # Conditions that only differ in constants or location are distinguished.
+        first, second = lambda job: job.isfile('a'), lambda job: job.isfile('b')  # noqa: E731
+        third = lambda job: job.isfile('a')  # noqa: E731
+
+        def with_default(job, name='a'):
+            return job.isfile(name)
+        conditions = [first, second, third, with_default]
+        for condition in conditions:
+            _condition(condition)
+        keys = [_condition_key(condition) for condition in conditions]
+        self.assertNotIn(None, keys)
+        self.assertEqual(len(set(keys)), len(keys))
+        with_default.__defaults__ = ('b', )
+        self.assertNotEqual(_condition_key(with_default), keys[-1])
+
+    def test_persistent_condition_cache_key_globals(self):
+        # Conditions are distinguished by the values of the global variables they refer to.
+        condition = _condition(lambda job: _above_threshold(job)).condition
+        key = _condition_key(condition)
+        self.assertIsNotNone(key)
+        with unittest.mock.patch.object(sys.modules[__name__], '_THRESHOLD', 2):
+            self.assertNotEqual(_condition_key(condition), key)
+        self.assertEqual(_condition_key(condition), key)
+        # Conditions that refer to mutable objects are not cached persistently.
+        with unittest.mock.patch.object(sys.modules[__name__], '_THRESHOLD', [1]):
+            self.assertIsNone(_condition_key(condition))
+        # The caching may be disabled explicitly.
+        self.assertIsNone(_condition_key(_condition(lambda job: True, cache=False).condition))
+        self.assertIsNotNone(_condition_key(_condition.isfile('a.txt').condition))
+        self.assertIsNone(_condition_key(
+            _condition.isfile(os.path.join('out', 'a.txt')).condition))
+
+    def test_adaptive_condition_order(self):
+        evaluations = defaultdict(int)
+
+        def expensive(job):
+            evaluations['expensive'] += 1
+            time.sleep(0.001)
+            return True
+
+        def cheap(job):
+            evaluations['cheap'] += 1
+            return False
+
+        class A(FlowProject):
+            pass
+
+        @A.operation
+        @A.post(expensive)
+        @A.post(cheap)
+        def op1(job):
+            pass
+
+        project = self.mock_project(project_class=A)
+        op1_ = project.operations['op1']
+        for adaptive in (False, True):
+            evaluations.clear()
+            op1_._adaptive_condition_order = adaptive
+            for job in project:
+                self.assertTrue(op1_.eligible(job))
+                self.assertFalse(op1_.complete(job))
+            self.assertEqual(evaluations['cheap'], 2 * len(project))
+            if adaptive:
+                self.assertLessEqual(evaluations['expensive'], 1)
+            else:
+                self.assertEqual(evaluations['expensive'], 2 * len(project))
+
+    def test_adaptive_condition_order_dependent(self):
+        # The check must only be evaluated after the guard.
+        def guard(job):
+            return 'x' in job.doc
+
+        def check(job):
+            return job.doc['x'] > 0
+
+        class A(FlowProject):
+            pass
+
+        @A.operation
+        @A.pre(guard)
+        @A.pre(check)
+        def op1(job):
+            pass
+
+        project = self.mock_project(project_class=A)
+        op1_ = project.operations['op1']
+        op1_._adaptive_condition_order = True
+        # The guard appears to be expensive and is therefore ranked last.
+        for cond in op1_._prereqs:
+            if cond._callback is guard:
+                cond._num_evaluations, cond._total_time = 1, 1.0
+        for job in project:
+            self.assertFalse(op1_.eligible(job))
+        self.assertFalse(op1_._adaptive_condition_order)
+        job.doc.x = 1
+        self.assertTrue(op1_.eligible(job))
+
+    def test_batch_conditions(self):
+        num_calls = defaultdict(int)
+
+        def has_a(jobs):
+            num_calls['has_a'] += 1
+            num_calls['has_a_jobs'] += len(jobs)
+            return [job.doc.get('a', False) for job in jobs]
+
+        class A(FlowProject):
+            pass
+
+        @A.operation
+        @A.pre.batch(lambda jobs: [job.sp.b % 2 == 0 for job in jobs])
+        @A.post.batch(has_a)
+        def op1(job):
+            job.doc.a = True
+
+        @A.operation
+        @A.pre.after(op1)
+        @A.post.true('b')
+        def op2(job):
+            job.doc.b = True
+
+        project = self.mock_project(project_class=A)
+        even_jobs = [job for job in project if job.sp.b % 2 == 0]
+        statuses = project._fetch_status(project, StringIO(), ignore_errors=False,
+                                         no_parallelize=False)
+        self.assertEqual(num_calls['has_a'], 1)
+
+        # Only jobs that satisfy the pre-condition reach the post-condition.
+        num_calls.clear()
+        with project._condition_evaluation_pass():
+            eligible = project._condition_cache.map(project.operations['op1'].eligible, project)
+        self.assertEqual(sum(eligible), len(even_jobs))
+        self.assertEqual(num_calls['has_a'], 1)
+        self.assertEqual(num_calls['has_a_jobs'], len(even_jobs))
+        for status in statuses:
+            job = project.open_job(id=status['job_id'])
+            self.assertEqual(status['operations']['op1']['eligible'], job in even_jobs)
+            self.assertFalse(status['operations']['op2']['eligible'])
+
+        project.run()
+        for job in project:
+            self.assertEqual(job.doc.get('a', False), job in even_jobs)
+            self.assertEqual(job.doc.get('b', False), job in even_jobs)
+
+        # Outside of an evaluation pass, batch conditions are evaluated per job.
+        num_calls.clear()
+        for job in project:
+            self.assertFalse(project.operations['op1'].eligible(job))
+        self.assertEqual(num_calls['has_a'], len(even_jobs))
+
+    def test_builtin_conditions(self):
+
+        class A(FlowProject):
+            pass
+
+        @A.operation
+        @A.pre.doc_query({'a': {'$gt': 1}})
+        @A.post.isfile('out/a.txt')
+        @A.post.isfile('a.txt')
+        def op1(job):
+            os.makedirs(job.fn('out'), exist_ok=True)
+            for fn in ('a.txt', 'out/a.txt'):
+                with open(job.fn(fn), 'w'):
+                    pass
+
+        @A.operation
+        @A.pre.after(op1)
+        @A.pre.false('b')
+        @A.post.true('b')
+        def op2(job):
+            job.doc.b = True
+
+        project = self.mock_project(project_class=A)
+        for job in project:
+            job.doc.a = job.sp.b
+        project.run()
+        for job in project:
+            selected = job.sp.b > 1
+            self.assertEqual(job.isfile('a.txt'), selected)
+            self.assertEqual(job.isfile('out/a.txt'), selected)
+            self.assertEqual(job.doc.get('b', False), selected)
+
+        with project._condition_evaluation_pass():
+            for job in project:
+                self.assertEqual(project.operations['op1'].complete(job), job.sp.b > 1)
+                self.assertEqual(project.operations['op2'].complete(job), job.sp.b > 1)
+            # Each document is read and each workspace is listed at most once.
+            memo = Counter(kind for kind, _ in project._condition_cache._memo)
+            self.assertEqual(memo['document'], len(project))
+            self.assertEqual(memo['workspace_files'], len([j for j in project if j.sp.b > 1]))
+
+    def test_document_conditions(self):
+        true, false = _condition.true('k').condition, _condition.false('k').condition
+        values = [True, 1, 2.5, 'x', [1], False, 0, 0.0, None, '', []]
+        project = self.mock_project(project_class=FlowProject)
+        jobs = list(project)[:len(values) + 1]     # The last job has no value.
+        for job, value in zip(jobs, values):
+            job.doc.k = value
+        for job in jobs:
+            expected = bool(job.doc.get('k', False))
+            self.assertEqual(true(job), expected)
+            self.assertEqual(false(job), not expected)
+        with project._condition_evaluation_pass():
+            self.assertEqual(project._condition_cache.map(true, jobs),
+                             [bool(job.doc.get('k', False)) for job in jobs])
+
+    def test_label_functions(self):
+
+        class A(FlowProject):
+
+            @flow.label()
+            def bound_label(self, job):
+                return job.sp.b == 0
+
+            @flow.staticlabel()
+            def static_label(job):
+                return job.sp.b == 1
+
+        calls = Counter()
+
+        @A.label
+        def even(job):
+            calls['even'] += 1
+            return job.sp.b % 2 == 0
+
+        @A.label('named')
+        def project_label(project, job):
+            return project.open_job(id=job.id) == job
+
+        @A.label(batch=True)
+        def batch_label(jobs):
+            calls['batch'] += 1
+            return ['b{}'.format(job.sp.b) for job in jobs]
+
+        @A.operation
+        @A.pre(even)
+        def op1(job):
+            pass
+
+        project = self.mock_project(project_class=A)
+        with project.collect_timings() as timings, project._condition_evaluation_pass():
+            statuses = project._condition_cache.map(project.get_job_status, project)
+        self.assertEqual(calls, {'even': len(project), 'batch': 1})
+        # Labels are only timed when evaluated, batch labels once per batch.
+        report = {(entry['category'], entry['name']): entry['count']
+                  for entry in timings.report()}
+        self.assertEqual(report[('label', 'named')], len(project))
+        self.assertEqual(report[('label', 'batch_label')], 1)
+        self.assertNotIn(('label', 'even'), report)
+        for job, status in zip(project, statuses):
+            expected = {'named', 'b{}'.format(job.sp.b)}
+            if job.sp.b % 2 == 0:
+                expected.add('even')
+            if job.sp.b == 0:
+                expected.add('bound_label')
+            if job.sp.b == 1:
+                expected.add('static_label')
+            self.assertEqual(set(status['labels']), expected)
+            self.assertEqual(status['operations']['op1']['eligible'], job.sp.b % 2 == 0)
+
+    def test_topological_condition_evaluation(self):
+
+        class A(FlowProject):
+            pass
+
+        @A.post.true('a')
+        def op1(job):
+            job.doc.a = True
+
+        def expensive(job):
+            expensive.evaluations += 1
+            return True
+
+        expensive.evaluations = 0
+
+        # The downstream operation is declared first.
+        @A.operation
+        @A.pre(expensive)
+        @A.pre.after(op1)
+        @A.post.true('b')
+        def op2(job):
+            job.doc.b = True
+
+        A.operation(op1)
+
+        project = self.mock_project(project_class=A)
+        self.assertEqual(project._operation_evaluation_order(), ['op1', 'op2'])
+        status = project._fetch_status(project, StringIO(), ignore_errors=False,
+                                       no_parallelize=True)
+        self.assertEqual(expensive.evaluations, 0)
+        for job_status in status:
+            self.assertTrue(job_status['operations']['op1']['eligible'])
+            self.assertFalse(job_status['operations']['op2']['eligible'])
+            self.assertEqual(list(job_status['operations']), ['op2', 'op1'])
+
+        job = next(iter(project))
+        job.doc.a = True
+        with project._condition_evaluation_pass():
+            self.assertEqual([op.name for op in project.next_operations(job)], ['op2'])
+        self.assertEqual(expensive.evaluations, 1)
+
+    def test_completion_ledger(self):
+
+        class A(FlowProject):
+            pass
+
+        def op1_complete(job):
+            op1_complete.evaluations += 1
+            return job.doc.get('op1', False)
+
+        op1_complete.evaluations = 0
+
+        @A.operation
+        @A.post(op1_complete)
+        def op1(job):
+            job.doc.op1 = True
+
+        project = self.mock_project(project_class=A)
+        project._use_completion_ledger = True
+
+        def fetch_status():
+            return project._fetch_status(project, StringIO(), ignore_errors=False,
+                                         no_parallelize=True)
+
+        with redirect_stderr(StringIO()):
+            project.run()
+        self.assertEqual(op1_complete.evaluations, 2 * len(project))
+        op1_complete.evaluations = 0
+        with redirect_stderr(StringIO()):
+            project.run()
+        for status in fetch_status():
+            self.assertTrue(status['operations']['op1']['completed'])
+        self.assertEqual(op1_complete.evaluations, 0)
+
+        # Modified jobs are evaluated again.
+        job = next(iter(project))
+        job.doc.op1 = False
+        for status in fetch_status():
+            self.assertEqual(status['operations']['op1']['completed'], status['job_id'] != job.id)
+        self.assertEqual(op1_complete.evaluations, 1)
+
+        op1_complete.evaluations = 0
+        project._revalidate_completion_ledger = True
+        fetch_status()
+        self.assertEqual(op1_complete.evaluations, len(project))
+
+    def test_completion_ledger_key(self):
+
+        class A(FlowProject):
+            pass
+
+        @A.operation
+        @A.post(_above_threshold)
+        def op1(job):
+            pass
+
+        class B(A):
+            pass
+
+        @B.operation
+        @B.post(lambda job: True, cache=False)
+        def op2(job):
+            pass
+
+        project = self.mock_project(project_class=A)
+        key = project._completion_ledger_key()
+        self.assertIsNotNone(key)
+        with unittest.mock.patch.object(sys.modules[__name__], '_THRESHOLD', 2):
+            self.assertNotEqual(project._completion_ledger_key(), key)
+
+        # Jobs are not recorded for post-conditions that are not cached persistently.
+        project = B.get_project(root=project.root_directory())
+        project._use_completion_ledger = True
+        self.assertIsNone(project._completion_ledger_key())
+        project._fetch_status(project, StringIO(), ignore_errors=False, no_parallelize=True)
+        with project._open_persistent_caches():
+            self.assertFalse(any(project._is_recorded_complete(job) for job in project))
+
+    def test_lazy_job_operations(self):
+        evaluated = Counter()
+
+        def np(job):
+            evaluated['directives'] += 1
+            return 2
+
+        class A(FlowProject):
+            pass
+
+        @A.operation
+        @flow.cmd
+        @flow.directives(np=np)
+        def op1(job):
+            evaluated['cmd'] += 1
+            return 'echo {job._id}'
+
+        project = self.mock_project(project_class=A)
+        project._fetch_status(project, StringIO(), ignore_errors=False, no_parallelize=True)
+        operations = list(project.next_operations(*project))
+        self.assertEqual(len(operations), len(project))
+        self.assertEqual(sum(evaluated.values()), 0)
+        for operation in operations:
+            self.assertEqual(operation.cmd, 'echo {}'.format(operation.job))
+            self.assertEqual(operation.directives['np'], 2)
+            self.assertEqual(operation.get_id(),
+                             JobOperation(operation.name, operation.job, '').get_id())
+        self.assertEqual(evaluated, {'cmd': len(project), 'directives': len(project)})
+
+        # The command and directives can be assigned.
+        operation = operations[0]
+        operation.cmd = 'true'
+        operation.directives = dict(operation.directives, np=4)
+        self.assertEqual(operation.cmd, 'true')
+        self.assertEqual(operation.directives['np'], 4)
+        self.assertEqual(evaluated, {'cmd': len(project), 'directives': len(project)})
+
+    def test_batch_condition_invalid_result(self):
+
+        class A(FlowProject):
+            pass
+
+        @A.operation
+        @A.post.batch(lambda jobs: [])
+        def op1(job):
+            pass
+
+        project = self.mock_project(project_class=A)
+        with self.assertRaises(UserConditionError):
+            project.run()
+
     def test_condition_using_functools(self):
         """Tests that error isn't raised when a tag cannot be autogenerated for a condition."""
         def cond(job, extra_arg):
@@ -562,6 +1123,350 @@ class ProjectTest(BaseProjectTest):
                 self.assertEqual(op_status['completed'], project.operations[op.name].complete(job))
                 self.assertEqual(op_status['scheduler_status'], JobStatus.unknown)
 
+    def test_status_parallelization(self):
+        project = self.mock_project()
+
+        def fetch_status():
+            return project._fetch_status(project, StringIO(), ignore_errors=False,
+                                         no_parallelize=False)
+
+        def next_operations():
+            return [(op.name, op.job) for op in project.next_operations(*project)]
+
+        expected_status, expected_operations = fetch_status(), next_operations()
+        for status_parallelization in ('process', 'none', 'thread'):
+            project._status_parallelization = status_parallelization
+            self.assertEqual(fetch_status(), expected_status)
+            self.assertEqual(next_operations(), expected_operations)
+
+        # The project remains serializable after the status was rendered.
+        with redirect_stderr(StringIO()):
+            project.print_status(file=StringIO(), err=StringIO())
+        loads, s_project = project._serialize_project()
+        self.assertEqual(len(loads(s_project)), len(project))
+
+    def test_status_parallelization_persistent_caches(self):
+        project = self.mock_project()
+        project._use_completion_ledger = True
+        completed = {job.id for job in project if job.sp.b == 0}
+        for job_id in completed:
+            job = project.open_job(id=job_id)
+            job.doc.test = True
+            with open(job.fn('world.txt'), 'w'):
+                pass
+        loads, s_project = project._serialize_project()
+        job_ids = [job._id for job in project]
+        # The persistent caches are opened once per worker and flushed after each chunk.
+        init = flow.project._CompletionLedger.__init__
+        try:
+            with unittest.mock.patch.object(
+                    flow.project._CompletionLedger, '__init__', autospec=True,
+                    side_effect=init) as ledger_init:
+                flow.project._init_serialized_project(
+                    loads, s_project, (flow.project.IgnoreConditions.NONE, ))
+                for i in range(0, len(job_ids), 5):
+                    flow.project._evaluate_serialized_jobs(
+                        '_eligible_operation_names', job_ids[i:i + 5])
+            self.assertEqual(ledger_init.call_count, 1)
+            with project._open_persistent_caches():
+                self.assertEqual(
+                    {job.id for job in project if project._is_recorded_complete(job)}, completed)
+        finally:
+            if flow.project._SERIALIZED_CACHES is not None:
+                flow.project._SERIALIZED_CACHES.__exit__(None, None, None)
+            flow.project._init_serialized_project(loads, None)
+
+    def test_status_timings(self):
+        project = self.mock_project()
+        with project.collect_timings() as timings:
+            project._fetch_status(project, StringIO(), ignore_errors=False,
+                                  no_parallelize=True)
+            for op in project.next_operations(*project):
+                op.cmd
+        report = {(entry['category'], entry['name']): entry for entry in timings.report()}
+        # Cached condition results are not timed.
+        self.assertGreaterEqual(report[('condition', 'isfile_world.txt')]['count'],
+                                len([job for job in project if job.sp.b % 2 == 0]))
+        self.assertEqual(report[('label', 'default_label')]['count'], len(project))
+        # The b_is_even label is evaluated as pre-condition of op1.
+        self.assertNotIn(('label', 'b_is_even'), report)
+        self.assertEqual(report[('command', 'op1')]['count'],
+                         len([job for job in project if job.sp.b % 2 == 0]))
+        for entry in report.values():
+            self.assertLessEqual(entry['p50'], entry['p90'])
+            self.assertLessEqual(entry['p99'], entry['max'])
+        self.assertIsNone(project._timings)
+
+        out = StringIO()
+        with redirect_stderr(StringIO()):
+            project.print_status(file=out, err=StringIO(), dump_json=True, timings='json')
+            project.print_status(file=out, err=StringIO(), timings='table')
+        self.assertIn('isfile_world.txt', out.getvalue())
+
+    def test_incremental_status(self):
+        project = self.mock_project()
+
+        def fetch_status():
+            with project.collect_timings() as timings:
+                status = project._fetch_status(project, StringIO(), ignore_errors=False,
+                                               no_parallelize=True, incremental=True)
+            # The b_is_even label is evaluated as pre-condition of op1.
+            evaluations = sum(entry['count'] for entry in timings.report()
+                              if entry['name'].startswith('b_is_even'))
+            return status, evaluations
+
+        expected = project._fetch_status(project, StringIO(), ignore_errors=False,
+                                         no_parallelize=True)
+        self.assertEqual(fetch_status(), (expected, len(project)))
+        self.assertEqual(fetch_status(), (expected, 0))
+
+        job = [job for job in project if job.sp.b % 2 == 0][0]
+        with open(job.fn('world.txt'), 'w'):
+            pass
+        status, num_evaluations = fetch_status()
+        self.assertEqual(num_evaluations, 1)
+        for job_status in status:
+            self.assertEqual(job_status['operations']['op1']['completed'],
+                             job_status['job_id'] == job.id)
+
+        job.remove()
+        status, num_evaluations = fetch_status()
+        self.assertEqual(len(status), len(project))
+        self.assertEqual(num_evaluations, 0)
+
+    def test_status_snapshot_key(self):
+
+        class A(FlowProject):
+            pass
+
+        @A.label
+        def above(job):
+            return _above_threshold(job)
+
+        @A.operation
+        @A.pre(lambda job: job.sp.b > 0)
+        def op1(job):
+            pass
+
+        project = self.mock_project(project_class=A)
+        key = project._status_snapshot_key()
+        self.assertIsNotNone(key)
+        with unittest.mock.patch.object(sys.modules[__name__], '_THRESHOLD', 2):
+            self.assertNotEqual(project._status_snapshot_key(), key)
+        with unittest.mock.patch.object(sys.modules[__name__], '_THRESHOLD', [1]):
+            self.assertIsNone(project._status_snapshot_key())
+        self.assertEqual(project._status_snapshot_key(), key)
+
+    def test_project_status_stream(self):
+        project = self.mock_project()
+        project._STATUS_STREAM_CHUNK_SIZE = 5
+        for kwargs in ({}, {'parameters': True, 'param_max_width': 3}, {'compact': True},
+                       {'unroll': False}, {'only_incomplete': True}):
+            out = StringIO()
+            with redirect_stderr(StringIO()):
+                project.print_status(file=out, err=StringIO(), detailed=True, stream=True,
+                                     **kwargs)
+            output = out.getvalue()
+            for job in project:
+                self.assertLess(output.index(job.id), output.index('Overview'))
+            self.assertIn('Total # of jobs: {}'.format(len(project)), output)
+        with self.assertRaises(ValueError):
+            project.print_status(file=StringIO(), stream=True, dump_json=True)
+
+    def test_project_status_stream_chunks(self):
+        project = self.mock_project()
+        project._STATUS_STREAM_CHUNK_SIZE = 5
+        project._use_completion_ledger = True
+        init = flow.project._CompletionLedger.__init__
+        # The complete status store is never read and the ledger is opened once.
+        with unittest.mock.patch.object(
+                flow.project._OperationStatusStore, 'as_dict',
+                side_effect=AssertionError('The complete store was read.')), \
+                unittest.mock.patch.object(
+                    flow.project._CompletionLedger, '__init__', autospec=True,
+                    side_effect=init) as ledger_init:
+            statuses = list(project._fetch_status_stream(
+                project, StringIO(), ignore_errors=False, no_parallelize=True,
+                parameters=['b']))
+        self.assertEqual(ledger_init.call_count, 1)
+        self.assertEqual(len(statuses), len(project))
+        for status in statuses:
+            job = project.open_job(id=status['job_id'])
+            self.assertEqual(status['parameters'], {'b': job.sp.b})
+            for name, op_status in status['operations'].items():
+                self.assertEqual(op_status['scheduler_status'],
+                                 project.get_job_status(job)['operations'][name][
+                                     'scheduler_status'])
+
+    def test_project_status_overview_only(self):
+
+        class A(FlowProject):
+            pass
+
+        calls = Counter()
+
+        def never_complete(job):
+            calls['post'] += 1
+            return False
+
+        @A.operation
+        @A.pre(lambda job: job.sp.b % 2 == 0)
+        @A.post(never_complete)
+        def op1(job):
+            pass
+
+        project = self.mock_project(project_class=A)
+        query_scheduler = project._query_scheduler
+
+        def _query_scheduler(*args, **kwargs):
+            calls['scheduler'] += 1
+            return query_scheduler(*args, **kwargs)
+
+        project._query_scheduler = _query_scheduler
+        num_eligible = len([job for job in project if job.sp.b % 2 == 0])
+        out = StringIO()
+        with redirect_stderr(StringIO()):
+            project.print_status(file=out, err=StringIO())
+        self.assertEqual(calls, {'post': num_eligible})
+        self.assertRegex(out.getvalue(), r'op1\s+{}'.format(num_eligible))
+
+        calls.clear()
+        with redirect_stderr(StringIO()):
+            project.print_status(file=StringIO(), err=StringIO(), detailed=True)
+        self.assertEqual(calls, {'post': len(project), 'scheduler': 1})
+
+    def test_project_sample_status(self):
+
+        class A(FlowProject):
+            pass
+
+        @A.label
+        def b_is_zero(job):
+            return job.sp.b == 0
+
+        @A.operation
+        @A.pre(lambda job: job.sp.b != 1)
+        def op1(job):
+            pass
+
+        project = self.mock_project(project_class=A)
+        with redirect_stderr(StringIO()):
+            estimate = project.sample_status(6, seed=0, err=StringIO())
+        self.assertEqual(estimate['num_jobs'], len(project))
+        self.assertEqual(estimate['sample_size'], 6)
+        eligible = estimate['eligible']['op1']
+        self.assertEqual(eligible['proportion'], eligible['count'] / 6)
+        self.assertLessEqual(eligible['interval'][0], eligible['proportion'])
+        self.assertGreaterEqual(eligible['interval'][1], eligible['proportion'])
+        self.assertGreater(eligible['interval'][1] - eligible['interval'][0], 0)
+
+        # A stratified sample contains jobs of all strata in proportion.
+        with redirect_stderr(StringIO()):
+            estimate = project.sample_status(6, stratify='b', seed=0, err=StringIO())
+        self.assertEqual(estimate['labels']['b_is_zero']['count'], 2)
+        self.assertEqual(estimate['eligible']['op1']['count'], 4)
+
+        # Small strata are not forced into the sample, but widen the intervals.
+        jobs = [job for job in project if job.sp.b == 0] + \
+            [job for job in project if job.sp.b == 1][:1]
+        with redirect_stderr(StringIO()):
+            estimate = project.sample_status(3, jobs=jobs, stratify='b', seed=0, err=StringIO())
+        self.assertEqual(estimate['sample_size'], 3)
+        zero = estimate['labels']['b_is_zero']
+        self.assertEqual(zero['count'], 3)
+        self.assertEqual(zero['proportion'], 1.0)
+        self.assertLess(zero['interval'][0], 6 / 7)
+        self.assertEqual(zero['interval'][1], 1.0)
+        with self.assertRaises(ValueError):
+            project.sample_status(2, stratify='b', err=StringIO())
+        with redirect_stderr(StringIO()):
+            estimate = project.sample_status(100, stratify='b', err=StringIO())
+        self.assertEqual(estimate['labels']['b_is_zero']['interval'], (1 / 3, 1 / 3))
+
+        # The intervals vanish if all jobs are sampled.
+        with redirect_stderr(StringIO()):
+            estimate = project.sample_status(100, err=StringIO())
+        self.assertEqual(estimate['sample_size'], len(project))
+        self.assertEqual(estimate['labels']['b_is_zero']['interval'], (1 / 3, 1 / 3))
+
+        self.assertAlmostEqual(_z_score(0.95), 1.959964, places=5)
+        low, high = _wilson_interval(5, 10, _z_score(0.95))
+        self.assertAlmostEqual(low, 0.236593, places=5)
+        self.assertAlmostEqual(high, 0.763407, places=5)
+
+    def test_project_watch_status(self):
+
+        class A(FlowProject):
+            pass
+
+        def never_complete(job):
+            never_complete.calls += 1
+            return False
+
+        never_complete.calls = 0
+
+        @A.operation
+        @A.post(never_complete)
+        def op1(job):
+            pass
+
+        project = self.mock_project(project_class=A)
+        out = StringIO()
+        err = StringIO()
+        with redirect_stderr(StringIO()):
+            project.watch_status(interval=0, iterations=3, file=out, err=err, detailed=True)
+        self.assertEqual(out.getvalue().count('Overview'), 3)
+        # Unmodified jobs are not evaluated and the scheduler is not queried again.
+        self.assertEqual(never_complete.calls, len(project))
+        self.assertEqual(err.getvalue().count('Query scheduler'), 1)
+
+        never_complete.calls = 0
+        job = next(iter(project))
+        job.doc.modified = True
+        # The status snapshot is read once for all refreshes.
+        init = flow.project._StatusSnapshot.__init__
+        with unittest.mock.patch.object(
+                flow.project._StatusSnapshot, '__init__', autospec=True,
+                side_effect=init) as snapshot_init:
+            with redirect_stderr(StringIO()):
+                project.watch_status(interval=0, iterations=2, file=StringIO(), detailed=True)
+        self.assertEqual(snapshot_init.call_count, 1)
+        self.assertEqual(never_complete.calls, 1)
+        self.assertIsNone(project._scheduler_poll_interval)
+        self.assertIsNone(project._status_snapshot)
+
+    def test_project_status_dump_format(self):
+        project = self.mock_project()
+        out = StringIO()
+        with redirect_stderr(StringIO()):
+            project.print_status(file=out, err=StringIO(), dump_json=True)
+        expected = json.loads(out.getvalue())
+
+        out = StringIO()
+        with redirect_stderr(StringIO()):
+            project.print_status(file=out, err=StringIO(), dump_format='jsonl')
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(records), len(project))
+        self.assertEqual({record['job_id']: record for record in records}, expected)
+
+        out = StringIO()
+        with redirect_stderr(StringIO()):
+            project.dump_status(file=out, err=StringIO(), dump_format='csv')
+        rows = list(csv.DictReader(StringIO(out.getvalue())))
+        self.assertEqual(len(rows), len(project))
+        for row in rows:
+            status = expected[row['job_id']]
+            self.assertEqual(row['labels'].split(';'), status['labels'])
+            for name, op in status['operations'].items():
+                self.assertEqual(row[name + '.eligible'], str(int(op['eligible'])))
+                self.assertEqual(row[name + '.completed'], str(int(op['completed'])))
+                self.assertEqual(row[name + '.scheduler_status'], str(op['scheduler_status']))
+
+        with self.assertRaises(ValueError):
+            project.dump_status(file=StringIO(), dump_format='xml')
+        with self.assertRaises(ValueError):
+            project.print_status(file=StringIO(), dump_format='jsonl', dump_json=True)
+
     def test_project_status_homogeneous_schema(self):
         project = self.mock_project()
         for parameters in (None, True, ['a'], ['b'], ['a', 'b']):
@@ -576,6 +1481,20 @@ class ProjectTest(BaseProjectTest):
                 with redirect_stderr(StringIO()):
                     project.print_status(parameters=parameters, detailed=True)
 
+    def test_project_status_varying_parameters(self):
+        project = self.mock_project()
+        for job in project:
+            job.sp.c = {'x': job.sp.b, 'y': 0}
+        out = StringIO()
+        with redirect_stderr(StringIO()):
+            project.print_status(file=out, err=StringIO(), detailed=True, parameters=True)
+        header = next(line for line in out.getvalue().splitlines() if line.startswith('job_id'))
+        self.assertEqual(header.split()[2:6], ['a', 'a.a', 'b', 'c.x'])
+        self.assertNotIn('c.y', header)
+        self.assertEqual(_varying_parameters([{'a': 0}, {'a': 0, 'b': None}]), [])
+        self.assertEqual(_varying_parameters([{'a': 0}, {'a': 0, 'b': 1}]), ['b'])
+        self.assertEqual(_varying_parameters([{'a': {'b': 0}}, {'a': 0}]), ['a', 'a.b'])
+
     def test_script(self):
         project = self.mock_project()
         for job in project:
@@ -744,6 +1663,255 @@ class ExecutionProjectTest(BaseProjectTest):
             else:
                 self.assertFalse(job.isfile('world.txt'))
 
+    def test_run_evaluates_touched_jobs(self):
+
+        class A(FlowProject):
+            pass
+
+        calls = Counter()
+
+        def never(job):
+            calls[job._id] += 1
+            return False
+
+        @A.operation
+        @A.pre(lambda job: job.sp.b == 0)
+        @A.post.true('first')
+        def first(job):
+            job.doc.first = True
+
+        @A.operation
+        @A.pre.after(first)
+        @A.post.true('second')
+        def second(job):
+            job.doc.second = True
+
+        @A.operation
+        @A.pre(never)
+        def unreachable(job):
+            pass
+
+        @A.operation
+        @A.pre(lambda job: job.sp.b == 1)
+        def repeated(job):
+            pass
+
+        project = self.mock_project(project_class=A)
+        for rescan in (False, True):
+            for job in project:
+                job.doc.clear()
+            calls.clear()
+            with suspend_logging():
+                project.run(rescan=rescan)
+            self.assertTrue(all(bool(job.doc.get('second')) == (job.sp.b == 0) for job in project))
+            # Three passes, the third pass does not execute any operations. Jobs with
+            # operations skipped in the second pass are evaluated again in the third pass.
+            for job in project:
+                touched = job.sp.b in (0, 1) or rescan
+                self.assertEqual(calls[job._id], 3 if touched else 1)
+
+    def test_run_parallel_continuous(self):
+        project = self.mock_project()
+
+        def num_executed():
+            return sum(job.isfile('world.txt') + ('test' in job.doc) + ('dynamic' in job.doc)
+                       for job in project)
+
+        with add_cwd_to_environment_pythonpath():
+            with switch_to_directory(project.root_directory()):
+                with redirect_stderr(StringIO()):
+                    project.run(np=2, num=3, continuous=True)
+                    self.assertEqual(num_executed(), 3)
+                    project.run(np=2, continuous=True, order='cyclic')
+        even_jobs = [job for job in project if job.sp.b % 2 == 0]
+        for job in project:
+            self.assertEqual(job.isfile('world.txt'), job in even_jobs)
+            self.assertTrue(job.doc.get('test'))
+
+        # The persistent caches are opened once for the whole run.
+        project._use_condition_cache = project._use_completion_ledger = True
+        for job in project:
+            job.doc.clear()
+            if job.isfile('world.txt'):
+                os.remove(job.fn('world.txt'))
+        opened = Counter()
+        for cls in (flow.project._PersistentConditionCache, flow.project._CompletionLedger):
+            def _init(self, *args, cls=cls, init=cls.__init__):
+                opened[cls.__name__] += 1
+                init(self, *args)
+            patch = unittest.mock.patch.object(cls, '__init__', _init)
+            patch.start()
+            self.addCleanup(patch.stop)
+        with add_cwd_to_environment_pythonpath():
+            with switch_to_directory(project.root_directory()):
+                with redirect_stderr(StringIO()):
+                    project.run(np=2, continuous=True)
+        self.assertEqual(opened, {'_PersistentConditionCache': 1, '_CompletionLedger': 1})
+        for job in project:
+            self.assertEqual(job.isfile('world.txt'), job in even_jobs)
+            self.assertTrue(job.doc.get('test'))
+
+    def test_run_parallel_local_resources(self):
+        project = self.mock_project()
+        job = next(iter(project))
+        resources = _LocalResources(4, memory=8)
+        threaded = JobOperation('threaded', job, 'true', {'omp_num_threads': 4, 'memory': 2})
+        serial = JobOperation('serial', job, 'true', {'memory': 6})
+        oversized = JobOperation('oversized', job, 'true', {'nranks': 8, 'memory': 16})
+
+        # The threaded operation occupies all processors.
+        allocation = resources.acquire(threaded)
+        self.assertEqual(allocation[:2], (4, 2))
+        self.assertEqual(resources.task_args(threaded, allocation)[1], 4)
+        self.assertFalse(resources.available())
+        self.assertIsNone(resources.acquire(serial))
+        resources.release(allocation)
+
+        # The memory of the serial operations exceeds the budget.
+        allocation = resources.acquire(serial)
+        self.assertIsNone(resources.task_args(serial, allocation)[1])
+        self.assertIsNone(resources.acquire(serial))
+        resources.release(allocation)
+
+        # Requirements that exceed the resources are reduced to them.
+        allocation = resources.acquire(oversized)
+        self.assertEqual(allocation[:2], (4, 8))
+        self.assertIsNone(resources.task_args(oversized, allocation)[1])
+        if allocation[2] is not None:
+            self.assertEqual(len(allocation[2]), 4)
+        resources.release(allocation)
+
+        # Fractional requirements are accounted for exactly.
+        fractional = [
+            JobOperation('fractional', job, 'true',
+                         {'processor_fraction': fraction, 'memory': fraction})
+            for fraction in (0.1, 0.2, 0.3, 0.7, 1 / 3)]
+        allocations = [resources.acquire(op) for op in fractional * 2]
+        self.assertNotIn(None, allocations)
+        for allocation in allocations[::2] + allocations[1::2]:
+            resources.release(allocation)
+        self.assertIsNotNone(resources.acquire(oversized))
+
+        # The first operation is always admitted.
+        resources = _LocalResources(4, memory=8)
+        resources._free_processors -= 1
+        self.assertIsNotNone(resources.acquire(threaded))
+
+        with add_cwd_to_environment_pythonpath():
+            with switch_to_directory(project.root_directory()):
+                with redirect_stderr(StringIO()):
+                    project.run(np=2, memory=1)
+        even_jobs = [job for job in project if job.sp.b % 2 == 0]
+        self.assertTrue(all(job.isfile('world.txt') for job in even_jobs))
+        self.assertTrue(all(job.doc.get('test') for job in project))
+
+    def test_subprocess_executor(self):
+        results = Queue()
+        executor = _SubprocessExecutor()
+        stdout = StringIO()
+        start = time.time()
+        with redirect_stdout(stdout):
+            try:
+                for i, command in enumerate(
+                        ['echo hello', 'exit 3', 'sleep 10'] + ['sleep 0.5'] * 8):
+                    executor.submit(command, None, None, 1, lambda _, i=i: results.put((i, None)),
+                                    lambda error, i=i: results.put((i, error)))
+                errors = dict(results.get(timeout=10) for _ in range(11))
+            finally:
+                executor.close()
+        # The commands are executed concurrently.
+        self.assertLess(time.time() - start, 4)
+        self.assertEqual(stdout.getvalue(), 'hello\n')
+        self.assertIsNone(errors[0])
+        self.assertIsInstance(errors[1], subprocess.CalledProcessError)
+        self.assertIsInstance(errors[2], subprocess.TimeoutExpired)
+        self.assertTrue(all(errors[i] is None for i in range(3, 11)))
+
+    def test_subprocess_executor_long_output(self):
+        # Progress updates without a newline are forwarded unchanged and do not block.
+        command = '{} -c "import sys; sys.stdout.write(\'x\\r\' * 200000); ' \
+            'sys.stderr.write(\'y\\r\' * 200000)"'.format(sys.executable)
+        results = Queue()
+        executor = _SubprocessExecutor()
+        stdout = StringIO()
+        stderr = StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                executor.submit(command, None, None, 30, results.put, results.put)
+                result = results.get(timeout=30)
+            finally:
+                executor.close()
+        self.assertIsNone(result)
+        self.assertEqual(stdout.getvalue(), 'x\r' * 200000)
+        self.assertEqual(stderr.getvalue(), 'y\r' * 200000)
+
+    def test_subprocess_executor_lines(self):
+        # The output of concurrent commands is not interleaved within lines.
+        results = Queue()
+        executor = _SubprocessExecutor()
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            try:
+                for c in 'ab':
+                    executor.submit("printf {0}{0}; sleep 0.5; printf '{0}{0}\\n'".format(c),
+                                    None, None, 10, results.put, results.put)
+                self.assertEqual([results.get(timeout=10) for _ in range(2)], [None, None])
+            finally:
+                executor.close()
+        self.assertEqual(sorted(stdout.getvalue().splitlines()), ['aaaa', 'bbbb'])
+
+    def test_run_parallel_reuses_pool(self):
+        project = self.mock_project()
+        serialize_project = project._serialize_project
+        calls = Counter()
+
+        def _serialize_project(*args):
+            calls['serialize'] += 1
+            return serialize_project(*args)
+
+        project._serialize_project = _serialize_project
+        operations = list(project._get_pending_operations(project))
+        with add_cwd_to_environment_pythonpath():
+            with switch_to_directory(project.root_directory()):
+                with redirect_stderr(StringIO()):
+                    # The project is serialized once for all passes within the context.
+                    with project._reuse_operation_pools():
+                        project.run_operations(operations[::2], np=2)
+                        project.run_operations(operations[1::2], np=2)
+                        self.assertEqual(len(project._operation_pools), 1)
+                    self.assertEqual(calls['serialize'], 1)
+                    self.assertIsNone(project._operation_pools)
+        even_jobs = [job for job in project if job.sp.b % 2 == 0]
+        self.assertTrue(all(job.isfile('world.txt') for job in even_jobs))
+        self.assertTrue(all(job.doc.get('test') for job in project))
+
+    def test_run_parallel_cloudpickle_fallback(self):
+        project = self.mock_project()
+        serialize_project = project._serialize_project
+        calls = Counter()
+
+        def _serialize_project(use_cloudpickle=False):
+            calls[use_cloudpickle] += 1
+            loads, s_project = serialize_project(use_cloudpickle)
+            # The workers fail to deserialize the project pickled with the pickle module.
+            return (loads if use_cloudpickle else _fail_to_deserialize), s_project
+
+        project._serialize_project = _serialize_project
+        operations = list(project._get_pending_operations(project))
+        with add_cwd_to_environment_pythonpath():
+            with switch_to_directory(project.root_directory()):
+                with redirect_stderr(StringIO()):
+                    with project._reuse_operation_pools():
+                        project.run_operations(operations, np=2)
+                        self.assertEqual(len(project._operation_pools), 1)
+                        # Pools of failed executions are not reused.
+                        with self.assertRaises(RuntimeError):
+                            with project._operation_pool(2):
+                                raise RuntimeError()
+                        self.assertEqual(project._operation_pools, {})
+        self.assertEqual(calls, {False: 1, True: 1})
+        self.assertTrue(all(job.doc.get('test') for job in project))
+
     def test_run_condition_inheritance(self):
 
         # This assignment is necessary to use the `mock_project` function on
@@ -942,6 +2110,51 @@ class ExecutionProjectTest(BaseProjectTest):
                     job_status['operations'][op]['scheduler_status'],
                     (JobStatus.unknown, JobStatus.inactive))
 
+    def test_operation_status_store(self):
+        project = self.mock_project()
+        ops = [project.next_operation(job) for job in project]
+        ops = [op for op in ops if op is not None]
+        project.document['_status'] = {ops[0].get_id(): int(JobStatus.queued)}
+        project = project.get_project(root=project.root_directory())
+        self.assertEqual(ops[0].get_status(), JobStatus.queued)
+        self.assertNotIn('_status', project.document)
+        self.assertEqual(ops[1].get_status(), JobStatus.unknown)
+        ops[1].set_status(JobStatus.active)
+        project = project.get_project(root=project.root_directory())
+        self.assertEqual(project._get_operation_status_store().as_dict(), {
+            ops[0].get_id(): JobStatus.queued, ops[1].get_id(): JobStatus.active})
+
+    def test_status_scheduler_query_in_background(self):
+        MockScheduler.reset()
+        project = self.mock_project()
+        with redirect_stderr(StringIO()):
+            project.submit()
+        MockScheduler.step()
+        MockScheduler.step()
+        submitted = [project.next_operation(job) for job in project]
+
+        evaluating = threading.Event()
+        get_job_status = project.get_job_status
+
+        def _get_job_status(*args, **kwargs):
+            evaluating.set()
+            return get_job_status(*args, **kwargs)
+
+        jobs = MockScheduler.jobs
+
+        def _jobs(*args):
+            # The scheduler query only completes once the status is being evaluated.
+            self.assertTrue(evaluating.wait(timeout=10))
+            return jobs()
+
+        project.get_job_status = _get_job_status
+        with unittest.mock.patch.object(MockScheduler, 'jobs', _jobs):
+            statuses = project._fetch_status(project, StringIO(), False, True)
+        for op, status in zip(submitted, statuses):
+            self.assertEqual(status['job_id'], op.job.get_id())
+            self.assertEqual(status['operations'][op.name]['scheduler_status'], JobStatus.queued)
+            self.assertEqual(op.get_status(), JobStatus.queued)
+
     def test_submit_operations_bad_directive(self):
         MockScheduler.reset()
         project = self.mock_project()